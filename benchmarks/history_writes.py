@@ -0,0 +1,79 @@
+# history_writes.py
+"""
+Benchmark: archiving finished games.
+
+Records a burst of finished games through GameHistory and reports how long
+record() holds the caller (the event loop) and how quickly the writer thread
+commits them, against inserting each game in its own transaction inline.
+
+Usage: python -m benchmarks.history_writes [--games 2000] [--players 6]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from coup.engine import GameResult, new_game, legal_actions, apply, GAME_OVER
+from coup.db import DatabaseWriter, GameHistory
+
+
+def finished_game(players: int, seed: int) -> GameResult:
+    rng = random.Random(seed)
+    ids = list(range(1, players + 1))
+    state = new_game(ids, rng)
+    result = GameResult(state, {i: f"player{i}" for i in ids}, seed, started=0.0)
+    while state.phase != GAME_OVER:
+        events = []
+        before = state
+        state = apply(state, rng.choice(legal_actions(state)), rng, events)
+        result.record(events, before)
+    result.finish(state, ended=1.0)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=2000)
+    parser.add_argument("--players", type=int, default=6)
+    args = parser.parse_args()
+
+    results = [finished_game(args.players, seed) for seed in range(args.games)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Inline: one transaction per game on the caller's thread
+        writer = DatabaseWriter(os.path.join(tmp, "inline.db"))
+        history = GameHistory(writer)
+        writer.start()
+        start = time.perf_counter()
+        for result in results:
+            writer.read(lambda conn: (history._insert(conn, result), conn.commit()))
+        inline = time.perf_counter() - start
+        writer.stop()
+
+        # Write-behind: record() only queues; the writer thread batches
+        writer = DatabaseWriter(os.path.join(tmp, "batched.db"))
+        history = GameHistory(writer)
+        writer.start()
+        start = time.perf_counter()
+        worst = 0.0
+        for result in results:
+            began = time.perf_counter()
+            history.record(result)
+            worst = max(worst, time.perf_counter() - began)
+        queued = time.perf_counter() - start
+        writer.flush(timeout=60)
+        batched = time.perf_counter() - start
+        stats = writer.stats()
+        writer.stop()
+
+    print(f"{args.games} games of {args.players} players")
+    print(f"inline:  {inline:.3f}s total, caller blocked {inline / args.games * 1e6:.0f} us/game, "
+          f"{args.games / inline:,.0f} games/s")
+    print(f"batched: {batched:.3f}s total, caller blocked {queued / args.games * 1e6:.1f} us/game "
+          f"(worst {worst * 1e6:.0f} us), {args.games / batched:,.0f} games/s")
+    print(f"writer:  {stats['batches']} transactions, avg commit latency {stats['avg_latency_ms']:.1f} ms, "
+          f"dropped {stats['dropped']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# interaction_validation.py
+"""
+Benchmark: validating a button press.
+
+Times the checks a Block/Challenge/Check Hand press makes before touching the
+game, using the previous linear scans (player list walk, fresh id lists,
+legal move generation per press) against Game's lookup indexes.
+
+Usage: python -m benchmarks.interaction_validation [--players 6] [--seconds 1]
+"""
+import argparse
+import asyncio
+import random
+from coup.engine import Move, legal_actions, apply, CHALLENGE, BLOCK, RESPONSE, GAME_OVER
+from coup.controllers.game import Game
+from .state_clone import rate
+
+
+async def build_game(players: int) -> Game:
+    """A game sitting in a response window, where every player may press a button."""
+    game = Game({i + 1: f"player{i + 1}" for i in range(players)})
+    rng = random.Random(1)
+    while game.state.phase != RESPONSE:
+        if game.state.phase == GAME_OVER:
+            return await build_game(players)
+        game.state = apply(game.state, rng.choice(legal_actions(game.state)), rng)
+    game.sync_models()
+    return game
+
+
+def scan_player(game: Game, id: int):
+    for player in game.players:
+        if player.id == id:
+            return player
+    return None
+
+
+def validate_scan(game: Game, id: int):
+    """The checks as they were: linear scans and legal move generation per press."""
+    seat = next((s for s, p in enumerate(game.seats) if p.id == id), None)
+    moves = [m for m in legal_actions(game.state) if m.seat == seat and seat is not None]
+    can_challenge = Move(CHALLENGE, seat) in moves
+    roles = [m.card for m in moves if m.kind == BLOCK]
+    in_game = id in game.get_player_ids()
+    return can_challenge, roles, in_game and scan_player(game, id)
+
+
+def validate_indexed(game: Game, id: int):
+    """The checks through Game's indexes."""
+    can_challenge = game.can_move(Move(CHALLENGE, game.seat_of(id)))
+    roles = [m.card for m in game.moves_for(id) if m.kind == BLOCK]
+    return can_challenge, roles, game.is_alive(id) and game.get_player_by_id(id)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=6)
+    parser.add_argument("--seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    game = asyncio.run(build_game(args.players))
+    ids = [p.id for p in game.seats] + [10 ** 9] # Every player plus a spectator
+    for id in ids:
+        assert validate_scan(game, id) == validate_indexed(game, id)
+
+    presses = iter(ids * 10 ** 7)
+    scan = rate(lambda: validate_scan(game, next(presses)), args.seconds)
+    indexed = rate(lambda: validate_indexed(game, next(presses)), args.seconds)
+
+    print(f"{args.players} players, {game.state.action.name} awaiting responses")
+    print(f"{'validation':<12} {'presses/s':>12} {'us/press':>9}")
+    for name, ops in (("linear", scan), ("indexed", indexed)):
+        print(f"{name:<12} {ops:>12,.0f} {1e6 / ops:>9.2f}")
+    print(f"speedup: {indexed / scan:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
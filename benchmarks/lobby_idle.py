@@ -0,0 +1,98 @@
+# lobby_idle.py
+"""
+Benchmark: event loop wakeups and CPU time for N idle lobbies.
+
+Opens N lobbies that nobody joins and measures, over a fixed window, how many
+times the event loop wakes up and how much CPU the process burns. Compares the
+event-driven Lobby.run against the old 100 ms polling loop.
+
+Usage: python -m benchmarks.lobby_idle [--window SECONDS] [--sizes 10 100 500]
+"""
+import argparse
+import asyncio
+import time
+from coup.controllers.lobby import Lobby, CANCEL
+
+
+class FakeUser:
+    def __init__(self, uid: int):
+        self.id = uid
+        self.display_name = f"user{uid}"
+
+
+class FakeMessage:
+    async def delete(self):
+        pass
+
+    async def edit(self, **kwargs):
+        return self
+
+
+class FakeContext:
+    """Stand-in for commands.Context; only what Lobby touches."""
+    def __init__(self, uid: int):
+        self.author = FakeUser(uid)
+
+    async def send(self, **kwargs):
+        return FakeMessage()
+
+
+def count_wakeups(loop):
+    """Wrap loop._run_once so every event loop iteration is counted."""
+    counter = {"wakeups": 0}
+    run_once = loop._run_once
+
+    def counted():
+        counter["wakeups"] += 1
+        run_once()
+
+    loop._run_once = counted
+    return counter
+
+
+async def polling_lobby(lobby: Lobby):
+    """The pre-signal Lobby.run wait loop, kept here for comparison."""
+    while not lobby.is_closed():
+        await asyncio.sleep(0.1)
+
+
+async def measure(n: int, window: float, polling: bool):
+    loop = asyncio.get_running_loop()
+    lobbies = [Lobby(i, FakeContext(i)) for i in range(n)]
+    if polling:
+        tasks = [asyncio.create_task(polling_lobby(lobby)) for lobby in lobbies]
+    else:
+        tasks = [asyncio.create_task(lobby.run(FakeContext(lobby.host_id))) for lobby in lobbies]
+
+    # Let every lobby reach its idle wait before measuring
+    await asyncio.sleep(0.2)
+
+    counter = count_wakeups(loop)
+    cpu_start = time.process_time()
+    await asyncio.sleep(window)
+    cpu = time.process_time() - cpu_start
+    wakeups = counter["wakeups"]
+    del loop._run_once
+
+    for lobby in lobbies:
+        lobby.close(CANCEL)
+    await asyncio.gather(*tasks)
+    return wakeups / window, cpu / window * 100
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--window", type=float, default=2.0)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 500, 1000])
+    args = parser.parse_args()
+
+    print(f"{'lobbies':>8} {'mode':>8} {'wakeups/s':>10} {'cpu %':>7}")
+    for n in args.sizes:
+        for polling in (True, False):
+            wakeups, cpu = asyncio.run(measure(n, args.window, polling))
+            mode = "polling" if polling else "signals"
+            print(f"{n:>8} {mode:>8} {wakeups:>10.1f} {cpu:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# outbound.py
+"""
+Benchmark: how long players wait for a prompt behind log updates.
+
+Each simulated step queues a burst of log updates, deletes the previous
+prompt and sends the next one into a thread under Discord's per-channel rate
+limit (5 calls per 5 s, scaled down by --scale) with --latency seconds per
+REST call. Compares sending everything in order, as the game used to, with
+the OutboundScheduler, which keeps each prompt behind the log updates queued
+before it but ahead of the delete of the previous prompt.
+
+Usage: python -m benchmarks.outbound [--steps 40] [--logs 3] [--latency 0.005] [--scale 0.02]
+"""
+import argparse
+import asyncio
+import random
+import time
+from coup.controllers.outbound import OutboundScheduler, TokenBucket, PROMPT, LOG, RATE, PER
+
+
+class FakeMessage:
+    def __init__(self, channel):
+        self.channel = channel
+
+    async def delete(self):
+        await self.channel.call()
+
+
+class FakeThread:
+    def __init__(self, latency: float):
+        self.id = 1
+        self.latency = latency
+        self.calls = 0
+
+    async def call(self):
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+
+    async def send(self, **kwargs):
+        await self.call()
+        return FakeMessage(self)
+
+
+async def in_order(steps: int, logs: int, latency: float, scale: float, rng: random.Random) -> list[float]:
+    """Seconds from each step starting to its prompt arriving, every call awaited in the order it was made."""
+    thread, bucket, waits, prompt = FakeThread(latency), TokenBucket(RATE, PER * scale), [], None
+
+    async def call(make):
+        delay = bucket.delay()
+        if delay:
+            await asyncio.sleep(delay)
+            bucket.delay()
+        bucket.take()
+        return await make()
+
+    for _ in range(steps):
+        started = time.perf_counter()
+        for _ in range(rng.randint(1, logs)):
+            await call(lambda: thread.send(content="log"))
+        if prompt:
+            await call(prompt.delete)
+        prompt = await call(lambda: thread.send(content="prompt"))
+        waits.append(time.perf_counter() - started)
+    return waits
+
+
+async def scheduled(steps: int, logs: int, latency: float, scale: float, rng: random.Random) -> list[float]:
+    """The same through the OutboundScheduler: the delete of the previous prompt queues behind the next one."""
+    thread, outbound, waits, prompt = FakeThread(latency), OutboundScheduler(RATE, PER * scale), [], None
+    for _ in range(steps):
+        started = time.perf_counter()
+        for _ in range(rng.randint(1, logs)):
+            outbound.send(thread, LOG, content="log")
+        if prompt:
+            outbound.delete(prompt)
+        prompt = await outbound.send(thread, PROMPT, content="prompt")
+        waits.append(time.perf_counter() - started)
+    await outbound.join()
+    return waits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, default=40)
+    parser.add_argument("--logs", type=int, default=3, help="most log updates before each prompt")
+    parser.add_argument("--latency", type=float, default=0.005, help="seconds per REST call")
+    parser.add_argument("--scale", type=float, default=0.02, help="time scale of the 5 s rate limit window")
+    args = parser.parse_args()
+
+    print(f"{args.steps} steps, up to {args.logs} log updates each, rate limit {RATE}/{PER * args.scale:.2f}s")
+    print(f"{'delivery':<10} {'prompt wait avg (ms)':>21} {'max (ms)':>9}")
+    for name, run in (("in order", in_order), ("scheduled", scheduled)):
+        waits = asyncio.run(run(args.steps, args.logs, args.latency, args.scale, random.Random(0)))
+        print(f"{name:<10} {sum(waits) / len(waits) * 1000:>21.1f} {max(waits) * 1000:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# response_window.py
+"""
+Benchmark: how long response windows stay open.
+
+Replays the response windows of random games with simulated players: each
+eligible player reacts after a random delay (or never, like an idle human)
+and either passes or, with some probability, challenges/blocks. Compares
+the previous first-click-wins window, which only closed early on a click and
+otherwise always ran to its timeout, with ResponseWindow, which also closes
+as soon as everyone has passed or nobody left could outrank the leader.
+
+Usage: python -m benchmarks.response_window [--windows 5000] [--act 0.2] [--idle 0.1] [--delay 2.5]
+"""
+import argparse
+import random
+from coup.engine import new_game, legal_actions, apply, RESPONSE, BLOCK_RESPONSE, GAME_OVER
+from coup.controllers.response import ResponseWindow, RESPONSE_TIMEOUT
+
+
+def windows(count: int, rng: random.Random):
+    """States of count response windows from random 3-6 player games."""
+    while count:
+        state = new_game(list(range(rng.randint(3, 6))), rng)
+        while state.phase != GAME_OVER and count:
+            if state.phase in (RESPONSE, BLOCK_RESPONSE):
+                yield state
+                count -= 1
+            state = apply(state, rng.choice(legal_actions(state)), rng)
+
+
+def simulate(state, rng: random.Random, act: float, idle: float, delay: float) -> tuple[float, float]:
+    """Seconds the window stays open: (first click wins, buffered window)."""
+    window = ResponseWindow(0, state, legal_actions(state))
+    arrivals = []
+    for seat, moves in window.moves.items():
+        if rng.random() < idle:
+            continue # Never answers
+        move = rng.choice(moves) if rng.random() < act else None
+        arrivals.append((rng.expovariate(1 / delay), seat, move))
+    arrivals.sort(key=lambda arrival: arrival[0])
+
+    clicks = [at for at, _, move in arrivals if move is not None and at < RESPONSE_TIMEOUT]
+    first_click = clicks[0] if clicks else RESPONSE_TIMEOUT
+
+    buffered = RESPONSE_TIMEOUT
+    for at, seat, move in arrivals:
+        if at >= RESPONSE_TIMEOUT:
+            break
+        window.react(seat, move)
+        if window.is_decided():
+            buffered = at
+            break
+    return first_click, buffered
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--windows", type=int, default=5000)
+    parser.add_argument("--act", type=float, default=0.2, help="chance a responding player challenges/blocks")
+    parser.add_argument("--idle", type=float, default=0.1, help="chance a player never responds")
+    parser.add_argument("--delay", type=float, default=2.5, help="mean seconds before a player responds")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    first = buffered = 0.0
+    timeouts_first = timeouts_buffered = 0
+    for state in windows(args.windows, rng):
+        a, b = simulate(state, rng, args.act, args.idle, args.delay)
+        first += a
+        buffered += b
+        timeouts_first += a >= RESPONSE_TIMEOUT
+        timeouts_buffered += b >= RESPONSE_TIMEOUT
+
+    n = args.windows
+    print(f"{n} windows, {RESPONSE_TIMEOUT}s timeout, act={args.act} idle={args.idle} delay={args.delay}s")
+    print(f"{'window':<18} {'avg open (s)':>13} {'timed out':>10}")
+    print(f"{'first click wins':<18} {first / n:>13.2f} {timeouts_first / n:>10.1%}")
+    print(f"{'buffered':<18} {buffered / n:>13.2f} {timeouts_buffered / n:>10.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+# rest_calls.py
+"""
+Benchmark: Discord REST calls per turn.
+
+Plays games between simulated players against a fake thread that counts
+every message send, edit and delete. In response windows each player
+reacts after a random delay or, sometimes, not at all, so some windows run
+to their deadline. Compares the previous countdown, which edited the
+response message once a second for the whole window, and the previous log,
+which sent (and deleted the last prompt for) every log line on its own, and
+the log lines of each resolution sent as a message of their own, with the
+game as it is: a relative timestamp (<t:...:R>) in the response embed and
+the log lines held until the next message goes out, most often the next
+turn's header, with and without board mode. Log messages counts messages
+holding only log lines.
+
+Time is scaled down so a 10 second window takes --window seconds; the
+per-channel rate limit is scaled the same way.
+
+Usage: python -m benchmarks.rest_calls [--games 10] [--window 0.2] [--idle 0.2]
+"""
+import argparse
+import asyncio
+import random
+from collections import Counter
+from coup.controllers import turn
+from coup.controllers.game import Game
+from coup.controllers.board import Board
+from coup.controllers.turn import RESPONSE_WINDOW
+from coup.controllers.response import RESPONSE_TIMEOUT
+from coup.controllers.outbound import get_outbound, PER
+from coup.engine import ACT, GAME_OVER
+
+TICKS = 10 # The old countdown edited the message once per second of a 10 second window
+
+
+class CountingMessage:
+    def __init__(self, calls: Counter):
+        self.calls = calls
+
+    async def edit(self, **kwargs):
+        self.calls["edit"] += 1
+        return self
+
+    async def delete(self):
+        self.calls["delete"] += 1
+
+    async def pin(self):
+        self.calls["pin"] += 1
+
+
+class CountingThread:
+    def __init__(self):
+        self.calls = Counter()
+
+    async def send(self, content=None, **kwargs):
+        self.calls["send"] += 1
+        if kwargs.get("view") is None:
+            self.calls["log"] += 1 # Log updates; the rest are prompts and turn headers
+        return CountingMessage(self.calls)
+
+
+class PerSecondCountdown(Game):
+    """Game rendering the response countdown the way it used to: one edit per second."""
+    async def send_response_message(self):
+        await super().send_response_message()
+        asyncio.create_task(self.countdown(self.prev_msg, self.seq))
+
+    async def countdown(self, msg, version: int):
+        embed = None
+        for _ in range(TICKS):
+            if self.is_stale(version):
+                return
+            await msg.edit(embed=embed)
+            await asyncio.sleep(self.response_timeout / TICKS)
+
+
+class PerLineUpdates(Game):
+    """Game sending one message per log line, the way updates used to go out."""
+    RENDERERS = {**Game.RENDERERS, turn.UPDATE: "send_update_msg"}
+
+    def schedule(self, effects):
+        for effect in effects:
+            if effect.kind == turn.UPDATE:
+                self.outbox.post(self.perform, effect)
+            else:
+                super().schedule([effect])
+
+
+class ResolutionBatches(Game):
+    """Game sending the log lines of each resolution as their own message, ahead of the next turn's header."""
+    def schedule(self, effects):
+        for effect in effects:
+            if effect.kind == turn.END_TURN:
+                self.flush_log()
+            super().schedule([effect])
+
+
+class BoardGame(Game):
+    """Game in board mode: one status and one control message, edited in place."""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.board = Board()
+
+
+async def play(cls, window: float, idle: float, rng: random.Random) -> tuple[Counter, int]:
+    game = cls({1: "a", 2: "b", 3: "c", 4: "d"})
+    game.game_thread = CountingThread()
+    game.response_timeout = window
+    task = asyncio.create_task(game.play())
+    reacting = set()
+
+    async def react_later(version: int, seat: int):
+        await asyncio.sleep(rng.expovariate(1 / (0.25 * window))) # 2.5 s on average in a 10 s window
+        if game.window and game.window.version == version:
+            moves = game.window.moves.get(seat, [])
+            move = rng.choice(moves) if moves and rng.random() < 0.2 else None
+            game.mailbox.post(game.react_at, version, seat, move)
+
+    while not task.done():
+        await asyncio.sleep(window / 50)
+        if game.step == RESPONSE_WINDOW and game.window:
+            for seat in game.window.pending():
+                key = (game.window.version, seat)
+                if key in reacting:
+                    continue
+                reacting.add(key)
+                if rng.random() >= idle:
+                    asyncio.create_task(react_later(game.window.version, seat))
+        elif game.state.phase != GAME_OVER and game.mailbox.queue.empty():
+            moves = list(game.legal_moves)
+            if moves:
+                move = rng.choice([m for m in moves if m.kind == ACT] or moves)
+                game.mailbox.post(game.submit_at, game.seq, move)
+    await game.drain()
+    return game.game_thread.calls, game.state.turn_count
+
+
+async def measure(cls, games: int, window: float, idle: float) -> tuple[Counter, int]:
+    rng = random.Random(1)
+    get_outbound().per = PER * window / RESPONSE_TIMEOUT # Scale Discord's rate limit window like the response window
+    total, turns = Counter(), 0
+    for _ in range(games):
+        calls, count = await play(cls, window, idle, rng)
+        total += calls
+        turns += count
+    return total, turns
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=10)
+    parser.add_argument("--window", type=float, default=0.2, help="seconds standing in for the 10 s response window")
+    parser.add_argument("--idle", type=float, default=0.2, help="chance a player never reacts to a window")
+    args = parser.parse_args()
+
+    print(f"{args.games} games of 4 players, idle={args.idle}")
+    print(f"{'rendering':<18} {'turns':>6} {'sends':>7} {'log msgs':>9} {'edits':>7} {'deletes':>8} {'REST/turn':>10}")
+    for name, cls in (("per-second edits", PerSecondCountdown), ("per-line updates", PerLineUpdates),
+                      ("per-resolution", ResolutionBatches), ("current", Game), ("board mode", BoardGame)):
+        calls, turns = asyncio.run(measure(cls, args.games, args.window, args.idle))
+        print(
+            f"{name:<18} {turns:>6} {calls['send']:>7} {calls['log']:>9} {calls['edit']:>7} {calls['delete']:>8} "
+            f"{(calls.total() - calls['log']) / turns:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
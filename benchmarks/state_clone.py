@@ -0,0 +1,74 @@
+# state_clone.py
+"""
+Benchmark: cloning and hashing a game state.
+
+Compares copy.deepcopy(game) against the engine's GameState and the packed
+byte record (PackedState) for the same in-progress game.
+
+Usage: python -m benchmarks.state_clone [--players 6] [--seconds 1]
+"""
+import argparse
+import asyncio
+import copy
+import random
+import time
+from coup.controllers.game import Game
+from coup.engine import PackedState, legal_actions, apply, RECORD_SIZE, GAME_OVER
+
+
+def rate(fn, seconds: float) -> float:
+    """Calls of fn per second, measured over roughly `seconds`."""
+    calls = 0
+    batch = 100
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        for _ in range(batch):
+            fn()
+        calls += batch
+    return calls / (time.perf_counter() - start)
+
+
+async def build_game(players: int) -> Game:
+    """A game a few turns in, so the deck and hands have moved."""
+    game = Game({i + 1: f"player{i + 1}" for i in range(players)})
+    rng = random.Random(0)
+    for _ in range(10):
+        moves = legal_actions(game.state)
+        if game.state.phase == GAME_OVER or not moves:
+            break
+        game.state = apply(game.state, rng.choice(moves), rng)
+    game.sync_models()
+    return game
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=6)
+    parser.add_argument("--seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    game = asyncio.run(build_game(args.players))
+    state = game.state
+    packed = PackedState.from_state(state)
+
+    results = [
+        ("copy.deepcopy(game)", rate(lambda: copy.deepcopy(game), args.seconds)),
+        ("copy.deepcopy(state)", rate(lambda: copy.deepcopy(state), args.seconds)),
+        ("GameState share/_replace", rate(lambda: state._replace(turn=state.turn), args.seconds)),
+        ("PackedState.copy()", rate(packed.copy, args.seconds)),
+        ("PackedState.mutable()", rate(packed.mutable, args.seconds)),
+        ("PackedState.from_state", rate(lambda: PackedState.from_state(state), args.seconds)),
+        ("PackedState.to_state", rate(packed.to_state, args.seconds)),
+        ("hash(PackedState)", rate(lambda: hash(PackedState(packed.record, packed.ids)), args.seconds)),
+        ("PackedState.digest()", rate(packed.digest, args.seconds)),
+    ]
+
+    baseline = results[0][1]
+    print(f"record size: {RECORD_SIZE} bytes, players: {args.players}")
+    print(f"{'operation':<28} {'ops/s':>14} {'vs deepcopy':>12}")
+    for name, ops in results:
+        print(f"{name:<28} {ops:>14,.0f} {ops / baseline:>11.1f}x")
+
+
+if __name__ == "__main__":
+    main()
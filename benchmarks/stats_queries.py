@@ -0,0 +1,86 @@
+# stats_queries.py
+"""
+Benchmark: serving a guild leaderboard.
+
+Archives a guild's worth of finished games, then compares ranking players by
+scanning the game history against reading the incrementally maintained
+aggregates, both cold (SQLite) and through the LRU cache.
+
+Usage: python -m benchmarks.stats_queries [--games 20000] [--users 2000]
+"""
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+from coup.db import DatabaseWriter, GameHistory, StatsStore
+from .history_writes import finished_game
+
+GUILD = 1
+
+
+def timed(fn, repeat: int) -> float:
+    """Average milliseconds per call of fn."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=20000)
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    templates = [finished_game(rng.randint(2, 6), seed) for seed in range(200)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        writer = DatabaseWriter(os.path.join(tmp, "coup.db"))
+        history = GameHistory(writer)
+        stats = StatsStore(history)
+        writer.start()
+
+        start = time.perf_counter()
+        for i in range(args.games):
+            result = templates[i % len(templates)]
+            ids = rng.sample(range(1, args.users + 1), len(result.players))
+            for player, user_id in zip(result.players, ids):
+                player.id = user_id
+                player.name = f"user{user_id}"
+            result.winner_id = next(p.id for p in result.players if p.placement == 1)
+            result.guild_id = GUILD
+            history.record(result)
+            if i % len(templates) == len(templates) - 1:
+                writer.flush(timeout=60) # Results are reused, so let each round land first
+        writer.flush(timeout=60)
+        loaded = time.perf_counter() - start
+
+        scan = timed(lambda: writer.read(lambda conn: conn.execute(
+            "SELECT p.user_id, SUM(p.placement = 1) AS wins, COUNT(*) AS games FROM game_players p "
+            "JOIN games g ON g.id = p.game_id WHERE g.guild_id = ? "
+            "GROUP BY p.user_id ORDER BY wins DESC LIMIT 10", (GUILD,)
+        ).fetchall()), args.repeat)
+        aggregate = timed(lambda: writer.read(lambda conn: stats._load_leaderboard(conn, GUILD, 10)), args.repeat)
+
+        async def cached():
+            await stats.leaderboard(GUILD)
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                await stats.leaderboard(GUILD)
+            return (time.perf_counter() - start) / args.repeat * 1000
+
+        hit = asyncio.run(cached())
+        writer.stop()
+
+    print(f"{args.games} games, {args.users} users archived in {loaded:.1f}s")
+    print(f"history scan:      {scan:8.3f} ms")
+    print(f"aggregate table:   {aggregate:8.3f} ms")
+    print(f"LRU cache hit:     {hit:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# timers.py
+"""
+Benchmark: memory and firing jitter of N concurrent deadlines.
+
+Arms N response window deadlines spread over --spread seconds, cancels the
+share of them that close early (--cancel), and lets the rest fire. Compares
+one sleeping task per deadline, the way response windows used to time out,
+with handles on the shared TimerService heap.
+
+Usage: python -m benchmarks.timers [--sizes 100 1000 10000] [--spread 1.0] [--cancel 0.8]
+"""
+import argparse
+import asyncio
+import random
+import time
+import tracemalloc
+from coup.controllers.timers import TimerService
+
+
+async def with_tasks(deadlines: list[float], jitter: list[float]) -> list:
+    """One sleeping task per deadline."""
+    loop = asyncio.get_running_loop()
+    async def sleeper(when: float):
+        await asyncio.sleep(when - loop.time())
+        jitter.append(loop.time() - when)
+    return [asyncio.create_task(sleeper(when)) for when in deadlines]
+
+
+async def with_service(deadlines: list[float], jitter: list[float]) -> list:
+    """One handle per deadline on a TimerService."""
+    loop = asyncio.get_running_loop()
+    timers = TimerService(loop)
+    def fire(when: float):
+        jitter.append(loop.time() - when)
+    return [timers.call_at(when, fire, when) for when in deadlines]
+
+
+async def measure(arm, n: int, spread: float, share: float) -> tuple[float, float, float, float]:
+    rng = random.Random(n)
+    loop = asyncio.get_running_loop()
+    start = loop.time() + 0.05
+    deadlines = [start + rng.uniform(0, spread) for _ in range(n)]
+    cancel = set(rng.sample(range(n), int(n * share)))
+    jitter = []
+
+    tracemalloc.start()
+    cpu = time.process_time()
+    handles = await arm(deadlines, jitter)
+    memory = tracemalloc.get_traced_memory()[0]
+    for i in cancel:
+        handles[i].cancel()
+    await asyncio.sleep(spread + 0.1)
+    cpu = time.process_time() - cpu
+    tracemalloc.stop()
+    return memory / 1024, cpu * 1000, sum(jitter) / len(jitter) * 1000, max(jitter) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--spread", type=float, default=1.0, help="seconds the deadlines are spread over")
+    parser.add_argument("--cancel", type=float, default=0.8, help="share of deadlines cancelled before firing")
+    args = parser.parse_args()
+
+    print(f"{'timers':>7} {'mode':>8} {'memory KiB':>11} {'cpu ms':>8} {'jitter avg ms':>14} {'jitter max ms':>14}")
+    for n in args.sizes:
+        for name, arm in (("tasks", with_tasks), ("heap", with_service)):
+            memory, cpu, avg, worst = asyncio.run(measure(arm, n, args.spread, args.cancel))
+            print(f"{n:>7} {name:>8} {memory:>11.1f} {cpu:>8.1f} {avg:>14.3f} {worst:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
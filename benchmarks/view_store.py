@@ -0,0 +1,82 @@
+# view_store.py
+"""
+Benchmark: what live game messages cost the client's view store.
+
+Simulates N concurrent games each keeping its action and hand messages
+live, the way message views pile up over a session. Compares
+per-message closure Views (what game_views built before: each message's
+View is stored until it stops) against the custom_id-routed dynamic items,
+which register once per bot and keep nothing per message.
+
+Usage: python -m benchmarks.view_store [--games 10 100 1000] [--messages 3]
+"""
+import argparse
+import asyncio
+import tracemalloc
+from discord.ui import View, Select, Button
+from discord.ui.view import ViewStore
+from coup.controllers.game import Game
+from coup.views import DYNAMIC_ITEMS, create_action_view, create_hand_view
+
+
+def closure_views(game: Game) -> list[View]:
+    """Views shaped like the old per-message ones: items with callbacks closed over game."""
+    view = View(timeout=None)
+    select = Select(placeholder="Choose an action...", options=create_action_view(game).children[0].item.options)
+    async def on_select(interaction):
+        await game.submit(None)
+    select.callback = on_select
+    view.add_item(select)
+    hand_view = View(timeout=None)
+    hand = Button(label="Check Hand")
+    async def on_press(interaction):
+        await interaction.response.send_message(str(game.seats))
+    hand.callback = on_press
+    hand_view.add_item(hand)
+    return [view, hand_view]
+
+
+def dynamic_views(game: Game) -> list[View]:
+    return [create_action_view(game), create_hand_view(game)]
+
+
+async def measure(games: int, messages: int, dynamic: bool) -> tuple[int, int, float]:
+    """Returns (stored views, stored dynamic templates, KiB retained by the store)."""
+    store = ViewStore(None)
+    if dynamic:
+        store.add_dynamic_items(*DYNAMIC_ITEMS)
+    table = [Game({1: "a", 2: "b", 3: "c"}, game_id=i + 1) for i in range(games)]
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    message_id = 1
+    for game in table:
+        for _ in range(messages):
+            views = dynamic_views(game) if dynamic else closure_views(game)
+            for view in views:
+                store.add_view(view, message_id)
+                message_id += 1
+        del views
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    retained = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return len(store._views), len(store._dynamic_items), retained / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--messages", type=int, default=3, help="live message rounds per game")
+    args = parser.parse_args()
+
+    print(f"{'games':>6} {'dispatch':<9} {'stored views':>13} {'templates':>10} {'retained KiB':>13}")
+    for games in args.games:
+        for dynamic in (False, True):
+            views, templates, kib = asyncio.run(measure(games, args.messages, dynamic))
+            name = "custom_id" if dynamic else "closure"
+            print(f"{games:>6} {name:<9} {views:>13,} {templates:>10} {kib:>13,.1f}")
+
+
+if __name__ == "__main__":
+    main()
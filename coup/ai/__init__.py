@@ -0,0 +1,14 @@
+from .mcts import search, determinize
+from .worker import think, get_executor, shutdown_executor, BOT_BUDGET_MS
+
+BOT_NAMES = ["Bot Alice", "Bot Bob", "Bot Carol", "Bot Dave", "Bot Eve"]
+
+
+def is_bot_id(user_id: int) -> bool:
+    """Computer-controlled players use negative ids so they never collide with Discord users."""
+    return user_id < 0
+
+
+__all__ = ["search", "determinize",
+           "think", "get_executor", "shutdown_executor", "BOT_BUDGET_MS",
+           "BOT_NAMES", "is_bot_id"]
@@ -0,0 +1,147 @@
+# mcts.py
+import math
+import time
+import random
+from coup.engine import (
+    GameState, Move, legal_actions, deciding_seats, apply,
+    RESPONSE, BLOCK_RESPONSE, EXAMINE_DECIDE, GAME_OVER, ALLOW,
+)
+from coup.sim.policies import HeuristicPolicy
+from coup.sim.runner import choose
+
+EXPLORATION = 0.7 # UCB exploration constant
+MAX_ROLLOUT_MOVES = 400
+
+
+class Node:
+    """Node in the observer's information set tree; edges are the observer's own moves."""
+    __slots__ = ("move", "parent", "children", "visits", "avail", "reward")
+
+    def __init__(self, move: Move | None = None, parent: "Node | None" = None):
+        self.move = move
+        self.parent = parent
+        self.children: dict[Move, Node] = {}
+        self.visits = 0
+        self.avail = 0 # Times this node's move was legal when its parent was visited
+        self.reward = 0.0
+
+    def ucb(self) -> float:
+        return self.reward / self.visits + EXPLORATION * math.sqrt(math.log(self.avail) / self.visits)
+
+
+class PassPolicy(HeuristicPolicy):
+    """Stands in for the searching seat when others answer a window it passed on."""
+    def choose(self, state, seat, moves, rng):
+        if state.phase in (RESPONSE, BLOCK_RESPONSE):
+            return Move(ALLOW)
+        return super().choose(state, seat, moves, rng)
+
+
+def determinize(state: GameState, seat: int, rng: random.Random) -> GameState:
+    """
+    Sample hidden information consistent with what seat can see:
+    other hands, the deck and the burned card are redealt from the unseen cards.
+    """
+    fixed_seat = state.target if state.phase == EXAMINE_DECIDE and state.turn == seat else None
+    hidden = list(state.deck)
+    if state.burned:
+        hidden.append(state.burned)
+    for other, player in enumerate(state.players):
+        if other == seat:
+            continue
+        hand = list(player.hand)
+        if other == fixed_seat and state.examined in hand:
+            hand.remove(state.examined)
+        hidden.extend(hand)
+    rng.shuffle(hidden)
+
+    players = []
+    for other, player in enumerate(state.players):
+        if other == seat or not player.hand:
+            players.append(player)
+            continue
+        size = len(player.hand)
+        if other == fixed_seat and state.examined in player.hand:
+            hand = (state.examined,) + tuple(hidden.pop() for _ in range(size - 1))
+        else:
+            hand = tuple(hidden.pop() for _ in range(size))
+        players.append(player._replace(hand=hand))
+    burned = hidden.pop() if state.burned else None
+    return state._replace(players=tuple(players), deck=tuple(hidden), burned=burned)
+
+
+def root_moves(state: GameState, seat: int) -> list[Move]:
+    """Moves seat may choose at the root; in response windows ALLOW means pass."""
+    moves = [m for m in legal_actions(state) if m.seat == seat]
+    if state.phase in (RESPONSE, BLOCK_RESPONSE):
+        moves.append(Move(ALLOW))
+    return moves
+
+
+def search(state: GameState, seat: int, budget_ms: float = 500, seed: int | None = None,
+           max_iterations: int = 200000) -> Move:
+    """
+    Choose a move for seat with determinized information-set MCTS.
+    Each iteration samples the hidden cards, walks the tree of seat's own decisions
+    (opponents are played by the heuristic policy) and finishes with a heuristic rollout.
+    Runs until budget_ms of wall time or max_iterations, then returns the most visited move.
+    """
+    rng = random.Random(seed)
+    moves = root_moves(state, seat)
+    if len(moves) == 1:
+        return moves[0]
+
+    policies = [HeuristicPolicy() for _ in state.players]
+    passive = list(policies)
+    passive[seat] = PassPolicy()
+    root = Node()
+    deadline = time.perf_counter() + budget_ms / 1000
+    iterations = 0
+
+    while iterations < max_iterations and time.perf_counter() < deadline:
+        iterations += 1
+        world = determinize(state, seat, rng)
+        node = root
+        expanded = False
+
+        # Selection and expansion over seat's decisions
+        while world.phase != GAME_OVER and not expanded:
+            legal = root_moves(world, seat) if seat in deciding_seats(world) else None
+            if not legal:
+                world = apply(world, choose(world, policies, rng), rng)
+                continue
+            for move in legal:
+                child = node.children.get(move)
+                if child is not None:
+                    child.avail += 1
+            untried = [m for m in legal if m not in node.children]
+            if untried:
+                move = rng.choice(untried)
+                child = Node(move, node)
+                child.avail = 1
+                node.children[move] = child
+                expanded = True
+            else:
+                child = max((node.children[m] for m in legal), key=Node.ucb)
+            node = child
+            move = child.move
+            if move.kind == ALLOW:
+                # Seat passed; the rest of the table answers the window
+                move = choose(world, passive, rng)
+            world = apply(world, move, rng)
+
+        # Rollout
+        steps = 0
+        while world.phase != GAME_OVER and steps < MAX_ROLLOUT_MOVES:
+            world = apply(world, choose(world, policies, rng), rng)
+            steps += 1
+
+        # Backpropagation
+        won = 1.0 if world.winner == seat else 0.0
+        while node is not None:
+            node.visits += 1
+            node.reward += won
+            node = node.parent
+
+    best = max(root.children.values(), key=lambda n: n.visits)
+    return best.move
@@ -0,0 +1,47 @@
+# worker.py
+import os
+import random
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from coup.engine import GameState, Move
+from .mcts import search
+
+logger = logging.getLogger("coup")
+
+# Configurable through the environment (.env)
+BOT_BUDGET_MS = int(os.getenv("COUP_BOT_BUDGET_MS", 750)) # Thinking time per decision
+BOT_WORKERS = int(os.getenv("COUP_BOT_WORKERS", max(1, (os.cpu_count() or 2) - 1)))
+BOT_POOL = os.getenv("COUP_BOT_POOL", "process") # "process" or "thread"
+
+# Never fork the bot process: its database writer thread may hold the SQLite connection or a lock at that moment
+START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+_executor: Executor | None = None
+
+
+def get_executor() -> Executor:
+    """Shared pool that runs searches off the event loop."""
+    global _executor
+    if _executor is None:
+        if BOT_POOL == "thread":
+            _executor = ThreadPoolExecutor(max_workers=BOT_WORKERS, thread_name_prefix="coup-bot")
+        else:
+            _executor = ProcessPoolExecutor(max_workers=BOT_WORKERS, mp_context=multiprocessing.get_context(START_METHOD))
+        logger.info(f"Started bot {BOT_POOL} pool with {BOT_WORKERS} worker(s) ({START_METHOD})")
+    return _executor
+
+
+def shutdown_executor():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+async def think(state: GameState, seat: int, budget_ms: float = BOT_BUDGET_MS) -> Move:
+    """Run a search for seat in the pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    seed = random.getrandbits(32)
+    return await loop.run_in_executor(get_executor(), search, state, seat, budget_ms, seed)
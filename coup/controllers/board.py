@@ -0,0 +1,79 @@
+# board.py
+import os
+import logging
+import discord
+from collections import deque
+from coup.views import board_fields, create_board_embed, create_hand_view
+from .outbound import get_outbound, PROMPT, LOG, EDIT
+
+logger = logging.getLogger("coup")
+
+# Board mode for every game unless the lobby asks for it (!coup board). Configurable through the environment (.env)
+BOARD_MODE = os.getenv("COUP_BOARD_MODE", "").lower() in ("1", "true", "yes")
+BOARD_LOG_LINES = 10 # Most recent log lines kept on the status board
+ABANDONED = "Nobody has played for a while; the game has been abandoned."
+
+
+class Board:
+    """
+    Board mode: the game thread keeps one pinned status message (turn order,
+    coins, influence, revealed cards and the latest log lines) and one control
+    message for the pending decision, both edited in place, instead of a turn
+    start message, a log message per resolution and a new prompt every step.
+    """
+    def __init__(self):
+        self.status_msg: discord.Message | None = None
+        self.control_msg: discord.Message | None = None
+        self.fields: dict[str, str] = {} # Status fields as last rendered
+        self.log: deque[str] = deque(maxlen=BOARD_LOG_LINES)
+
+        # Stats
+        self.edits = 0
+        self.skipped = 0 # Status renders with nothing changed
+
+    def __repr__(self):
+        return f"<Board edits={self.edits} skipped={self.skipped}>"
+
+    def stats(self) -> dict:
+        return {"edits": self.edits, "skipped": self.skipped}
+
+    def add_log(self, content: str):
+        self.log.extend(content.splitlines())
+
+    async def show_status(self, game):
+        """
+        Send the status message, or re-render it if anything on it changed since it was last rendered.
+        Discord replaces the whole embed on an edit, so a change to any field re-renders all of them.
+        """
+        fields = board_fields(game, list(self.log))
+        if fields == self.fields:
+            self.skipped += 1
+            return
+        self.fields = fields
+        outbound = get_outbound()
+        if self.status_msg is None:
+            self.status_msg = await outbound.send(
+                game.game_thread, LOG, embed=create_board_embed(fields), view=create_hand_view(game)
+            )
+            outbound.pin(self.status_msg, EDIT) # A failure is logged by the scheduler; the board works unpinned
+            return
+        self.edits += 1
+        outbound.edit(self.status_msg, LOG, embed=create_board_embed(fields)) # Superseded if another follows soon
+        logger.debug(f"Board of game {game.game_id} updated")
+
+    async def show_control(self, game, view: discord.ui.View, embed: discord.Embed) -> discord.Message:
+        """Show the pending decision in the control message."""
+        outbound = get_outbound()
+        if self.control_msg is None:
+            self.control_msg = await outbound.send(game.game_thread, PROMPT, view=view, embed=embed)
+        else:
+            self.edits += 1
+            await outbound.edit(self.control_msg, PROMPT, view=view, embed=embed)
+        return self.control_msg
+
+    async def close(self, abandoned: bool = False):
+        """Clear the control message once the game has ended, or was abandoned."""
+        if self.control_msg is not None:
+            self.edits += 1
+            title = ABANDONED if abandoned else "The game is over."
+            await get_outbound().edit(self.control_msg, embed=discord.Embed(title=title), view=None)
@@ -1,10 +1,27 @@
 # coup.py
+import time
+import asyncio
 import logging
-from discord.ext import commands
+import discord
+from discord.ext import commands, tasks
+from coup.ai import shutdown_executor
+from coup.db import DatabaseWriter, SnapshotStore, GameHistory, StatsStore, EventStore, DB_PATH
+from coup.views import create_stats_embed, create_leaderboard_embed, DYNAMIC_ITEMS, interaction_stats
+from .game import Game
 from .lobby import Lobby
+from .registry import LobbyRegistry
+from .timers import get_timers
+from .supervisor import TaskSupervisor
+from .outbound import get_outbound
 
 logger = logging.getLogger("coup")
 
+def view_store_size(bot) -> int:
+    """Messages with views held in discord.py's view store; stays flat while games use dynamic items."""
+    store = getattr(getattr(bot, "_connection", None), "_view_store", None)
+    return len(store._views) if store else 0
+
+
 class Coup(commands.Cog):
     """
     Discord Cog for playing the Coup card game.
@@ -14,35 +31,187 @@ class Coup(commands.Cog):
     def __init__(self, bot):
         logger.info("Coup cog initialized.")
         self.bot = bot
-        self.lobbies = {} # Lobby ID -> Lobby Instance
+        self.registry = LobbyRegistry() # Lobby ID -> Lobby Instance, bounded and indexed
         self.next_id = 1
-    
+        self.db = DatabaseWriter(DB_PATH) # Write-behind queue in front of the SQLite database
+        self.snapshots = SnapshotStore(self.db) # Crash-safe checkpoints of running games
+        self.history = GameHistory(self.db) # Archive of finished games
+        self.stats = StatsStore(self.history) # Aggregates updated as games are archived
+        self.event_log = EventStore(self.db) # Append-only log of every move, for replays
+        self.restore_task = None
+
+    async def cog_load(self):
+        # Game components route by custom_id, so they work without per-message views and across restarts
+        self.bot.add_dynamic_items(*DYNAMIC_ITEMS)
+        self.db.start()
+        # Game ids must not repeat across restarts: the event log is keyed by them
+        self.next_id = await asyncio.to_thread(self.event_log.last_game_id) + 1
+        self.sweep_registry.start()
+        self.restore_task = asyncio.create_task(self.restore_games())
+
+    async def cog_unload(self):
+        self.bot.remove_dynamic_items(*DYNAMIC_ITEMS)
+        self.sweep_registry.cancel()
+        get_timers().stop()
+        get_outbound().stop()
+        if self.restore_task:
+            self.restore_task.cancel()
+        shutdown_executor()
+        await asyncio.to_thread(self.db.stop)
+
+    @tasks.loop(seconds=60)
+    async def sweep_registry(self):
+        """Periodically expire abandoned lobbies and games."""
+        self.registry.sweep()
+        logger.info(f"Registry stats: {self.registry.stats()}")
+        logger.info(f"View store: {view_store_size(self.bot)} message views")
+        logger.info(f"Interactions: {dict(interaction_stats)}")
+        logger.info(f"Timers: {get_timers().stats()}")
+        logger.info(f"Outbound REST: {get_outbound().stats()}")
+        games = [e.lobby.game for e in self.registry.entries.values() if e.lobby.game is not None]
+        mailboxes = [game.mailbox for game in games]
+        if mailboxes:
+            logger.info(
+                f"Game mailboxes: {len(mailboxes)} games, {sum(m.queue.qsize() for m in mailboxes)} queued, "
+                f"max latency {max(m.latency_max for m in mailboxes) * 1000:.1f} ms, "
+                f"{sum(m.rejected for m in mailboxes)} rejected"
+            )
+        if games:
+            busiest = max(games, key=lambda game: len(game.tasks))
+            logger.info(f"Game tasks: {TaskSupervisor.total()} live in total, most {busiest.tasks}")
+        logger.info(f"Database stats: {self.db.stats()} {self.snapshots} {self.history} {self.stats} {self.event_log}")
+
+    # --------------
+    # Crash Recovery
+    # --------------
+
+    async def restore_games(self):
+        """Resume every game that was still running when the bot last stopped."""
+        await self.bot.wait_until_ready()
+        started = time.perf_counter()
+        snapshots = await asyncio.to_thread(self.snapshots.load_all)
+        if not snapshots:
+            return
+        self.next_id = max(self.next_id, max(s.game_id for s in snapshots) + 1)
+
+        restored = 0
+        for snapshot in snapshots:
+            began = time.perf_counter()
+            try:
+                thread = self.bot.get_channel(snapshot.thread_id) or await self.bot.fetch_channel(snapshot.thread_id)
+            except discord.HTTPException as e:
+                logger.warning(f"Dropping {snapshot}: cannot fetch its thread: {e}")
+                self.snapshots.delete(snapshot.game_id)
+                continue
+
+            game = Game.from_snapshot(snapshot)
+            game.snapshots = self.snapshots
+            game.event_log = self.event_log
+            lobby = Lobby(snapshot.game_id, game=game)
+            task = asyncio.create_task(self.run_restored(lobby, thread))
+            self.registry.add(lobby, snapshot.guild_id, snapshot.channel_id, task=task)
+            restored += 1
+            logger.info(f"Restored game {snapshot.game_id} in {(time.perf_counter() - began) * 1000:.1f} ms")
+
+        logger.info(f"Restored {restored}/{len(snapshots)} games in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    async def run_restored(self, lobby: Lobby, thread: discord.Thread):
+        """Play a restored game to the end, then drop it like any other finished lobby."""
+        try:
+            results = await lobby.game.resume(thread)
+            if results:
+                self.history.record(results)
+        except Exception as e:
+            logger.exception(f"Restored game {lobby.lobby_id} failed: {e}")
+        finally:
+            self.registry.remove(lobby.lobby_id, "abandoned" if lobby.game.abandoned else "finished")
+
     # --------------
     # Lobby Commands
     # --------------
 
-    @commands.command(name="coup", help="Start a game of Coup")
-    async def coup(self, ctx: commands.Context):
+    @commands.command(name="coup", help="Start a game of Coup. Use !coup board to keep the game on one status board")
+    async def coup(self, ctx: commands.Context, mode: str = ""):
         """Starts a new lobby with a unique lobby ID"""
+        guild_id = ctx.guild.id if ctx.guild else None
+
+        # One lobby or game per player
+        current = self.registry.lobby_of_user(ctx.author.id)
+        if current is not None:
+            await ctx.send(f"You are already in Coup game #{current.lobby_id}. Use !coupwhere to find it.")
+            return
+
+        # Refuse new lobbies once the caps are reached
+        reason = self.registry.check_capacity(guild_id)
+        if reason:
+            await ctx.send(reason)
+            return
+
         # Create lobby
         lobby = Lobby(self.next_id, ctx)
-        self.lobbies[self.next_id] = lobby
+        lobby.snapshots = self.snapshots
+        lobby.event_log = self.event_log
+        lobby.board_mode = mode.lower() == "board"
+        self.registry.add(lobby, guild_id, ctx.channel.id, task=asyncio.current_task())
 
         # Update next lobby id
         self.next_id += 1
 
-        results = await lobby.run(ctx)
+        results = None
+        try:
+            results = await lobby.run(ctx)
+        finally:
+            # Drop the lobby (and its Game) once it is done
+            reason = ("abandoned" if lobby.game.abandoned else "finished") if lobby.game else "closed"
+            self.registry.remove(lobby.lobby_id, reason)
 
-        # TODO: DB does something with results
+        # Archive the finished game; the write happens off the event loop
+        if results:
+            self.history.record(results)
+
+    @commands.command(name="coupwhere", help="Find the Coup lobby or game you are playing in")
+    async def coupwhere(self, ctx: commands.Context):
+        """Links the caller's current lobby or game thread, or names the game of the current thread"""
+        lobby = self.registry.lobby_of_user(ctx.author.id)
+        if lobby is None:
+            lobby = self.registry.game_in_thread(ctx.channel.id)
+            if lobby is None:
+                await ctx.send("You are not in a Coup lobby or game.")
+            else:
+                await ctx.send(f"This thread is Coup game #{lobby.lobby_id}.")
+            return
+
+        game = lobby.game
+        if game and game.game_thread:
+            await ctx.send(f"You are playing Coup game #{lobby.lobby_id} in {game.game_thread.mention}.")
+        elif lobby.prev_msg:
+            await ctx.send(f"You are in Coup lobby #{lobby.lobby_id}: {lobby.prev_msg.jump_url}")
+        else:
+            await ctx.send(f"You are in Coup lobby #{lobby.lobby_id}.")
 
-        return
 
-    
     # -----------------
     # Database Commands
     # -----------------
-       
+
+    @commands.command(name="coupstats", help="Show Coup stats for yourself or another player")
+    async def coupstats(self, ctx: commands.Context, member: discord.Member = None):
+        """Shows a player's stats in this server (or across all servers in DMs)"""
+        member = member or ctx.author
+        guild_id = ctx.guild.id if ctx.guild else None
+        stats = await self.stats.user_stats(member.id, guild_id)
+        scope = ctx.guild.name if ctx.guild else "All servers"
+        await ctx.send(embed=create_stats_embed(member.display_name, stats, scope))
+
+    @commands.command(name="coupleaderboard", help="Show the top rated Coup players")
+    async def coupleaderboard(self, ctx: commands.Context):
+        """Shows the rating leaderboard for this server (or across all servers in DMs)"""
+        guild_id = ctx.guild.id if ctx.guild else None
+        rows = await self.stats.leaderboard(guild_id)
+        scope = ctx.guild.name if ctx.guild else "All servers"
+        await ctx.send(embed=create_leaderboard_embed(rows, scope))
+
 
 async def setup(bot):
     """Setup function to add the Coup cog to the bot."""
-    await bot.add_cog(Coup(bot))
\ No newline at end of file
+    await bot.add_cog(Coup(bot))
@@ -1,18 +1,63 @@
 # game.py
+import os
+import time
 import asyncio
 import random
 import discord
 import logging
-from typing import Optional
 from collections import deque
-from coup.models import Player, Deck, Action, Coup
+from coup.models import Player, Deck, Action
+from coup.ai import think, is_bot_id
+from coup.engine import (
+    GameState, PackedState, GameResult, Move, move_rng, from_models, to_models, legal_actions, is_legal, deciding_seats, default_move, apply,
+    ACT, ALLOW, RESPONSE, BLOCK_RESPONSE, GAME_OVER,
+)
 from coup.views import *
+from .mailbox import Mailbox
+from . import turn
+from .response import ResponseWindow, RESPONSE_TIMEOUT
+from .timers import TimerHandle, get_timers
+from .supervisor import TaskSupervisor
+from .outbound import get_outbound, PROMPT, LOG
+from .board import Board, BOARD_MODE, ABANDONED
 
 logger = logging.getLogger("coup")
 
+IDLE_LIMIT = float(os.getenv("COUP_IDLE_LIMIT", 30 * 60)) # Seconds without a human move before a game is abandoned
+LOG_EMBED_LIMIT = 4096 # Characters in an embed description; longer log batches are split
+MESSAGE_EMBED_LIMIT = 6000 # Characters across every embed of one message
+
 class Game:
-    """Model representing the state of an ongoing game."""
-    def __init__(self, players: dict):
+    """
+    Discord adapter for a game of Coup.
+    Rules live in coup.engine; this class turns interactions into engine moves
+    and renders the resulting state into the game thread.
+    """
+    # Message sender for each rendering effect of the turn state machine
+    RENDERERS = {
+        turn.TURN_START: "send_turn_start_msg",
+        turn.RENDER_ACTION: "send_action_message",
+        turn.RENDER_TARGET: "send_target_message",
+        turn.RENDER_RESPONSE: "send_response_message",
+        turn.RENDER_PROMPT: "send_prompt_message",
+        turn.RENDER_SWAP: "send_swap_message",
+    }
+
+    def __init__(self, players: dict, game_id: int = 0, state: GameState | None = None, started: float | None = None):
+        """
+        Args:
+            players: Mapping of player id -> display name
+            game_id: Unique id of the game (the id of its lobby)
+            state: Engine state to resume from; a new game is dealt if None
+            started: When a resumed game originally started
+        """
+        self.game_id = game_id
+        self.started = started or time.time()
+        self.seed = random.getrandbits(63) # Seeds the rng of every move, see move_rng
+        self.seq = 0 # Moves applied so far; the state version stamped into every component
+        self.snapshots = None # SnapshotStore checkpointing this game, set by the lobby
+        self.event_log = None # EventStore recording every move, set by the lobby
+        self.registry = None # LobbyRegistry indexing this game, set on registration
         # Create Player objects from the input mapping
         self.players = [Player(id, name) for id, name in players.items()]
         self.dead: list[Player] = []
@@ -20,95 +65,482 @@ class Game:
         self.deck = Deck()
         # Game Metadata
         self.game_active = True
+        self.abandoned = False # Torn down for lack of human activity
         self.game_thread: discord.Thread | None = None
         self.prev_msg: discord.Message | None = None
+        self.mailbox = Mailbox(f"game-{game_id}") # Runs every change to the game, one at a time
+        self.outbox = Mailbox(f"render-{game_id}", maxsize=0) # Sends the messages changes produce, in order
+        self.tasks = TaskSupervisor(f"game-{game_id}") # Every task and timer the game starts
+        self.log_lines: list[str] = [] # Log lines of the resolution in progress, sent together by flush_log
+        self.log_sent: asyncio.Future | None = None # Latest log message or turn header queued; prompts wait for it
+        self.board: Board | None = Board() if BOARD_MODE else None # Status and control messages edited in place, in board mode
         # Turn Data
         self.turn_order = deque()
         self.current_player: Player | None = None
         self.current_action: Action | None = None
         self.turn_completed = asyncio.Event() # To check for turn finish before advancing turn order
 
-        # Deal 2 cards to each player
-        for player in self.players:
-            player.gain_influence(self.deck.draw())
-            player.gain_influence(self.deck.draw())
+        if state is None:
+            # Deal 2 cards to each player
+            for player in self.players:
+                player.gain_influence(self.deck.draw())
+                player.gain_influence(self.deck.draw())
 
-        # Randomize turn order
-        randomized = random.sample(self.players, k=len(self.players))
-        self.turn_order = deque(randomized)
-        self.current_player = self.turn_order.popleft()
+            # Randomize turn order; seats in the engine follow it
+            self.seats: list[Player] = random.sample(self.players, k=len(self.players))
+            state = from_models(self.seats, self.deck)
+        else:
+            # Resuming: seats come from the saved state
+            by_id = {p.id: p for p in self.players}
+            self.seats = [by_id[p.id] for p in state.players]
+        self.players = list(self.seats)
+        # Lookup indexes, kept current by sync_models
+        self.seat_by_id = {p.id: seat for seat, p in enumerate(self.seats)}
+        self.player_by_id = {p.id: p for p in self.seats}
+        self.alive_ids = {p.id for p in self.seats} # Shrinks as players are eliminated
+        self.order_turn = None # Seat the turn order was last rotated for
+        self.legal_moves: frozenset[Move] = frozenset() # Every legal move in the current state
+        self.moves_by_id: dict[int, list[Move]] = {} # Player id -> their legal moves in the current state
+        self.state: GameState = state
+        self.step = turn.step_of(state) # What the game is waiting on, see turn.STEPS
+        self.window: ResponseWindow | None = None # Reactions to the open response window
+        self.window_timer: TimerHandle | None = None # Closes the window when it times out
+        self.response_timeout = RESPONSE_TIMEOUT
+        self.decision_timeouts = dict(turn.DECISION_TIMEOUTS) # Step -> seconds before the default move
+        self.deadline: TimerHandle | None = None # Makes the default move when the current decision times out
+        self.deadline_for: tuple[int, str] | None = None # (seq, step) the deadline was armed for
+        self.idle_limit = IDLE_LIMIT
+        self.last_activity = time.monotonic() # Last move made by a human player
+        self.timeouts = 0 # Decisions made by default
+        self.result = GameResult(state, players, game_id, self.started) # Filled in as moves are applied
+        self.sync_models()
         # Log Game Init
         logger.info(f"Initialized Game: {self}")
 
+    @classmethod
+    def from_snapshot(cls, snapshot) -> "Game":
+        """Rebuild a game checkpointed by SnapshotStore."""
+        game = cls(dict(snapshot.players), game_id=snapshot.game_id, state=snapshot.packed.to_state(),
+                   started=snapshot.started)
+        game.seed = snapshot.seed
+        game.seq = snapshot.seq
+        return game
+
     def __repr__(self):
         return (
             f"<Game current_player={self.current_player} "
             f"turn_info={self.current_action} "
             f"turn_order={self.get_turn_order_ids()} deck={self.deck}>"
         )
-        
+
     # -----------------------
     # Game Flow
     # -----------------------
 
-    async def game_loop(self, msg: discord.Message):
-        """Main game loop."""
+    async def game_loop(self, msg: discord.Message) -> GameResult | None:
+        """Main game loop. Returns the result of the game, or None if it never finished."""
         # Create Game Thread
         try:
             self.game_thread = await msg.create_thread(name="Game Thread", auto_archive_duration=1440)
         except Exception as e:
             logger.error(f"Failed to create thread: {e}")
-            return # Do not continue if game thread doesn't exist
+            return None # Do not continue if game thread doesn't exist
+        if self.registry:
+            self.registry.on_thread(self.game_id, self.game_thread.id)
 
         await self.ping_players()
+        if self.event_log:
+            self.event_log.start(self)
+        self.checkpoint()
+        return await self.play()
+
+    async def resume(self, thread: discord.Thread) -> GameResult | None:
+        """Continue a game restored from a snapshot in its existing thread."""
+        self.game_thread = thread
+        if self.registry:
+            self.registry.on_thread(self.game_id, thread.id)
+        await get_outbound().send(self.game_thread, content="The bot restarted; resuming the game where it left off.")
+        return await self.play()
+
+    async def play(self) -> GameResult | None:
+        """Play turns until the game is over."""
+        self.mailbox.start()
+        self.outbox.start()
+        self.tasks.track(self.mailbox.task)
+        self.tasks.track(self.outbox.task)
+        try:
+            while self.game_active:
+                await self.mailbox.send(self.begin_turn)
+
+                # Wait until Active Player Finishes Taking Turn
+                await self.turn_completed.wait()
+                self.turn_completed.clear()
+
+                logger.info(f"Game Turn Complete")
+
+                if self.state.phase == GAME_OVER:
+                    await self.mailbox.join()
+                    await self.drain()
+                    await self.end_game()
+                    await self.drain()
+                elif self.abandoned:
+                    await self.drain()
+                    if self.board:
+                        await self.board.close(abandoned=True)
+        finally:
+            self.tasks.cancel_all()
+            self.window_timer = self.deadline = None
+            self.mailbox.stop()
+            self.outbox.stop()
+            logger.info(f"{self.mailbox} stats: {self.mailbox.stats()}")
+            logger.info(f"{self.outbox} stats: {self.outbox.stats()}")
+            logger.info(f"{self.tasks} stats: {self.tasks.stats()}")
+            if self.board:
+                logger.info(f"{self.board} stats: {self.board.stats()}")
+
+        return self.result if self.state.phase == GAME_OVER else None
+
+    async def drain(self):
+        """Wait until every message the game has produced so far is delivered."""
+        await self.outbox.join()
+        if self.game_thread:
+            await get_outbound().join(self.game_thread)
+
+    async def begin_turn(self):
+        """Open the current turn, or re-open the pending decision of a resumed game."""
+        if self.state.phase == GAME_OVER:
+            return # A move queued ahead of this one ended the game
+        logger.info(f"Starting turn for {self.current_player}")
+        self.step = turn.step_of(self.state)
+        self.sync_window()
+        self.sync_deadline()
+        self.schedule(turn.begin_turn(self.state, self.seq))
 
-        while self.game_active:
-            await self.send_turn_start_msg()
-            await self.take_turn()
+    def end_turn(self):
+        logger.info(f"Ending turn for {self.current_player}")
+        self.turn_completed.set()
+
+    async def end_game(self):
+        logger.info("Ending Game")
+        self.game_active = False
+        if self.snapshots:
+            self.snapshots.delete(self.game_id)
+        self.result.finish(self.state, time.time())
+        guild = getattr(self.game_thread, "guild", None)
+        self.result.guild_id = guild.id if guild else None
+        self.result.channel_id = getattr(self.game_thread, "parent_id", None)
+        winner = self.state.winner
+        if winner is not None:
+            await self.send_update_msg(f"{self.seats[winner].name} has won the game!")
+        if self.board:
+            await self.board.close()
+
+    async def submit_at(self, version: int, move: Move) -> bool:
+        """submit, unless the game has moved on from version since the move was decided."""
+        if self.is_stale(version):
+            logger.info(f"Discarding stale move {move} (version {version}, now {self.seq})")
+            return False
+        return await self.submit(move)
+
+    async def submit(self, move: Move) -> bool:
+        """
+        Apply a move from a player (or timer) to the game.
+        Returns False without changing anything if the move is not legal right now.
+        The game is fully updated when this returns; messages follow on the outbox.
+        """
+        if not is_legal(self.state, move):
+            logger.info(f"Rejected illegal move: {move}")
+            return False
+        self.note_activity(move.seat)
+        self.schedule(self.transition(move))
+        return True
+
+    def transition(self, move: Move) -> list[turn.Effect]:
+        """Apply a legal move and record it, synchronously. Returns the effects to perform."""
+        events = []
+        before = self.state
+        self.seq += 1
+        self.tasks.cancel_stale(self.seq) # Bot searches and timers of the previous state
+        self.state = apply(before, move, move_rng(self.seed, self.seq), events)
+        if self.event_log:
+            self.event_log.append(self.game_id, self.seq, move, events, before, self.state)
+        self.result.record(events, before)
+        self.sync_models()
+        self.checkpoint()
+        self.step = turn.step_of(self.state)
+        self.sync_window()
+        self.sync_deadline()
+        logger.info(f"Applied {move}; phase={self.state.phase}")
+
+        log = [line for line in (self.describe_event(event, before) for event in events) if line]
+        return turn.after_move(move, self.state, log, self.seq)
 
-            # Wait until Active Player Finishes Taking Turn
-            await self.turn_completed.wait()
-            self.turn_completed.clear()
+    # -----------------------
+    # Response Window
+    # -----------------------
 
-            logger.info(f"Game Turn Complete")
-            self.current_action = None
+    def sync_window(self):
+        """Open a window (and its single timer) when the game starts waiting on reactions; drop it otherwise."""
+        if self.window is not None and self.window.version == self.seq:
+            return
+        if self.window_timer:
+            self.window_timer.cancel()
+            self.window_timer = None
+        self.window = None
+        if self.step == turn.RESPONSE_WINDOW:
+            self.window = ResponseWindow(self.seq, self.state, legal_actions(self.state), self.response_timeout)
+            # The window's only timer; the message shows the same deadline as a relative timestamp
+            self.window_timer = self.tasks.track(get_timers().call_later(
+                self.window.timeout, self.expire, self.close_window, self.seq, name=f"window-{self.game_id}-{self.seq}"
+            ), self.seq)
+
+    def expire(self, command, version: int, *args):
+        """Timer callback: queue command(version, *args) on the mailbox, waiting for room if it is full."""
+        if not self.mailbox.post(command, version, *args):
+            self.tasks.spawn(self.mailbox.send(command, version, *args), version)
+
+    async def react(self, seat: int, move: Move | None) -> bool:
+        """
+        Buffer a challenge or block (None to pass) in the open window.
+        The window resolves once the outcome is decided. Returns False if the reaction was refused.
+        """
+        window = self.window
+        if window is None or not window.react(seat, move):
+            return False
+        self.note_activity(seat)
+        logger.info(f"{self.seats[seat]} reacted with {move} in {window}")
+        if window.is_decided():
+            await self.close_window(window.version)
+        return True
+
+    async def react_at(self, version: int, seat: int, move: Move | None) -> bool:
+        """react, unless the window at version has closed since the reaction was decided."""
+        if self.is_stale(version):
+            return False
+        return await self.react(seat, move)
+
+    async def close_window(self, version: int):
+        """Resolve the window at version with its winning reaction, or ALLOW. Runs at most once per window."""
+        window = self.window
+        if window is None or window.version != version or window.closed:
+            return
+        window.closed = True
+        logger.info(f"Closing {window} after {time.monotonic() - window.opened:.1f}s")
+        await self.submit(window.resolution())
 
-            await self.advance_turn()
+    # -----------------------
+    # Deadlines
+    # -----------------------
 
-        #TODO: return some result TBD
-    
-    async def take_turn(self):
-        """Handle current player's turn."""
-        logger.info(f"Starting turn for {self.current_player}")
+    def sync_deadline(self):
+        """Arm the deadline of the decision the game now waits on, once per (seq, step); drop the previous one."""
+        if self.deadline_for == (self.seq, self.step):
+            return
+        if self.deadline:
+            self.deadline.cancel()
+        self.deadline = None
+        self.deadline_for = (self.seq, self.step)
+        timeout = self.decision_timeouts.get(self.step)
+        if timeout is not None:
+            self.deadline = self.tasks.track(get_timers().call_later(
+                timeout, self.expire, self.timeout_decision, self.seq, self.step, name=f"deadline-{self.game_id}-{self.seq}"
+            ), self.seq)
+
+    async def timeout_decision(self, version: int, step: str):
+        """Make the default move for a decision that ran out of time, or abandon the game if nobody is playing."""
+        if self.is_stale(version) or self.step != step:
+            return
+        player = self.seats[deciding_seats(self.state)[0]]
+        if not is_bot_id(player.id) and time.monotonic() - self.last_activity >= self.idle_limit:
+            self.abandon()
+            return
+        move = default_move(self.state)
+        self.timeouts += 1
+        logger.info(f"{player} timed out in {step}; playing {move}")
+        self.schedule([turn.Effect(turn.UPDATE, self.seq, (f"{player.name} ran out of time.",))])
+        self.schedule(self.transition(move))
+
+    def note_activity(self, seat: int | None):
+        if seat is not None and not is_bot_id(self.seats[seat].id):
+            self.last_activity = time.monotonic()
+
+    def abandon(self):
+        """Tear down a game no human has played in idle_limit seconds. It is neither archived nor restored."""
+        logger.info(f"Abandoning {self}: no human activity for {time.monotonic() - self.last_activity:.0f}s")
+        self.abandoned = True
+        self.game_active = False
+        if self.snapshots:
+            self.snapshots.delete(self.game_id)
+        self.schedule([
+            turn.Effect(turn.UPDATE, self.seq, (ABANDONED,)),
+            turn.Effect(turn.END_TURN, self.seq),
+        ])
+
+    def schedule(self, effects: list[turn.Effect]):
+        """
+        Perform local effects (bots, end of turn) now and queue the rest, in order, on the outbox.
+        Log lines are held until the next message goes out: the lines of a finished turn
+        open the next turn's header message, and lines that explain a prompt (other than
+        a response window, whose embed already names the action and block being resolved)
+        are sent as one message ahead of it.
+        """
+        for effect in effects:
+            if effect.kind == turn.BOTS:
+                self.schedule_bots()
+            elif effect.kind == turn.END_TURN:
+                if self.state.phase == GAME_OVER or self.abandoned: # No next turn to carry them
+                    self.flush_log()
+                self.end_turn()
+            elif effect.kind == turn.UPDATE:
+                self.log_lines.extend(effect.args)
+            elif effect.kind == turn.TURN_START:
+                lines, self.log_lines = self.log_lines, []
+                self.outbox.post(self.send_turn_start_msg, lines)
+            else:
+                if effect.kind != turn.RENDER_RESPONSE:
+                    self.flush_log()
+                self.outbox.post(self.perform, effect)
+
+    def flush_log(self):
+        """Queue the held log lines as one message."""
+        if self.log_lines:
+            self.outbox.post(self.send_log, self.log_lines)
+            self.log_lines = []
+
+    async def send_log(self, lines: list[str]):
+        """Outbox command: send log lines as one embed, split only past the embed size limit."""
+        chunk, size = [], 0
+        for line in lines:
+            if chunk and size + 1 + len(line) > LOG_EMBED_LIMIT:
+                await self.send_update_msg("\n".join(chunk))
+                chunk, size = [], 0
+            size += len(line) + (1 if chunk else 0)
+            chunk.append(line)
+        await self.send_update_msg("\n".join(chunk))
+
+    async def perform(self, effect: turn.Effect):
+        """Outbox command: carry out one rendering effect."""
+        if effect.kind in turn.INTERACTIVE and self.is_stale(effect.version):
+            logger.info(f"Skipping {effect.kind}: game moved on from version {effect.version}")
+            return
+        await getattr(self, self.RENDERERS[effect.kind])(*effect.args)
+
+    def schedule_bots(self):
+        """Start a search for every computer-controlled seat with a decision to make."""
+        state = self.state
+        for seat in deciding_seats(state):
+            if is_bot_id(self.seats[seat].id):
+                self.tasks.spawn(self.bot_move(state, seat, self.seq), self.seq, name=f"coup-bot-{self.game_id}-{seat}")
 
-        # Must coup if coins >= 10
-        if self.current_player.coins >= 10:
-            self.current_action = Coup(self.current_player)
-            await self.send_target_message(force_coup=True)
+    async def bot_move(self, state: GameState, seat: int, version: int):
+        """Think off the event loop, then queue the move; it is applied only if the game is still at version."""
+        try:
+            move = await think(state, seat)
+        except Exception as e:
+            logger.exception(f"Bot search failed for {self.seats[seat]}: {e}")
+            return
+        if state.phase in (RESPONSE, BLOCK_RESPONSE):
+            await self.mailbox.send(self.react_at, version, seat, None if move.kind == ALLOW else move)
         else:
-            await self.send_action_message()
-    
-    async def advance_turn(self):
-        """Advance to the next player's turn."""
-        # If no players other than current player, current player has won. End game
-        if not self.turn_order:
-            await self.end_game()
+            await self.mailbox.send(self.submit_at, version, move)
+
+    def sync_models(self):
+        """Mirror the engine state into the Player/Deck/Action objects the views render."""
+        state = self.state
+        to_models(state, self.seats, self.deck)
+
+        # Update the alive and turn order indexes on death and turn advance only
+        died = [p for p in self.players if not p.is_alive()]
+        if died:
+            self.dead.extend(died)
+            self.alive_ids.difference_update(p.id for p in died)
+            self.players = [p for p in self.players if p.is_alive()]
+            if self.registry:
+                for player in died:
+                    self.registry.on_eliminated(self.game_id, player.id)
+        self.current_player = self.seats[state.turn]
+        if died or state.turn != self.order_turn:
+            n = len(self.seats)
+            self.turn_order = deque(
+                p for p in (self.seats[(state.turn + i) % n] for i in range(1, n)) if p.id in self.alive_ids
+            )
+            self.order_turn = state.turn
+
+        # Index the legal moves so interactions are validated with a lookup
+        moves = legal_actions(state)
+        self.legal_moves = frozenset(moves)
+        self.moves_by_id = {}
+        for move in moves:
+            if move.seat is not None:
+                self.moves_by_id.setdefault(self.seats[move.seat].id, []).append(move)
+
+        if state.action is None:
+            self.current_action = None
             return
-        
-        # If current player isn't dead, add them to the end of the turn order
-        if self.current_player and self.current_player.is_alive():
-            self.turn_order.append(self.current_player)
-        # New active player is the front of the turn order.
-        self.current_player = self.turn_order.popleft()
-    
-    async def end_turn(self):
-        logger.info(f"Ending turn for {self.current_player}")
-        self.turn_completed.set()
+        action = state.action(self.current_player)
+        action.target = self.seat_player(state.target)
+        action.blocker = self.seat_player(state.blocker)
+        action.blocked = state.blocker is not None
+        action.blocking_role = state.block_role
+        action.challenger = self.seat_player(state.challenger)
+        action.challenged = state.challenger is not None
+        self.current_action = action
+
+    def describe_event(self, event: tuple, before: GameState) -> str | None:
+        """Public log line for an engine event, or None if it is not shown. before is the state the move was applied to."""
+        kind = event[0]
+        name = lambda seat: self.seats[seat].name
+
+        if kind == "act":
+            _, seat, action, target = event
+            if not (action.role or action.block_roles):
+                return None
+            if target is not None:
+                return f"{name(seat)} is attempting {action.name} on {self.mention(self.seats[target])}!"
+            return f"{name(seat)} is attempting to {action.name}!"
+        if kind == "block":
+            _, seat, role = event
+            return f"{name(seat)} is blocking {before.action.name} as {role}."
+        if kind == "challenge":
+            _, seat, defender, role = event
+            if before.phase == RESPONSE:
+                return f"{name(seat)} has challenged the action!"
+            return f"{name(seat)} has challenged the role block!"
+        if kind == "challenge_won":
+            _, seat, defender, role = event
+            return f"{name(seat)} won the challenge against {name(defender)}; {name(defender)} does not have {role}."
+        if kind == "challenge_lost":
+            _, seat, defender, role = event
+            return (
+                f"{name(seat)} lost the challenge against {name(defender)}; {name(defender)} had {role}.\n"
+                f"{name(defender)} is exchanging {role} with a new card from the deck."
+            )
+        if kind == "blocked":
+            _, seat, action = event
+            return f"{action.name} got blocked by {name(seat)}."
+        if kind == "resolve":
+            _, seat, action, target = event
+            player = self.seats[seat]
+            if action.gain:
+                return f"{player.name} gained {action.gain} coin(s). They now have {player.coins} coin(s)."
+            if action.name == "Steal":
+                return f"{player.name} stole from {name(target)}. They now have {player.coins} coin(s)."
+            if action.name == "Exchange Roles":
+                return f"{player.name} is exchanging roles with the deck."
+            return f"{player.name} succesfully carries out {action.name}."
+        if kind == "lose":
+            _, seat, card = event
+            return f"{name(seat)} has lost influence: {card}"
+        if kind == "eliminated":
+            return f"{name(event[1])} has been eliminated!"
+        if kind == "swap":
+            _, seat, target = event
+            return f"{name(seat)} examined {name(target)} and chose to force a card swap."
+        if kind == "keep":
+            _, seat, target = event
+            return f"{name(seat)} examined {name(target)} and chose to let them keep their card."
+        return None
 
-    async def end_game(self):
-        logger.info("Ending Game")
-        self.game_active = False
-    
     # -----------------------
     # Utility Functions
     # -----------------------
@@ -124,65 +556,120 @@ class Game:
     def get_turn_order_names(self):
         """Return list of player names in turn order."""
         return [p.name for p in self.turn_order]
-    
+
     def get_player_by_id(self, id: int) -> Player:
-        """Returns Player Object given an id"""
-        for player in self.players:
-            if player.id == id:
-                return player
-        logger.error(f"Player with id {id} not found in list of living players")
-        return None
-    
+        """Returns the living Player Object given an id"""
+        if id not in self.alive_ids:
+            logger.error(f"Player with id {id} not found in list of living players")
+            return None
+        return self.player_by_id[id]
+
+    def is_alive(self, id: int) -> bool:
+        """True if id belongs to a player still in the game"""
+        return id in self.alive_ids
+
+    def can_move(self, move: Move) -> bool:
+        """True if move is legal right now"""
+        return move in self.legal_moves
+
+    def is_stale(self, version: int) -> bool:
+        """Whether something rendered at state version (seq) is out of date."""
+        return version != self.seq
+
+    def checkpoint(self):
+        """Queue a crash-safe snapshot of the game, if snapshots are enabled"""
+        if self.snapshots and self.game_active:
+            self.snapshots.checkpoint(self)
+
+    def snapshot(self) -> PackedState:
+        """Compact, hashable copy of the current game state"""
+        return PackedState.from_state(self.state)
+
+    def mention(self, player: Player) -> str:
+        """Name and ping for a player; computer-controlled players are not pinged"""
+        if is_bot_id(player.id):
+            return player.name
+        return f"{player.name} (<@{player.id}>)"
+
+    def seat_of(self, id: int) -> int | None:
+        """Returns the engine seat of a player id"""
+        return self.seat_by_id.get(id)
+
+    def seat_player(self, seat: int | None) -> Player | None:
+        """Returns the Player sitting at an engine seat"""
+        return self.seats[seat] if seat is not None else None
+
+    def moves_for(self, id: int) -> list[Move]:
+        """Legal moves available to a player id right now"""
+        return self.moves_by_id.get(id, [])
+
     async def ping_players(self):
         """Ping all players at start of game to invite them to game thread."""
-        mentions = " ".join([f"<@{p.id}>" for p in self.players])
-        await self.game_thread.send(mentions + " The game has begun!")
+        mentions = " ".join([f"<@{p.id}>" for p in self.players if not is_bot_id(p.id)])
+        await get_outbound().send(self.game_thread, content=mentions + " The game has begun!")
 
     # -----------------------
     # Message Handling
     # -----------------------
 
-    async def send_turn_start_msg(self):
-        self.hand_msg = await self.game_thread.send(
-            embed=create_turn_start_embed(self),
-            view=create_hand_view(self)
-        )
-        logger.info(f"Start of Turn Message Sent.")
-    
+    async def send_turn_start_msg(self, lines: list[str] = ()):
+        """Queue the turn header, with the log lines of the previous turn above it in the same message."""
+        if self.board:
+            if lines:
+                self.board.add_log("\n".join(lines))
+            await self.board.show_status(self)
+            return
+        outbound = get_outbound()
+        header = create_turn_start_embed(self)
+        embeds = [header]
+        log = "\n".join(lines)
+        if len(log) > LOG_EMBED_LIMIT or len(log) + len(header) > MESSAGE_EMBED_LIMIT:
+            await self.send_log(lines) # Too long to share the message
+        elif lines:
+            embeds.insert(0, discord.Embed(description=log))
+            if self.prev_msg:
+                outbound.delete(self.prev_msg)
+            self.prev_msg = None
+        view = create_hand_view(self)
+        self.log_sent = outbound.send(self.game_thread, LOG, embeds=embeds, view=view)
+        logger.info(f"Start of Turn Message Queued.")
+
     async def send_update_msg(self, content: str):
-        """Delete previous interactable message and send a log message in thread."""
+        """Delete previous interactable message and queue a log message in thread, without waiting for either."""
+        if self.board:
+            self.board.add_log(content)
+            await self.board.show_status(self)
+            return
+        outbound = get_outbound()
         if self.prev_msg:
-            try:
-                await self.prev_msg.delete()
-            except:
-                logger.error("Previous Message Not Found")
-                pass
+            outbound.delete(self.prev_msg)
         self.prev_msg = None
         embed = discord.Embed(
             description = content
         )
-        await self.game_thread.send(embed=embed)
+        self.log_sent = outbound.send(self.game_thread, LOG, embed=embed)
 
-        logger.info(f"Update Message Sent: {content}")
+        logger.info(f"Update Message Queued: {content}")
 
-    async def send_interact_msg(self, view: discord.ui.View, embed: discord.Embed, response_msg: bool):
-        """Send a message with an interactive view."""
+    async def send_interact_msg(self, view: discord.ui.View, embed: discord.Embed):
+        """
+        Send a message with an interactive view once the log messages queued before it
+        have been delivered, so players read what happened before they are asked to act.
+        """
+        if self.board:
+            self.prev_msg = await self.board.show_control(self, view, embed)
+            return
+        if self.log_sent:
+            await asyncio.wait([self.log_sent]) # Delivered, failed or cancelled: the prompt goes out regardless
+            self.log_sent = None
+        outbound = get_outbound()
         if self.prev_msg:
-            try:
-                await self.prev_msg.delete()
-            except:
-                logger.error("Previous Message Not Found")
-                pass
-        msg = await self.game_thread.send(view=view, embed=embed)
-        self.prev_msg = msg
+            outbound.delete(self.prev_msg)
+        self.prev_msg = None
+        self.prev_msg = await outbound.send(self.game_thread, PROMPT, view=view, embed=embed)
 
         logger.info(f"Interactable Message Sent")
 
-        # Countdown updates for non-update messages
-        if response_msg:
-            timeout = 10 # time to respond
-            asyncio.create_task(update_response_timer(self, msg, embed, timeout))
-
     async def send_action_message(self):
         """Send dropdown for player action selection."""
         logger.info("Creating Action Message.")
@@ -192,10 +679,9 @@ class Game:
         logger.info("Action Embed Created.")
         await self.send_interact_msg(
             view=view,
-            embed=embed,
-            response_msg=False
+            embed=embed
         )
-    
+
     async def send_response_message(self):
         """Create message with buttons to respond to an action"""
         logger.info("Creating Response Message.")
@@ -206,225 +692,53 @@ class Game:
 
         await self.send_interact_msg(
             view=view,
-            embed=embed,
-            response_msg=True
+            embed=embed
         )
 
-    async def send_target_message(self, force_coup=False):
+    async def send_target_message(self, action: type[Action]):
         """Send dropdown for target selection."""
         logger.info("Creating Target Message.")
-        view = create_target_view(self, force_coup=force_coup)
+        view = create_target_view(self, action)
         logger.info("Target View Created.")
-        embed = create_target_embed(self)
+        embed = create_target_embed(self, action)
         logger.info("Target Embed Created.")
 
         await self.send_interact_msg(
             view=view,
-            embed=embed,
-            response_msg=False
+            embed=embed
+        )
+
+    async def send_prompt_message(self, seat: int, mode: str):
+        """Send a prompt for a player to choose one of their cards."""
+        target = self.seats[seat]
+        logger.info(f"Creating Prompt Message: {target.name} ({mode})")
+        await self.send_interact_msg(
+            view=create_prompt_view(self, target, mode),
+            embed=create_prompt_embed(target, mode)
+        )
+
+    async def send_swap_message(self):
+        """Send the examined role to the examiner with a swap/keep choice."""
+        logger.info("Creating Swap Message.")
+        await self.send_interact_msg(
+            view=create_swap_view(self, self.state.examined),
+            embed=create_swap_embed(self)
         )
 
     # -----------------------
     # Turn Flow
     # -----------------------
 
-    async def handle_challenge(self):
-        """Handle Who wins the Challenge."""
-        action = self.current_action
-        actor = action.actor
-        blocker = action.blocker
-        challenger = action.challenger
-        
-        logger.info(f"Handling Challenge: challenger={challenger}")
-        
-        # Case: Challenge is made on blocker
-        if action.blocked == True:
-            logger.info(f"Defending Challenge: blocker={blocker}")
-            # If blocker does not have role they are blocking with
-            if not blocker.check_role(action.blocking_role):
-                logger.info("Defending Player does not have role.")
-                await self.send_update_msg(
-                    f"{challenger.name} won the challenge against {blocker.name}; {blocker.name} does not have {action.blocking_role}."
-                )
-                # Blocker loses influence, return to revealed pile
-                await self.handle_lose_influence(blocker)
-                # Check if Blocker is Alive
-                await self.check_alive(blocker)
-                # Carry out action (Block Failed)
-                await self.send_update_msg(
-                    f"{actor.name} succesfully carries out {action.name}."
-                )
-                await action.execute(self)
-            # If blocker has role
-            else:
-                logger.info("Defending Player has role.")
-                await self.send_update_msg(
-                    f"{challenger.name} lost the challenge against {blocker.name}; {blocker.name} had {action.blocking_role}."
-                )
-                # Challenger Loses Influence
-                await self.handle_lose_influence(challenger)
-                # Blocker Exchanges Challenged Role
-                await self.handle_lose_influence(player=blocker, card=action.blocking_role, exchange=True)
-                blocker.gain_influence(self.deck.draw())
-                await self.send_update_msg(
-                    f"{blocker.name} is exchanging {action.blocking_role} with a new card from the deck."
-                )
-                # Check if Challenger is Alive
-                await self.check_alive(challenger)
-                # Action is Blocked
-                await self.send_update_msg(
-                    f"{blocker.name} succesfully blocks {action.name}."
-                )
-                await action.on_block(self)
-        # Case: Challenge is made on actor
-        else:
-            logger.info(f"Defending Challenge: actor={self.current_player}")
-            acting_role = action.role
-            # If actor does not have role they are blocking with
-            if not actor.check_role(acting_role):
-                logger.info("Defending Player does not have role.")
-                await self.send_update_msg(
-                    f"{challenger.name} won the challenge against {actor.name}; {actor.name} does not have {acting_role}."
-                )
-                # Actor Loses Influence
-                await self.handle_lose_influence(actor)
-                # Check if Actor is Alive
-                await self.check_alive(actor)
-                # Action is Blocked
-                await self.send_update_msg(
-                    f"{blocker.name} succesfully blocks {action.name}."
-                )
-                await action.on_block(self)
-            # If actor has role
-            else:
-                logger.info("Defending Player has role.")
-                await self.send_update_msg(
-                    f"{challenger.name} lost the challenge against {actor.name}; {actor.name} had {acting_role}."
-                )
-                # Challenger Loses Influence
-                await self.handle_lose_influence(challenger)
-                # Actor Exchanges Challenged Role
-                await self.handle_lose_influence(player=actor, card=acting_role, exchange=True)
-                actor.gain_influence(self.deck.draw())
-                await self.send_update_msg(
-                    f"{actor.name} is exchanging {acting_role} with a new card from the deck."
-                )
-                # Check if Challenger is Alive
-                await self.check_alive(challenger)
-                # Carry out Action
-                await self.send_update_msg(
-                    f"{actor.name} succesfully carries out {action.name}."
-                )
-                await action.execute(self)
-
-    async def action_selected(self, action: Action):
+    async def action_selected(self, action: type[Action]):
         """Handle the logic following an action being selected"""
-        self.current_action = action(self.current_player)
-        # Check if can afford the action. If not, prompt new selection.
-        if not self.current_action.is_valid():
-            await self.send_update_msg("Not enough coins to carry out that action. Choose again.")
-            self.current_action = None
-            await self.send_action_message()
-            return
-        
-        if self.current_action.has_target():
-            await self.send_target_message()
-        elif self.current_action.can_respond():
-            await self.send_response_message()
-        else:
-            await self.current_action.execute(self)
-        
-    async def target_selected(self):
-        """Handle the logic after target is selected"""
-        if self.current_action.can_respond():
-            await self.send_response_message()
+        if action.targeted:
+            self.note_activity(self.state.turn)
+            self.step = turn.AWAIT_TARGET
+            self.sync_deadline()
+            self.schedule(turn.select_target(action, self.seq))
         else:
-            await self.current_action.execute(self)
+            await self.submit(Move(ACT, self.state.turn, action))
 
-    async def no_response(self):
-        """Handle no response to an action or block"""
-        action = self.current_action
-        if action.blocked:
-            await action.on_block(self)
-        else:
-            await action.execute(self)
-
-    async def check_alive(self, player: Player):
-        """Handle Player Death if Player Loses Influence"""
-        if not player.is_alive():
-            # Remove the dead player form the turn order
-            if player == self.current_player:
-                self.current_player = None
-            else:
-                self.turn_order.remove(player)
-            # Move from players to dead
-            self.players.remove(player)
-            self.dead.append(player)
-        return
-    
-    async def handle_lose_influence(self, player: Player, card: Optional[str] = None, exchange: bool = False ):
-        """Handle Logic for Player Losing Influence."""
-        logger.info(f"Handling {player} losing influence")
-        card_choice = None
-        # Obtain the Card Player is Losing
-        if player.num_influence() >= 2 and not card:
-            logger.info(f"Player has {player.num_influence()} cards. Must Choose one.")
-            # Must allow player to choose which to lose.
-            future = asyncio.get_event_loop().create_future()
-            msg = await self.game_thread.send(
-                view = create_prompt_view(target=player, future=future),
-                embed = create_prompt_embed(target=player, mode="lose"))
-            card_choice = await future
-            await msg.delete()
-            player.lose_influence(card_choice)
-        elif player.num_influence() >= 2 and card:
-            card_choice = player.lose_influence(card)
-        else:
-            # No need to get card choice
-            card_choice = player.lose_influence()
-        # Return Card to Deck
-        if exchange:
-            # Return to Deck, do not tell players the card's identity
-            self.deck.return_deck(card_choice)
-        else:
-            # Return to Revealed Pile, send update message with card's identity
-            self.deck.return_revealed(card_choice)
-            await self.send_update_msg(
-                f"{player.name} has lost influence: {card_choice}"
-            )
-
-    async def handle_examine(self):
-        """Handle logic for Player being examined"""
-        target = self.current_action.target
-        actor = self.current_player
-
-        logger.info(f"Handing {target.name} being examined by {actor.name}")
-
-        # --- Step 1: Obtain the Role Target is Revealing ---
-        if target.num_influence() == 2:
-            logger.info(f"{target.name} has 2 influence, must choose one to reveal")
-            future = asyncio.get_event_loop().create_future()
-            msg = await self.game_thread.send(
-                view = create_prompt_view(target=target, future=future),
-                embed = create_prompt_embed(target=target, mode="examine")
-            )
-            examined = await future
-            await msg.delete()
-
-        # --- Step 2: Reveal Examined role to Inquisitor ---
-        future = asyncio.get_event_loop().create_future()
-        msg = await self.game_thread.send(
-            view = create_swap_view(game=self, role=examined, future=future),
-            embed=create_prompt_embed(target=actor, mode="swap")
-        )
-        swap: bool = await future
-
-        # --- Step 2a: If Actor wants target to swap the role ---
-        if swap:
-            await self.send_update_msg(f"{actor.name} examined {target.name} and chose to force a card swap.")
-            await self.handle_lose_influence(player=target, card=examined, exchange=True)
-        # -- Step 2b: If Actor wants target to keep the role ---
-        else:
-            await self.send_update_msg(f"{actor.name} examined {target.name} and chose to let them keep their card.")
-
-        return
+    async def target_selected(self, action: type[Action], target: Player):
+        """Handle the logic after target is selected"""
+        await self.submit(Move(ACT, self.state.turn, action, self.seat_of(target.id)))
@@ -2,21 +2,49 @@
 import asyncio
 import logging
 from discord.ext import commands
+from coup.ai import BOT_NAMES, is_bot_id
 from coup.views import create_lobby_view, create_lobby_embed
+from coup.views.lobby_views import START, CANCEL, EMPTY, EXPIRED
 from .game import Game
+from .timers import get_timers
+from .outbound import get_outbound, PROMPT
+from .board import Board
 
 logger = logging.getLogger("coup")
 
+LOBBY_TIMEOUT = 15 * 60 # Seconds an unstarted lobby stays open
+UPDATE_WINDOW = 0.5 # Seconds of joins/leaves coalesced into a single message edit
+
 class Lobby:
     """Model representing the state of a game lobby."""
-    def __init__(self, lobby_id: int, ctx: commands.Context):
+    def __init__(self, lobby_id: int, ctx: commands.Context | None = None, game: Game | None = None):
+        """
+        Args:
+            lobby_id: Unique lobby id, also used as the game id
+            ctx: Context of the command that opened the lobby
+            game: Game restored from a snapshot; the lobby starts closed around it
+        """
         self.lobby_id = lobby_id
+        self.host_id = ctx.author.id if ctx else None
         self.players = {} # id -> name
-        self.game = None # Game State Object
+        self.game = game # Game State Object
+        self.snapshots = None # SnapshotStore handed to the game when it starts
+        self.event_log = None # EventStore handed to the game when it starts
+        self.board_mode = False # Play in board mode even if it is not the default, see Board
         self.prev_msg = None
+        self.view = None # Lobby view, reused across edits and stopped when the lobby closes
+        self.update_timer = None # TimerHandle of the pending coalesced message update
+        self.update_requests = 0 # Message updates requested
+        self.rest_calls = 0 # REST calls made for the lobby message
+        self.registry = None # LobbyRegistry tracking this lobby, set on registration
+        self.closed = asyncio.get_event_loop().create_future() # Resolves with the reason the lobby closed
 
-        # Add initial member and send lobby message
-        self.add_player(ctx.author)
+        if game:
+            self.players = {p.id: p.name for p in game.seats if p.id in game.alive_ids} # The dead are free to play elsewhere
+            self.close(START)
+        else:
+            # Add initial member and send lobby message
+            self.add_player(ctx.author)
         
         logger.info(f"Lobby Created: {self}")
     
@@ -28,60 +56,134 @@ class Lobby:
         # Put in first update message
         await self.update_message(ctx)
 
-        # Wait for Game to Start (Handled by repeated update messages)
-        while not self.game:
-            await asyncio.sleep(0.1)
-        
+        # Wait for the lobby to be started, cancelled, emptied or to expire
+        expiry = get_timers().call_later(LOBBY_TIMEOUT, self.close, EXPIRED, name=f"lobby-{self.lobby_id}")
+        try:
+            reason = await asyncio.shield(self.closed)
+        finally:
+            expiry.cancel()
+        logger.info(f"{self} closed: {reason}")
+
         # Put in update message without buttons
         await self.update_message(ctx) # TODO: Change to message saying that lobby has started with lobby id and players
+        logger.info(f"{self} lobby message used {self.rest_calls} REST calls, saved {self.rest_calls_saved()}")
+
+        if reason != START:
+            return None
         
         # Wait for Game to finish, resturn result to Coup.py
         result = await self.game.game_loop(self.prev_msg)
         return result
 
     async def update_message(self, ctx: commands.Context):
+        """Immediately render the lobby message, flushing any pending coalesced update."""
+        self.update_requests += 1
+        if self.update_timer:
+            self.update_timer.cancel()
+        self.update_timer = None
+        await self.render_message(ctx)
+
+    def request_update(self, ctx: commands.Context):
+        """
+        Schedule a lobby message update.
+        Requests made within UPDATE_WINDOW of each other are coalesced into a single edit.
+        """
+        self.update_requests += 1
+        if self.update_timer is None:
+            self.update_timer = get_timers().call_later(UPDATE_WINDOW, self.flush_update, ctx, name=f"lobby-update-{self.lobby_id}")
+
+    async def flush_update(self, ctx: commands.Context):
+        """Render once, at the end of the coalescing window."""
+        self.update_timer = None
+        await self.render_message(ctx)
+
+    async def render_message(self, ctx: commands.Context):
         """
         Create and display the lobby message with current players and buttons.
-        Deletes the previous lobby message if it exists
+        Edits the existing lobby message in place, sending a new one only if it is missing.
         """
-        if not self.game: # Join/Leave/Start Buttons only necessary if game hasn't started yet
-            view = create_lobby_view(self, ctx)
+        if not self.is_closed(): # Join/Leave/Start Buttons only necessary if lobby is still open
+            if not self.view:
+                self.view = create_lobby_view(self, ctx)
+            status = None
         else:
-            view = None
-        embed = create_lobby_embed(self.players) # TODO: Add lobby id to lobby embed
+            # Stop the view so discord.py drops it (and its closures) from the view store
+            if self.view:
+                self.view.stop()
+            self.view = None
+            status = self.closed.result()
+        embed = create_lobby_embed(self.players, status) # TODO: Add lobby id to lobby embed
 
-        # delete the previous lobby message if it exists
+        # Edit the lobby message in place if it exists
         if self.prev_msg:
             try:
-                await self.prev_msg.delete()
-            except:
-                logger.warning(f"{self} could not delete the previous lobby message")
-                pass 
+                self.rest_calls += 1
+                self.prev_msg = await get_outbound().edit(self.prev_msg, embed=embed, view=self.view)
+                return
+            except Exception:
+                logger.warning(f"{self} could not edit the lobby message; sending a new one")
 
         # Send new message and save reference as previous message
-        self.prev_msg = await ctx.send(embed=embed, view=view)
+        self.rest_calls += 1
+        self.prev_msg = await get_outbound().send(ctx, PROMPT, embed=embed, view=self.view)
+
+    def rest_calls_saved(self) -> int:
+        """REST calls avoided compared to deleting and resending the message on every update."""
+        return max(0, (2 * self.update_requests - 1) - self.rest_calls)
     
     def add_player(self, user):
         """Add player to lobby"""
         self.players[user.id] = user.display_name
+        if self.registry:
+            self.registry.on_join(self, user.id)
         logger.info(f"{self} had added {user.id}: {user.display_name}")
 
     def remove_player(self, user):
         """Remove player from lobby"""
         self.players.pop(user.id, None)
+        if self.registry:
+            self.registry.on_leave(self, user.id)
         logger.info(f"{self} had removed {user.id}: {user.display_name}")
     
+    def add_bot(self) -> bool:
+        """Add a computer-controlled player. Returns False if the lobby is full."""
+        if self.is_full():
+            return False
+        bots = [uid for uid in self.players if is_bot_id(uid)]
+        bot_id = -(len(bots) + 1)
+        self.players[bot_id] = BOT_NAMES[len(bots) % len(BOT_NAMES)]
+        logger.info(f"{self} had added bot {bot_id}")
+        return True
+
     def is_full(self):
         return len(self.players) >= 6
 
     def is_empty(self):
-        return len(self.players) == 0
+        """True once no human players are left"""
+        return not any(not is_bot_id(uid) for uid in self.players)
     
     def can_start(self):
         return len(self.players) >= 2
+
+    def is_closed(self):
+        return self.closed.done()
+
+    def close(self, reason: str):
+        """Signal Lobby.run that the lobby has stopped waiting for players"""
+        if not self.closed.done():
+            self.closed.set_result(reason)
+        if self.update_timer: # Lobby.run renders the closed lobby itself
+            self.update_timer.cancel()
+            self.update_timer = None
     
     def create_game(self):
         """Initialize game instance"""
         if not self.can_start():
             logger.error(f"{self} cannot start the game. Not the correct number of players")
-        self.game = Game(self.players)
+        self.game = Game(self.players, game_id=self.lobby_id)
+        self.game.snapshots = self.snapshots
+        self.game.event_log = self.event_log
+        self.game.registry = self.registry
+        if self.board_mode:
+            self.game.board = Board()
+        self.close(START)
@@ -0,0 +1,100 @@
+# mailbox.py
+import time
+import asyncio
+import logging
+from typing import Callable, Awaitable
+
+logger = logging.getLogger("coup")
+
+MAILBOX_SIZE = 64 # Commands a game may have waiting before interactions are turned away
+
+
+class Mailbox:
+    """
+    Command queue drained by a single consumer task.
+    Everything that changes a game (interactions, timer expiries, bot moves)
+    is posted here and run one at a time in arrival order, so no two
+    commands interleave at an await and none is lost to a busy flag.
+    """
+    def __init__(self, name: str = "", maxsize: int = MAILBOX_SIZE):
+        self.name = name
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.task: asyncio.Task | None = None
+
+        # Stats
+        self.processed = 0
+        self.rejected = 0 # post() refused because the queue was full
+        self.failed = 0
+        self.depth_max = 0
+        self.latency_total = 0.0 # Seconds from post to start, summed
+        self.latency_max = 0.0
+        self.busy_total = 0.0 # Seconds spent running commands
+
+    def __repr__(self):
+        return f"<Mailbox {self.name} queued={self.queue.qsize()} processed={self.processed} rejected={self.rejected}>"
+
+    def start(self):
+        """Start the consumer. Commands posted before this wait in the queue."""
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.run(), name=f"coup-mailbox-{self.name}")
+
+    def stop(self):
+        """Cancel the consumer; anything still queued is discarded."""
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    def full(self) -> bool:
+        return self.queue.full()
+
+    def post(self, command: Callable[..., Awaitable], *args) -> bool:
+        """Queue command(*args) without waiting. Returns False (and counts a rejection) if the queue is full."""
+        try:
+            self.queue.put_nowait((time.perf_counter(), command, args))
+        except asyncio.QueueFull:
+            self.rejected += 1
+            logger.warning(f"{self} full; rejected {getattr(command, '__name__', command)}")
+            return False
+        self.depth_max = max(self.depth_max, self.queue.qsize())
+        return True
+
+    async def send(self, command: Callable[..., Awaitable], *args):
+        """Queue command(*args), waiting for room: backpressure for timers and bots, which must not be dropped."""
+        await self.queue.put((time.perf_counter(), command, args))
+        self.depth_max = max(self.depth_max, self.queue.qsize())
+
+    async def run(self):
+        """Consumer: run commands one at a time. A failing command is logged and the next one runs."""
+        while True:
+            posted, command, args = await self.queue.get()
+            started = time.perf_counter()
+            latency = started - posted
+            self.latency_total += latency
+            self.latency_max = max(self.latency_max, latency)
+            try:
+                await command(*args)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failed += 1
+                logger.exception(f"{self} command {getattr(command, '__name__', command)} failed: {e}")
+            finally:
+                self.processed += 1
+                self.busy_total += time.perf_counter() - started
+                self.queue.task_done()
+
+    async def join(self):
+        """Wait until every command posted so far has run."""
+        await self.queue.join()
+
+    def stats(self) -> dict:
+        return {
+            "queued": self.queue.qsize(),
+            "processed": self.processed,
+            "rejected": self.rejected,
+            "failed": self.failed,
+            "depth_max": self.depth_max,
+            "latency_avg_ms": round(self.latency_total / self.processed * 1000, 3) if self.processed else 0.0,
+            "latency_max_ms": round(self.latency_max * 1000, 3),
+            "busy_ms": round(self.busy_total * 1000, 3),
+        }
@@ -0,0 +1,284 @@
+# outbound.py
+import time
+import asyncio
+import logging
+import weakref
+from typing import Awaitable, Callable
+
+logger = logging.getLogger("coup")
+
+# Priorities of outbound REST calls, sooner first. Prompts and log updates of a
+# channel are delivered in the order they were queued: a prompt goes ahead of
+# edits and deletes, never ahead of the log lines describing what it asks about.
+PROMPT = 0 # Interactive messages players are waiting on
+LOG = 1 # Game log updates and turn headers
+EDIT = 2 # Edits of existing messages (lobby refreshes)
+CLEANUP = 3 # Deletes of prompts that are no longer needed
+
+# Client-side rate limit per channel and method: Discord allows about 5 message sends per 5 s per channel
+RATE = 5
+PER = 5.0
+
+SEND = "send"
+EDIT_MESSAGE = "edit"
+DELETE = "delete"
+PIN = "pin"
+
+
+def channel_key(target) -> int:
+    """Id of the channel a Messageable, Context or Message posts to."""
+    channel = getattr(target, "channel", target)
+    return getattr(channel, "id", None) or id(channel)
+
+
+def message_key(message) -> int:
+    return getattr(message, "id", None) or id(message)
+
+
+class TokenBucket:
+    """rate calls per per seconds, refilled continuously."""
+    def __init__(self, rate: int = RATE, per: float = PER, clock=time.monotonic):
+        self.rate = rate
+        self.per = per
+        self.clock = clock
+        self.tokens = float(rate)
+        self.updated = clock()
+
+    def delay(self) -> float:
+        """Seconds until a call may be made, 0 if one may be made now."""
+        now = self.clock()
+        self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate / self.per)
+        self.updated = now
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) * self.per / self.rate
+
+    def take(self):
+        self.tokens -= 1
+
+    def is_full(self) -> bool:
+        self.delay()
+        return self.tokens >= self.rate
+
+
+class Request:
+    """One queued REST call; call is re-assigned when a later edit supersedes it."""
+    __slots__ = ("priority", "seq", "method", "call", "key", "future", "queued")
+
+    def __init__(self, priority: int, seq: int, method: str, call: Callable[[], Awaitable], key, future: asyncio.Future):
+        self.priority = priority
+        self.seq = seq
+        self.method = method
+        self.call = call
+        self.key = key # Message the call edits or deletes
+        self.future = future # Resolves with the call's result once delivered
+        self.queued = time.perf_counter()
+
+    @property
+    def ordered(self) -> bool:
+        """Prompts and log updates, delivered in queue order among themselves."""
+        return self.priority <= LOG
+
+    def __lt__(self, other: "Request"):
+        return (max(self.priority, LOG), self.seq) < (max(other.priority, LOG), other.seq)
+
+
+class ChannelQueue:
+    """Pending calls of one channel, drained by a worker task that exits when the queue is empty."""
+    def __init__(self, key: int, rate: int, per: float):
+        self.key = key
+        self.requests: list[Request] = []
+        self.edits: dict = {} # Message key -> its queued edit, for superseding
+        self.buckets = {method: TokenBucket(rate, per) for method in (SEND, EDIT_MESSAGE, DELETE, PIN)}
+        self.task: asyncio.Task | None = None
+        self.wakeup = asyncio.Event() # Set when a call is queued, to re-check a throttled queue
+        self.idle = asyncio.Event() # Set when nothing is queued or in flight
+        self.idle.set()
+
+    def next(self) -> tuple[Request | None, float]:
+        """
+        The most urgent call whose bucket has room, or None and how long until one does.
+        A throttled prompt or log update holds back the ordered calls queued after it.
+        """
+        wait = None
+        held = False
+        for request in sorted(self.requests):
+            if held and request.ordered:
+                continue
+            delay = self.buckets[request.method].delay()
+            if delay == 0:
+                return request, 0.0
+            held = held or request.ordered
+            wait = delay if wait is None else min(wait, delay)
+        return None, wait or 0.0
+
+
+class OutboundScheduler:
+    """
+    Queue in front of every send, edit and delete the game makes.
+    Calls are queued per channel and delivered in the order the priorities
+    above set, FIFO otherwise, under a client-side rate limit per channel and
+    method. A queued edit is replaced by a later edit of the
+    same message, and dropped if the message is deleted.
+    """
+    def __init__(self, rate: int = RATE, per: float = PER):
+        self.rate = rate
+        self.per = per
+        self.channels: dict[int, ChannelQueue] = {}
+        self.seq = 0
+
+        # Stats
+        self.delivered = 0
+        self.superseded = 0 # Edits replaced by a later edit, or dropped by a delete
+        self.failed = 0
+        self.throttled = 0 # Times a worker waited on a rate limit bucket
+        self.depth_max = 0
+        self.latency_total = 0.0 # Seconds from enqueue to delivery, summed
+        self.latency_max = 0.0
+
+    def __repr__(self):
+        return f"<OutboundScheduler channels={len(self.channels)} queued={self.depth()} delivered={self.delivered}>"
+
+    def send(self, channel, priority: int = LOG, **kwargs) -> asyncio.Future:
+        """Queue channel.send(**kwargs). Await the result for the message, or let it go."""
+        return self.enqueue(channel_key(channel), priority, SEND, lambda: channel.send(**kwargs))
+
+    def edit(self, message, priority: int = EDIT, **kwargs) -> asyncio.Future:
+        """Queue message.edit(**kwargs), replacing an edit of the same message that has not gone out yet."""
+        queue = self.channels.get(channel_key(message))
+        pending = queue.edits.get(message_key(message)) if queue else None
+        if pending is not None:
+            pending.call = lambda: message.edit(**kwargs)
+            pending.priority = min(pending.priority, priority)
+            self.superseded += 1
+            return pending.future
+        return self.enqueue(channel_key(message), priority, EDIT_MESSAGE, lambda: message.edit(**kwargs), message_key(message))
+
+    def delete(self, message, priority: int = CLEANUP) -> asyncio.Future:
+        """Queue message.delete(), dropping queued edits of it."""
+        queue = self.channels.get(channel_key(message))
+        pending = queue.edits.pop(message_key(message), None) if queue else None
+        if pending is not None:
+            queue.requests.remove(pending)
+            pending.future.set_result(None)
+            self.superseded += 1
+        return self.enqueue(channel_key(message), priority, DELETE, message.delete, message_key(message))
+
+    def pin(self, message, priority: int = EDIT) -> asyncio.Future:
+        """Queue message.pin()."""
+        return self.enqueue(channel_key(message), priority, PIN, message.pin, message_key(message))
+
+    def enqueue(self, channel: int, priority: int, method: str, call: Callable[[], Awaitable], message: int | None = None) -> asyncio.Future:
+        queue = self.channels.get(channel)
+        if queue is None:
+            queue = self.channels[channel] = ChannelQueue(channel, self.rate, self.per)
+        self.seq += 1
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(_retrieve)
+        request = Request(priority, self.seq, method, call, message, future)
+        queue.requests.append(request)
+        if method == EDIT_MESSAGE:
+            queue.edits[message] = request
+        self.depth_max = max(self.depth_max, len(queue.requests))
+        queue.idle.clear()
+        queue.wakeup.set()
+        if queue.task is None:
+            queue.task = asyncio.create_task(self.run(queue), name=f"coup-outbound-{channel}")
+        return future
+
+    async def run(self, queue: ChannelQueue):
+        """Worker of one channel: deliver calls until its queue is empty."""
+        try:
+            while queue.requests:
+                request, wait = queue.next()
+                if request is None:
+                    self.throttled += 1
+                    queue.wakeup.clear()
+                    try:
+                        await asyncio.wait_for(queue.wakeup.wait(), wait)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                queue.requests.remove(request)
+                if queue.edits.get(request.key) is request:
+                    del queue.edits[request.key]
+                if request.future.done(): # Cancelled by whoever was waiting on it
+                    continue
+                queue.buckets[request.method].take()
+                try:
+                    result = await request.call()
+                except Exception as e:
+                    self.failed += 1
+                    logger.warning(f"{self}: {request.method} in channel {queue.key} failed: {e}")
+                    if not request.future.done():
+                        request.future.set_exception(e)
+                    continue
+                latency = time.perf_counter() - request.queued
+                self.delivered += 1
+                self.latency_total += latency
+                self.latency_max = max(self.latency_max, latency)
+                if not request.future.done():
+                    request.future.set_result(result)
+        finally:
+            queue.task = None
+            if queue.requests: # Cancelled mid-queue: fail what is left rather than leave it hanging
+                for request in queue.requests:
+                    request.future.cancel()
+                queue.requests.clear()
+                queue.edits.clear()
+            queue.idle.set()
+
+    async def join(self, channel=None):
+        """Wait until everything queued so far for channel (or every channel) has been delivered."""
+        if channel is not None:
+            queue = self.channels.get(channel_key(channel))
+            queues = [queue] if queue else []
+        else:
+            queues = list(self.channels.values())
+        for queue in queues:
+            await queue.idle.wait()
+
+    def stop(self):
+        """Cancel every worker; calls still queued are cancelled."""
+        for queue in list(self.channels.values()):
+            if queue.task:
+                queue.task.cancel()
+
+    def prune(self):
+        """Forget idle channels whose rate limits have fully recovered."""
+        for key, queue in list(self.channels.items()):
+            if queue.task is None and not queue.requests and all(b.is_full() for b in queue.buckets.values()):
+                del self.channels[key]
+
+    def depth(self) -> int:
+        return sum(len(queue.requests) for queue in self.channels.values())
+
+    def stats(self) -> dict:
+        self.prune()
+        return {
+            "queued": self.depth(),
+            "channels": len(self.channels),
+            "delivered": self.delivered,
+            "superseded": self.superseded,
+            "failed": self.failed,
+            "throttled": self.throttled,
+            "depth_max": self.depth_max,
+            "latency_avg_ms": round(self.latency_total / self.delivered * 1000, 3) if self.delivered else 0.0,
+            "latency_max_ms": round(self.latency_max * 1000, 3),
+        }
+
+
+def _retrieve(future: asyncio.Future):
+    """Mark a failure as seen: most calls are never awaited, and the worker already logged it."""
+    if not future.cancelled():
+        future.exception()
+
+
+_schedulers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, OutboundScheduler]" = weakref.WeakKeyDictionary()
+
+
+def get_outbound() -> OutboundScheduler:
+    """The outbound scheduler of the running event loop, shared by every lobby and game on it."""
+    loop = asyncio.get_running_loop()
+    scheduler = _schedulers.get(loop)
+    if scheduler is None:
+        scheduler = _schedulers[loop] = OutboundScheduler()
+    return scheduler
@@ -0,0 +1,207 @@
+# registry.py
+import time
+import logging
+from coup.ai import is_bot_id
+from coup.views.lobby_views import EXPIRED
+from collections import Counter, defaultdict
+
+logger = logging.getLogger("coup")
+
+MAX_LOBBIES = 500 # Lobbies and games open across all guilds
+MAX_LOBBIES_PER_GUILD = 25 # Lobbies and games open in a single guild
+LOBBY_TTL = 20 * 60 # Seconds before an unstarted lobby is expired
+GAME_TTL = 6 * 60 * 60 # Seconds without a human move before a running game is treated as abandoned
+
+
+class RegistryEntry:
+    """Bookkeeping for a single lobby held by the registry."""
+    def __init__(self, lobby, guild_id: int | None, channel_id: int | None, task=None, created: float = 0.0):
+        self.lobby = lobby
+        self.guild_id = guild_id
+        self.channel_id = channel_id
+        self.task = task # Task running the lobby, cancelled on eviction
+        self.created = created
+        self.thread_id = None # Game thread, once the game has started
+
+    def __repr__(self):
+        return f"<RegistryEntry lobby={self.lobby.lobby_id} guild={self.guild_id} channel={self.channel_id}>"
+
+
+class LobbyRegistry:
+    """
+    Bounded registry of open lobbies and running games.
+    Entries are removed when their game finishes, expired on a TTL,
+    and capped per guild and globally.
+    """
+    def __init__(self, max_lobbies: int = MAX_LOBBIES, max_per_guild: int = MAX_LOBBIES_PER_GUILD,
+                 lobby_ttl: float = LOBBY_TTL, game_ttl: float = GAME_TTL, clock=time.monotonic):
+        self.max_lobbies = max_lobbies
+        self.max_per_guild = max_per_guild
+        self.lobby_ttl = lobby_ttl
+        self.game_ttl = game_ttl
+        self.clock = clock
+
+        self.entries: dict[int, RegistryEntry] = {} # Lobby ID -> Entry
+        self.by_guild = defaultdict(set) # Guild ID -> Lobby IDs
+        self.by_channel = defaultdict(set) # Channel ID -> Lobby IDs
+        self.by_user = defaultdict(set) # User ID -> Lobby IDs; at most one while double-joins are refused
+        self.by_thread: dict[int, int] = {} # Game thread ID -> Lobby ID
+        self.evictions = Counter() # Removal reason -> count
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, lobby_id: int):
+        return lobby_id in self.entries
+
+    def __repr__(self):
+        return f"<LobbyRegistry size={len(self)} evictions={dict(self.evictions)}>"
+
+    # -----------------------
+    # Registration
+    # -----------------------
+
+    def check_capacity(self, guild_id: int | None) -> str | None:
+        """Returns a reason a new lobby cannot be opened, or None if there is room."""
+        if len(self.entries) >= self.max_lobbies:
+            self.sweep()
+        if len(self.entries) >= self.max_lobbies:
+            return "Too many games are running right now. Try again later."
+        if guild_id is not None and len(self.by_guild.get(guild_id, ())) >= self.max_per_guild:
+            return "This server has too many open Coup lobbies. Finish or cancel one first."
+        return None
+
+    def add(self, lobby, guild_id: int | None, channel_id: int | None, task=None):
+        """Register a lobby and index its current players."""
+        entry = RegistryEntry(lobby, guild_id, channel_id, task, self.clock())
+        self.entries[lobby.lobby_id] = entry
+        self.by_guild[guild_id].add(lobby.lobby_id)
+        self.by_channel[channel_id].add(lobby.lobby_id)
+        for user_id in lobby.players:
+            if not is_bot_id(user_id):
+                self.by_user[user_id].add(lobby.lobby_id)
+        lobby.registry = self
+        if lobby.game is not None:
+            lobby.game.registry = self
+        logger.info(f"{self} registered {entry}")
+        return entry
+
+    def remove(self, lobby_id: int, reason: str = "finished"):
+        """Drop a lobby and every index that points at it. Returns the entry, if any."""
+        entry = self.entries.pop(lobby_id, None)
+        if not entry:
+            return None
+        self._discard(self.by_guild, entry.guild_id, lobby_id)
+        self._discard(self.by_channel, entry.channel_id, lobby_id)
+        for user_id in entry.lobby.players:
+            self._discard(self.by_user, user_id, lobby_id)
+        if entry.thread_id is not None:
+            self.by_thread.pop(entry.thread_id, None)
+        entry.lobby.registry = None
+        if entry.lobby.game is not None:
+            entry.lobby.game.registry = None
+        self.evictions[reason] += 1
+        logger.info(f"{self} removed lobby {lobby_id}: {reason}")
+        return entry
+
+    def on_join(self, lobby, user_id: int):
+        """Index a player who joined a registered lobby."""
+        if lobby.lobby_id in self.entries:
+            self.by_user[user_id].add(lobby.lobby_id)
+
+    def on_leave(self, lobby, user_id: int):
+        """Remove a player who left a registered lobby from the user index."""
+        self._discard(self.by_user, user_id, lobby.lobby_id)
+
+    def on_thread(self, lobby_id: int, thread_id: int):
+        """Index the thread a registered lobby's game is played in."""
+        entry = self.entries.get(lobby_id)
+        if entry:
+            entry.thread_id = thread_id
+            self.by_thread[thread_id] = lobby_id
+
+    def on_eliminated(self, lobby_id: int, user_id: int):
+        """An eliminated player is free to join another game."""
+        self._discard(self.by_user, user_id, lobby_id)
+
+    @staticmethod
+    def _discard(index: dict, key, lobby_id: int):
+        """Remove lobby_id from index[key], dropping empty buckets so the index stays bounded."""
+        ids = index.get(key)
+        if ids is None:
+            return
+        ids.discard(lobby_id)
+        if not ids:
+            del index[key]
+
+    # -----------------------
+    # Eviction
+    # -----------------------
+
+    def sweep(self) -> list[int]:
+        """
+        Expire unstarted lobbies past their TTL, and games idle past theirs. Returns evicted lobby IDs.
+        Games normally abandon themselves sooner (Game.idle_limit); this is the backstop for one that did not.
+        """
+        now = self.clock()
+        evicted = []
+        for lobby_id, entry in list(self.entries.items()):
+            lobby = entry.lobby
+            game = lobby.game
+            if game is None and now - entry.created >= self.lobby_ttl:
+                lobby.close(EXPIRED)
+                reason = EXPIRED
+            elif game is not None and now - getattr(game, "last_activity", entry.created) >= self.game_ttl:
+                reason = "abandoned"
+                if getattr(game, "snapshots", None): # Or it would be restored on the next startup
+                    game.snapshots.delete(game.game_id)
+            else:
+                continue
+            if entry.task and not entry.task.done():
+                entry.task.cancel()
+            self.remove(lobby_id, reason)
+            evicted.append(lobby_id)
+        if evicted:
+            logger.info(f"{self} swept {len(evicted)} lobbies")
+        return evicted
+
+    # -----------------------
+    # Lookups
+    # -----------------------
+
+    def get(self, lobby_id: int):
+        entry = self.entries.get(lobby_id)
+        return entry.lobby if entry else None
+
+    def lobbies_in_guild(self, guild_id: int) -> list:
+        return [self.entries[i].lobby for i in self.by_guild.get(guild_id, ())]
+
+    def lobbies_in_channel(self, channel_id: int) -> list:
+        return [self.entries[i].lobby for i in self.by_channel.get(channel_id, ())]
+
+    def lobbies_for_user(self, user_id: int) -> list:
+        return [self.entries[i].lobby for i in self.by_user.get(user_id, ())]
+
+    def lobby_of_user(self, user_id: int):
+        """The lobby or game a user is currently playing in, or None."""
+        for lobby_id in self.by_user.get(user_id, ()):
+            return self.entries[lobby_id].lobby
+        return None
+
+    def game_in_thread(self, thread_id: int):
+        """The lobby whose game is played in a thread, or None."""
+        lobby_id = self.by_thread.get(thread_id)
+        return self.entries[lobby_id].lobby if lobby_id is not None else None
+
+    def stats(self) -> dict:
+        """Size and eviction counts for monitoring."""
+        games = sum(1 for e in self.entries.values() if e.lobby.game is not None)
+        return {
+            "size": len(self.entries),
+            "lobbies": len(self.entries) - games,
+            "games": games,
+            "guilds": len(self.by_guild),
+            "users": len(self.by_user),
+            "threads": len(self.by_thread),
+            "evictions": dict(self.evictions),
+        }
@@ -0,0 +1,71 @@
+# response.py
+import os
+import time
+from coup.engine import GameState, Move, ALLOW
+
+RESPONSE_TIMEOUT = int(os.getenv("COUP_RESPONSE_TIMEOUT", 10)) # Seconds a response window stays open
+
+
+class ResponseWindow:
+    """
+    Every reaction to one response window (a challenge or block opportunity).
+    Reactions are buffered as they arrive and resolved together, the same way
+    the simulator offers the window: clockwise from the actor, the first seat
+    that did not pass wins. The window is decided as soon as every seat that
+    could still win has reacted, so it rarely has to wait for its timer.
+    """
+    def __init__(self, version: int, state: GameState, moves: list[Move], timeout: float = RESPONSE_TIMEOUT):
+        self.version = version # Game seq the window belongs to
+        self.timeout = timeout
+        self.actor = state.turn
+        self.size = len(state.players)
+        self.moves: dict[int, list[Move]] = {} # Seat -> its legal reactions
+        for move in moves:
+            if move.seat is not None:
+                self.moves.setdefault(move.seat, []).append(move)
+        self.reactions: dict[int, Move | None] = {} # Seat -> reaction, None for a pass
+        self.opened = time.monotonic()
+        self.deadline = time.time() + timeout # Wall clock, for Discord's relative timestamps
+        self.closed = False
+
+    def __repr__(self):
+        return f"<ResponseWindow version={self.version} reacted={len(self.reactions)}/{len(self.moves)} closed={self.closed}>"
+
+    def order(self, seat: int) -> int:
+        """Priority of a seat's reaction: its distance clockwise from the actor (lower wins)."""
+        return (seat - self.actor) % self.size
+
+    def is_eligible(self, seat: int | None) -> bool:
+        return seat in self.moves
+
+    def has_reacted(self, seat: int | None) -> bool:
+        return seat in self.reactions
+
+    def react(self, seat: int, move: Move | None) -> bool:
+        """Buffer seat's reaction (None to pass). Returns False if it is not eligible, already reacted or illegal."""
+        if self.closed or not self.is_eligible(seat) or self.has_reacted(seat):
+            return False
+        if move is not None and move not in self.moves[seat]:
+            return False
+        self.reactions[seat] = move
+        return True
+
+    def leader(self) -> int | None:
+        """Seat of the winning reaction so far, None if everyone who reacted passed."""
+        acted = [seat for seat, move in self.reactions.items() if move is not None]
+        return min(acted, key=self.order) if acted else None
+
+    def pending(self) -> list[int]:
+        return [seat for seat in self.moves if seat not in self.reactions]
+
+    def is_decided(self) -> bool:
+        """Whether no reaction still to come could change the resolution."""
+        leader = self.leader()
+        if leader is None:
+            return not self.pending()
+        return all(self.order(seat) > self.order(leader) for seat in self.pending())
+
+    def resolution(self) -> Move:
+        """The move the window resolves to: the winning reaction, or ALLOW."""
+        leader = self.leader()
+        return self.reactions[leader] if leader is not None else Move(ALLOW)
@@ -0,0 +1,81 @@
+# supervisor.py
+import asyncio
+import logging
+import weakref
+from typing import Coroutine
+
+logger = logging.getLogger("coup")
+
+
+class TaskSupervisor:
+    """
+    Registry of every background task, future and timer handle a game starts.
+    Each is registered with the state version it was started for (None for
+    the whole game): cancel_stale drops those the game has moved past and
+    cancel_all drops the rest when the game ends, so nothing outlives it.
+    """
+    supervisors: "weakref.WeakSet[TaskSupervisor]" = weakref.WeakSet() # Every live supervisor, for total()
+
+    def __init__(self, name: str = ""):
+        self.name = name
+        self.live: dict = {} # Task, future or TimerHandle -> version it belongs to, None for the whole game
+
+        # Stats
+        self.spawned = 0
+        self.cancelled = 0
+        self.failed = 0
+        TaskSupervisor.supervisors.add(self)
+
+    def __repr__(self):
+        return f"<TaskSupervisor {self.name} live={len(self)}>"
+
+    def __len__(self):
+        self.prune()
+        return len(self.live)
+
+    def spawn(self, coro: Coroutine, version: int | None = None, name: str | None = None) -> asyncio.Task:
+        """Start coro as a task owned by this supervisor."""
+        self.spawned += 1
+        return self.track(asyncio.create_task(coro, name=name), version)
+
+    def track(self, item, version: int | None = None):
+        """Register a task, future or TimerHandle started elsewhere. Returns item."""
+        if item is None or item.cancelled() or (isinstance(item, asyncio.Future) and item.done()):
+            return item
+        self.live[item] = version
+        if isinstance(item, asyncio.Future):
+            item.add_done_callback(self.finished)
+        return item
+
+    def finished(self, future: asyncio.Future):
+        self.live.pop(future, None)
+        if not future.cancelled() and future.exception() is not None:
+            self.failed += 1
+            logger.error(f"{self}: {future} failed", exc_info=future.exception())
+
+    def prune(self):
+        """Drop timer handles that fired; tasks and futures drop themselves when done."""
+        for item in [item for item in self.live if not isinstance(item, asyncio.Future) and item.cancelled()]:
+            del self.live[item]
+
+    def cancel_stale(self, version: int):
+        """Cancel everything started for a version before version."""
+        self.cancel([item for item, v in self.live.items() if v is not None and v < version])
+
+    def cancel_all(self):
+        self.cancel(list(self.live))
+
+    def cancel(self, items: list):
+        for item in items:
+            del self.live[item]
+            if not item.cancelled() and not (isinstance(item, asyncio.Future) and item.done()):
+                item.cancel()
+                self.cancelled += 1
+
+    def stats(self) -> dict:
+        return {"live": len(self), "spawned": self.spawned, "cancelled": self.cancelled, "failed": self.failed}
+
+    @classmethod
+    def total(cls) -> int:
+        """Live tasks, futures and timers across every game, for leak detection."""
+        return sum(len(supervisor) for supervisor in cls.supervisors)
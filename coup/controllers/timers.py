@@ -0,0 +1,152 @@
+# timers.py
+import heapq
+import asyncio
+import inspect
+import logging
+import weakref
+from typing import Callable
+
+logger = logging.getLogger("coup")
+
+
+class TimerHandle:
+    """A scheduled callback; cancel() it to drop it from the service."""
+    __slots__ = ("when", "callback", "args", "name", "service", "_cancelled")
+
+    def __init__(self, when: float, callback: Callable, args: tuple, name: str, service: "TimerService"):
+        self.when = when # Event loop time the callback is due
+        self.callback = callback
+        self.args = args
+        self.name = name
+        self.service = service
+        self._cancelled = False
+
+    def __repr__(self):
+        return f"<TimerHandle {self.name or self.callback.__name__} when={self.when:.3f} cancelled={self._cancelled}>"
+
+    def __lt__(self, other: "TimerHandle"):
+        return self.when < other.when
+
+    def cancel(self):
+        if not self._cancelled:
+            self._cancelled = True
+            self.service.discard(self)
+
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+
+class TimerService:
+    """
+    Every deadline of the cog (response windows, turn timeouts, lobby expiry)
+    in one heap, fired by a single event loop alarm armed for the earliest.
+    Callbacks run on the event loop and should be quick; one that returns an
+    awaitable has it run as a task.
+    """
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.heap: list[TimerHandle] = []
+        self.alarm: asyncio.TimerHandle | None = None # Loop callback for the earliest deadline
+        self.alarm_at: float | None = None
+        self.tasks: set[asyncio.Task] = set() # Tasks started by callbacks, kept alive until done
+        self.pending = 0 # Scheduled and not yet fired or cancelled
+
+        # Stats
+        self.scheduled = 0
+        self.fired = 0
+        self.cancelled = 0
+        self.failed = 0
+        self.jitter_total = 0.0 # Seconds callbacks ran after they were due, summed
+        self.jitter_max = 0.0
+
+    def __repr__(self):
+        return f"<TimerService pending={self.pending} fired={self.fired} cancelled={self.cancelled}>"
+
+    def call_later(self, delay: float, callback: Callable, *args, name: str = "") -> TimerHandle:
+        return self.call_at(self.loop.time() + delay, callback, *args, name=name)
+
+    def call_at(self, when: float, callback: Callable, *args, name: str = "") -> TimerHandle:
+        """Run callback(*args) at event loop time when."""
+        handle = TimerHandle(when, callback, args, name, self)
+        heapq.heappush(self.heap, handle)
+        self.pending += 1
+        self.scheduled += 1
+        if self.alarm_at is None or when < self.alarm_at:
+            self.arm(when)
+        return handle
+
+    def discard(self, handle: TimerHandle):
+        """Called by TimerHandle.cancel. The entry is dropped lazily, or on compaction once most are dead."""
+        self.pending -= 1
+        self.cancelled += 1
+        if len(self.heap) > 64 and len(self.heap) > 2 * self.pending:
+            self.heap = [h for h in self.heap if not h._cancelled]
+            heapq.heapify(self.heap)
+
+    def arm(self, when: float):
+        if self.alarm:
+            self.alarm.cancel()
+        self.alarm = self.loop.call_at(when, self.fire)
+        self.alarm_at = when
+
+    def fire(self):
+        """Run every callback that is due, then re-arm for the next deadline."""
+        self.alarm = self.alarm_at = None
+        now = self.loop.time()
+        while self.heap and self.heap[0].when <= now:
+            handle = heapq.heappop(self.heap)
+            if handle._cancelled:
+                continue
+            handle._cancelled = True # Fired; a late cancel() is a no-op
+            self.pending -= 1
+            self.fired += 1
+            jitter = now - handle.when
+            self.jitter_total += jitter
+            self.jitter_max = max(self.jitter_max, jitter)
+            try:
+                result = handle.callback(*handle.args)
+                if inspect.isawaitable(result):
+                    task = asyncio.ensure_future(result)
+                    self.tasks.add(task)
+                    task.add_done_callback(self.tasks.discard)
+            except Exception as e:
+                self.failed += 1
+                logger.exception(f"{handle} failed: {e}")
+        while self.heap and self.heap[0]._cancelled:
+            heapq.heappop(self.heap)
+        if self.heap:
+            self.arm(self.heap[0].when)
+
+    def stop(self):
+        """Drop every pending timer."""
+        if self.alarm:
+            self.alarm.cancel()
+        self.alarm = self.alarm_at = None
+        for handle in self.heap:
+            handle._cancelled = True
+        self.cancelled += self.pending
+        self.heap.clear()
+        self.pending = 0
+
+    def stats(self) -> dict:
+        return {
+            "pending": self.pending,
+            "scheduled": self.scheduled,
+            "fired": self.fired,
+            "cancelled": self.cancelled,
+            "failed": self.failed,
+            "jitter_avg_ms": round(self.jitter_total / self.fired * 1000, 3) if self.fired else 0.0,
+            "jitter_max_ms": round(self.jitter_max * 1000, 3),
+        }
+
+
+_services: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, TimerService]" = weakref.WeakKeyDictionary()
+
+
+def get_timers() -> TimerService:
+    """The timer service of the running event loop, shared by every lobby and game on it."""
+    loop = asyncio.get_running_loop()
+    service = _services.get(loop)
+    if service is None:
+        service = _services[loop] = TimerService(loop)
+    return service
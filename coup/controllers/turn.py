@@ -0,0 +1,115 @@
+# turn.py
+"""
+Turn state machine of the Discord adapter.
+
+The engine's apply() is the transition function: pure and synchronous, it
+resolves a move and everything that follows from it (challenges, lost
+influence, the action itself) in one step. This module maps each state the
+game can wait in to what has to happen outside the engine, as a list of
+Effects for Game to perform after the transition.
+"""
+import os
+from typing import NamedTuple, Callable, Optional
+from coup.engine import (
+    GameState, Move, ALLOW,
+    ACTION, RESPONSE, BLOCK_RESPONSE, LOSE_INFLUENCE,
+    EXCHANGE, EXAMINE_REVEAL, EXAMINE_DECIDE, GAME_OVER,
+)
+
+# Turn steps: what the game is waiting on
+AWAIT_ACTION = "await_action" # Current player picks an action
+AWAIT_TARGET = "await_target" # Current player picked a targeted action and picks its target
+RESPONSE_WINDOW = "response_window" # Others may challenge or block the action, or challenge the block
+AWAIT_INFLUENCE_LOSS = "await_influence_loss" # A player picks the influence they lose
+AWAIT_EXCHANGE = "await_exchange" # Actor picks a card to return after Exchange
+AWAIT_REVEAL = "await_reveal" # Target picks a card to show the Examiner
+AWAIT_SWAP = "await_swap" # Examiner decides whether the shown card is swapped
+FINISHED = "finished"
+
+# Seconds a player has for each decision before the default move is made for them
+# (see engine.default_move). Configurable through the environment (.env). Blocks,
+# and the role a block claims, are picked inside the response window and share its timeout.
+DECISION_TIMEOUTS = {
+    AWAIT_ACTION: float(os.getenv("COUP_ACTION_TIMEOUT", 120)), # Income
+    AWAIT_TARGET: float(os.getenv("COUP_TARGET_TIMEOUT", 60)), # Income
+    AWAIT_INFLUENCE_LOSS: float(os.getenv("COUP_CHOICE_TIMEOUT", 60)), # Random influence
+    AWAIT_EXCHANGE: float(os.getenv("COUP_CHOICE_TIMEOUT", 60)), # Random card returned
+    AWAIT_REVEAL: float(os.getenv("COUP_CHOICE_TIMEOUT", 60)), # Random card shown
+    AWAIT_SWAP: float(os.getenv("COUP_SWAP_TIMEOUT", 60)), # Keep
+}
+
+# Effect kinds
+UPDATE = "update" # Public log line
+TURN_START = "turn_start" # Start of turn message with the Check Hand button
+RENDER_ACTION = "render_action"
+RENDER_TARGET = "render_target"
+RENDER_RESPONSE = "render_response"
+RENDER_PROMPT = "render_prompt" # Card choice prompt; args (seat, mode)
+RENDER_SWAP = "render_swap"
+# Local effects, performed as soon as they are produced
+BOTS = "bots" # Start searches for bot seats with a decision
+END_TURN = "end_turn" # Let the game loop start the next turn (or end the game)
+
+# Effects that render a decision; skipped if the game moved on before they ran
+INTERACTIVE = frozenset({RENDER_ACTION, RENDER_TARGET, RENDER_RESPONSE, RENDER_PROMPT, RENDER_SWAP})
+
+
+class Effect(NamedTuple):
+    """A side effect of a transition, made at state version (seq) version."""
+    kind: str
+    version: int
+    args: tuple = ()
+
+
+class Step(NamedTuple):
+    """How the game waits in an engine phase."""
+    name: str
+    render: Optional[str] # Effect kind that asks for the decision
+    mode: Optional[str] = None # Prompt mode for RENDER_PROMPT
+    seat: Optional[Callable[[GameState], int]] = None # Who is prompted for RENDER_PROMPT
+
+
+STEPS = {
+    ACTION: Step(AWAIT_ACTION, RENDER_ACTION),
+    RESPONSE: Step(RESPONSE_WINDOW, RENDER_RESPONSE),
+    BLOCK_RESPONSE: Step(RESPONSE_WINDOW, RENDER_RESPONSE),
+    LOSE_INFLUENCE: Step(AWAIT_INFLUENCE_LOSS, RENDER_PROMPT, "lose", lambda state: state.losses[0]),
+    EXCHANGE: Step(AWAIT_EXCHANGE, RENDER_PROMPT, "return", lambda state: state.turn),
+    EXAMINE_REVEAL: Step(AWAIT_REVEAL, RENDER_PROMPT, "examine", lambda state: state.target),
+    EXAMINE_DECIDE: Step(AWAIT_SWAP, RENDER_SWAP),
+    GAME_OVER: Step(FINISHED, None),
+}
+
+
+def step_of(state: GameState) -> str:
+    return STEPS[state.phase].name
+
+
+def begin_turn(state: GameState, version: int) -> list[Effect]:
+    """Effects that open a turn, or re-open a decision after a restart."""
+    return [Effect(TURN_START, version)] + _prompt(state, STEPS[state.phase], version)
+
+
+def after_move(move: Move, after: GameState, log: list[str], version: int) -> list[Effect]:
+    """
+    Effects of a move that left the game in state after, at version.
+    log holds the public lines for the move's events, in order.
+    """
+    effects = []
+    if move.kind == ALLOW:
+        effects.append(Effect(UPDATE, version, ("No one responded. Proceeding...",)))
+    effects.extend(Effect(UPDATE, version, (line,)) for line in log)
+    if after.phase in (ACTION, GAME_OVER):
+        effects.append(Effect(END_TURN, version))
+        return effects
+    return effects + _prompt(after, STEPS[after.phase], version)
+
+
+def select_target(action: type, version: int) -> list[Effect]:
+    """Effects of the current player picking a targeted action (AWAIT_ACTION -> AWAIT_TARGET)."""
+    return [Effect(RENDER_TARGET, version, (action,))]
+
+
+def _prompt(state: GameState, step: Step, version: int) -> list[Effect]:
+    args = (step.seat(state), step.mode) if step.render == RENDER_PROMPT else ()
+    return [Effect(step.render, version, args), Effect(BOTS, version)]
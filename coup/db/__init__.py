@@ -0,0 +1,11 @@
+from .writer import DatabaseWriter, connect, DB_PATH
+from .snapshots import SnapshotStore, Snapshot
+from .history import GameHistory
+from .stats import StatsStore, LRUCache, rating_changes
+from .events import EventStore, Replay, ReplayError
+
+__all__ = ["DatabaseWriter", "connect", "DB_PATH",
+           "SnapshotStore", "Snapshot",
+           "GameHistory",
+           "StatsStore", "LRUCache", "rating_changes",
+           "EventStore", "Replay", "ReplayError"]
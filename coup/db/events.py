@@ -0,0 +1,162 @@
+# events.py
+import json
+import logging
+from coup.engine import (
+    GameState, PackedState, Move, apply,
+    move_rng, encode_move, decode_move, encode_events, decode_events,
+)
+from .writer import DatabaseWriter
+
+logger = logging.getLogger("coup")
+
+CHECKPOINT_INTERVAL = 16 # Moves between stored states; bounds the moves a replay re-applies
+
+SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS event_games (
+        game_id INTEGER PRIMARY KEY,
+        seed INTEGER NOT NULL,
+        players TEXT NOT NULL, -- JSON [[id, name], ...] in seat order
+        started REAL NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS event_log (
+        game_id INTEGER NOT NULL,
+        seq INTEGER NOT NULL,   -- 1 for the first move
+        turn INTEGER NOT NULL,  -- Turn count the move was made in
+        move BLOB NOT NULL,     -- encode_move
+        events BLOB NOT NULL,   -- encode_events
+        PRIMARY KEY (game_id, seq)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS event_checkpoints (
+        game_id INTEGER NOT NULL,
+        seq INTEGER NOT NULL,   -- State after this many moves
+        turn INTEGER NOT NULL,
+        record BLOB NOT NULL,   -- PackedState record
+        PRIMARY KEY (game_id, seq)
+    ) WITHOUT ROWID
+    """,
+)
+
+
+class ReplayError(Exception):
+    """Replaying the log did not reproduce the events that were recorded."""
+
+
+class Replay:
+    """A game state rebuilt from the event log."""
+    def __init__(self, game_id: int, seq: int, state: GameState, players: list[tuple[int, str]], applied: int):
+        self.game_id = game_id
+        self.seq = seq # Moves applied to reach state
+        self.state = state
+        self.players = players
+        self.applied = applied # Moves re-applied after the checkpoint
+
+    def __repr__(self):
+        return f"<Replay game={self.game_id} seq={self.seq} turn={self.state.turn_count} applied={self.applied}>"
+
+
+class EventStore:
+    """
+    Append-only log of every move a game makes, with the engine events it produced.
+    Moves are applied with move_rng(seed, seq), so the log plus periodic state
+    checkpoints reproduce any point of the game exactly.
+    """
+    def __init__(self, writer: DatabaseWriter, interval: int = CHECKPOINT_INTERVAL):
+        self.writer = writer
+        self.writer.add_schema(*SCHEMA)
+        self.interval = interval
+        self.appended = 0
+
+    def __repr__(self):
+        return f"<EventStore appended={self.appended}>"
+
+    # -----------------------
+    # Appending (never blocks)
+    # -----------------------
+
+    def start(self, game):
+        """Record a new game's seed, seats and initial state."""
+        row = (game.game_id, game.seed, json.dumps([[p.id, p.name] for p in game.seats]), game.started)
+        checkpoint = (game.game_id, game.state.turn_count, PackedState.from_state(game.state).record)
+        def write(conn):
+            conn.execute("INSERT OR REPLACE INTO event_games VALUES (?, ?, ?, ?)", row)
+            conn.execute("INSERT OR REPLACE INTO event_checkpoints VALUES (?, 0, ?, ?)", checkpoint)
+        self.writer.submit(write)
+
+    def append(self, game_id: int, seq: int, move: Move, events: list[tuple], before: GameState, after: GameState):
+        """Append the seq-th move of a game; every interval moves the resulting state is checkpointed too."""
+        self.appended += 1
+        row = (game_id, seq, before.turn_count, encode_move(move), encode_events(events))
+        checkpoint = None
+        if seq % self.interval == 0:
+            checkpoint = (game_id, seq, after.turn_count, PackedState.from_state(after).record)
+        def write(conn):
+            conn.execute("INSERT OR REPLACE INTO event_log VALUES (?, ?, ?, ?, ?)", row)
+            if checkpoint:
+                conn.execute("INSERT OR REPLACE INTO event_checkpoints VALUES (?, ?, ?, ?)", checkpoint)
+        self.writer.submit(write)
+
+    # -----------------------
+    # Reading (blocking: call through asyncio.to_thread)
+    # -----------------------
+
+    def last_game_id(self) -> int:
+        """Highest game id logged so far, 0 if none."""
+        return self.writer.read(lambda conn: conn.execute(
+            "SELECT COALESCE(MAX(game_id), 0) FROM event_games"
+        ).fetchone()[0])
+
+    def moves(self, game_id: int, after: int = 0, until: int | None = None, before_turn: int | None = None) -> list[tuple]:
+        """Logged (seq, turn, Move, events) of a game with after < seq <= until, made before turn before_turn."""
+        rows = self.writer.read(lambda conn: conn.execute(
+            "SELECT seq, turn, move, events FROM event_log "
+            "WHERE game_id = ? AND seq > ? AND seq <= ? AND turn < ? ORDER BY seq",
+            (game_id, after, until if until is not None else 2 ** 62, before_turn if before_turn is not None else 2 ** 62)
+        ).fetchall())
+        return [(seq, turn, decode_move(move), decode_events(events)) for seq, turn, move, events in rows]
+
+    def replay(self, game_id: int, seq: int | None = None, turn: int | None = None, verify: bool = True) -> Replay:
+        """
+        Rebuild the state of a game after seq moves, or at the start of turn,
+        or at the end of the log if neither is given. Starts from the nearest
+        earlier checkpoint, so at most interval moves are re-applied.
+        With verify, raises ReplayError if a move does not reproduce its logged events.
+        """
+        def load(conn):
+            game = conn.execute("SELECT seed, players FROM event_games WHERE game_id = ?", (game_id,)).fetchone()
+            if game is None:
+                return None
+            if seq is not None:
+                where, bound = "seq <= ?", seq
+            elif turn is not None:
+                where, bound = "(turn < ? OR seq = 0)", turn
+            else:
+                where, bound = "1", None
+            params = (game_id,) if bound is None else (game_id, bound)
+            checkpoint = conn.execute(
+                f"SELECT seq, record FROM event_checkpoints WHERE game_id = ? AND {where} ORDER BY seq DESC LIMIT 1",
+                params,
+            ).fetchone()
+            return game, checkpoint
+
+        loaded = self.writer.read(load)
+        if loaded is None:
+            raise KeyError(f"No event log for game {game_id}")
+        (seed, players), (start, record) = loaded
+        players = [tuple(p) for p in json.loads(players)]
+        state = PackedState(bytes(record), tuple(p[0] for p in players)).to_state()
+
+        position = start
+        applied = 0
+        for logged_seq, _, move, events in self.moves(game_id, after=start, until=seq, before_turn=turn):
+            replayed = []
+            state = apply(state, move, move_rng(seed, logged_seq), replayed)
+            if verify and replayed != events:
+                raise ReplayError(f"Game {game_id} move {logged_seq} replayed {replayed}, logged {events}")
+            position = logged_seq
+            applied += 1
+        return Replay(game_id, position, state, players, applied)
@@ -0,0 +1,103 @@
+# history.py
+import json
+import logging
+from coup.ai import is_bot_id
+from coup.engine import GameResult
+from .writer import DatabaseWriter
+
+logger = logging.getLogger("coup")
+
+SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS games (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        lobby_id INTEGER NOT NULL,
+        guild_id INTEGER,
+        channel_id INTEGER,
+        started REAL NOT NULL,
+        ended REAL NOT NULL,
+        turns INTEGER NOT NULL,
+        players INTEGER NOT NULL,
+        winner_id INTEGER,
+        actions TEXT NOT NULL -- JSON {action name: count}
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS game_players (
+        game_id INTEGER NOT NULL REFERENCES games(id),
+        user_id INTEGER NOT NULL,
+        name TEXT NOT NULL,
+        seat INTEGER NOT NULL,
+        placement INTEGER NOT NULL,
+        eliminated_turn INTEGER,
+        is_bot INTEGER NOT NULL,
+        actions TEXT NOT NULL, -- JSON {action name: count}
+        bluffs INTEGER NOT NULL,
+        bluffs_caught INTEGER NOT NULL,
+        challenges_won INTEGER NOT NULL,
+        challenges_lost INTEGER NOT NULL,
+        PRIMARY KEY (game_id, user_id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS games_by_guild ON games (guild_id, ended)",
+    "CREATE INDEX IF NOT EXISTS games_by_winner ON games (winner_id, ended)",
+    "CREATE INDEX IF NOT EXISTS game_players_by_user ON game_players (user_id, game_id)",
+)
+
+
+class GameHistory:
+    """
+    Archive of finished games.
+    record() only queues the result; the writer thread inserts it alongside
+    other queued writes in a single transaction.
+    """
+    def __init__(self, writer: DatabaseWriter):
+        self.writer = writer
+        self.writer.add_schema(*SCHEMA)
+        self.hooks = [] # Callables run with (conn, game row id, result) in the insert's transaction
+        self.recorded = 0
+
+    def __repr__(self):
+        return f"<GameHistory recorded={self.recorded}>"
+
+    def record(self, result: GameResult) -> bool:
+        """Queue a finished game for insertion. Never blocks; returns False if the write was dropped."""
+        self.recorded += 1
+        return self.writer.submit(lambda conn: self._insert(conn, result))
+
+    def _insert(self, conn, result: GameResult):
+        cursor = conn.execute(
+            "INSERT INTO games (lobby_id, guild_id, channel_id, started, ended, turns, players, winner_id, actions) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (result.game_id, result.guild_id, result.channel_id, result.started, result.ended, result.turns,
+             len(result.players), result.winner_id, json.dumps(result.action_counts())),
+        )
+        row_id = cursor.lastrowid
+        conn.executemany(
+            "INSERT INTO game_players VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (row_id, p.id, p.name, p.seat, p.placement, p.eliminated_turn, is_bot_id(p.id),
+                 json.dumps(p.actions), p.bluffs, p.bluffs_caught, p.challenges_won, p.challenges_lost)
+                for p in result.players
+            ],
+        )
+        for hook in self.hooks:
+            hook(conn, row_id, result)
+
+    # -----------------------
+    # Queries (blocking: call through asyncio.to_thread)
+    # -----------------------
+
+    def games_for_user(self, user_id: int, limit: int = 10) -> list[tuple]:
+        """Most recent games of a user as (game row id, ended, placement, players) tuples."""
+        return self.writer.read(lambda conn: conn.execute(
+            "SELECT g.id, g.ended, p.placement, g.players FROM game_players p JOIN games g ON g.id = p.game_id "
+            "WHERE p.user_id = ? ORDER BY p.game_id DESC LIMIT ?", (user_id, limit)
+        ).fetchall())
+
+    def games_in_guild(self, guild_id: int, limit: int = 10) -> list[tuple]:
+        """Most recent games of a guild as (game row id, ended, winner id, turns) tuples."""
+        return self.writer.read(lambda conn: conn.execute(
+            "SELECT id, ended, winner_id, turns FROM games WHERE guild_id = ? ORDER BY ended DESC LIMIT ?",
+            (guild_id, limit)
+        ).fetchall())
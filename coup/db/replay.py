@@ -0,0 +1,58 @@
+# replay.py
+"""
+Rebuild a logged game from the event log, without Discord.
+
+Examples:
+    python -m coup.db.replay 42                 # final state of game 42
+    python -m coup.db.replay 42 --turn 7        # state at the start of turn 7
+    python -m coup.db.replay 42 --seq 30 --log  # state after 30 moves, plus every move
+"""
+import time
+import argparse
+from .writer import DatabaseWriter, DB_PATH
+from .events import EventStore
+
+
+def describe_state(state, players) -> str:
+    names = dict(players)
+    lines = [f"turn {state.turn_count}, phase {state.phase}, {names[state.players[state.turn].id]} to act"]
+    for player in state.players:
+        hand = ", ".join(player.hand) or "eliminated"
+        lines.append(f"  {names[player.id]:<20} {player.coins:>2} coins  {hand}")
+    lines.append(f"  deck: {len(state.deck)} cards, revealed: {', '.join(state.revealed) or 'none'}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("game_id", type=int)
+    parser.add_argument("--db", default=DB_PATH)
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--turn", type=int, help="replay to the start of this turn")
+    target.add_argument("--seq", type=int, help="replay this many moves")
+    parser.add_argument("--log", action="store_true", help="also print every logged move and its events")
+    args = parser.parse_args()
+
+    writer = DatabaseWriter(args.db)
+    store = EventStore(writer)
+    writer.start()
+    try:
+        start = time.perf_counter()
+        replay = store.replay(args.game_id, seq=args.seq, turn=args.turn)
+        elapsed = time.perf_counter() - start
+
+        if args.log:
+            names = dict(replay.players)
+            for seq, turn, move, events in store.moves(args.game_id, until=replay.seq):
+                who = names[replay.state.players[move.seat].id] if move.seat is not None else "-"
+                print(f"{seq:>4} turn {turn:>3} {who:<20} {move.kind} {move.action.name if move.action else ''}")
+                for event in events:
+                    print(f"{'':>10}{event[0]} {' '.join(str(getattr(v, 'name', v)) for v in event[1:])}")
+        print(describe_state(replay.state, replay.players))
+        print(f"{replay}: {replay.applied} moves re-applied in {elapsed * 1000:.2f} ms, events verified")
+    finally:
+        writer.stop()
+
+
+if __name__ == "__main__":
+    main()
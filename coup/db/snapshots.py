@@ -0,0 +1,115 @@
+# snapshots.py
+import json
+import time
+import logging
+import threading
+from coup.engine import PackedState
+from .writer import DatabaseWriter
+
+logger = logging.getLogger("coup")
+
+SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS snapshots (
+        game_id INTEGER PRIMARY KEY,
+        guild_id INTEGER,
+        channel_id INTEGER,
+        thread_id INTEGER NOT NULL,
+        players TEXT NOT NULL,  -- JSON [[id, name], ...] in seat order
+        record BLOB NOT NULL,   -- PackedState record
+        seed INTEGER NOT NULL,  -- Game.seed, so moves after a restore use the same rngs
+        seq INTEGER NOT NULL,   -- Moves applied so far
+        started REAL NOT NULL,
+        updated REAL NOT NULL
+    )
+    """,
+)
+
+
+class Snapshot:
+    """A checkpointed in-flight game, as loaded at startup."""
+    def __init__(self, game_id: int, guild_id: int | None, channel_id: int | None, thread_id: int,
+                 players: list[tuple[int, str]], packed: PackedState, seed: int, seq: int, started: float,
+                 updated: float):
+        self.game_id = game_id
+        self.guild_id = guild_id
+        self.channel_id = channel_id
+        self.thread_id = thread_id
+        self.players = players
+        self.packed = packed
+        self.seed = seed
+        self.seq = seq
+        self.started = started
+        self.updated = updated
+
+    def __repr__(self):
+        return f"<Snapshot game={self.game_id} thread={self.thread_id} players={len(self.players)}>"
+
+
+class SnapshotStore:
+    """
+    Checkpoints in-flight games to SQLite through the write-behind writer.
+    Consecutive checkpoints of the same game are coalesced: only the newest is written.
+    """
+    def __init__(self, writer: DatabaseWriter):
+        self.writer = writer
+        self.writer.add_schema(*SCHEMA)
+        self.pending: dict[int, tuple] = {} # Game ID -> newest unwritten row
+        self.lock = threading.Lock()
+        self.checkpoints = 0
+        self.coalesced = 0
+
+    def __repr__(self):
+        return f"<SnapshotStore checkpoints={self.checkpoints} coalesced={self.coalesced}>"
+
+    def checkpoint(self, game):
+        """Queue the current state of a game. Cheap enough to call after every move."""
+        thread = game.game_thread
+        if thread is None:
+            return
+        guild = getattr(thread, "guild", None)
+        row = (
+            game.game_id,
+            guild.id if guild else None,
+            getattr(thread, "parent_id", None),
+            thread.id,
+            json.dumps([[p.id, p.name] for p in game.seats]),
+            game.snapshot().record,
+            game.seed,
+            game.seq,
+            game.started,
+            time.time(),
+        )
+        self.checkpoints += 1
+        with self.lock:
+            queued = game.game_id in self.pending
+            self.pending[game.game_id] = row
+        if queued:
+            self.coalesced += 1
+            return
+        self.writer.submit(lambda conn, game_id=game.game_id: self._write(conn, game_id))
+
+    def _write(self, conn, game_id: int):
+        with self.lock:
+            row = self.pending.pop(game_id, None)
+        if row is None:
+            return
+        conn.execute("INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", row)
+
+    def delete(self, game_id: int):
+        """Forget a game once it has finished."""
+        with self.lock:
+            self.pending.pop(game_id, None)
+        self.writer.submit(lambda conn: conn.execute("DELETE FROM snapshots WHERE game_id = ?", (game_id,)))
+
+    def load_all(self) -> list[Snapshot]:
+        """Read every checkpointed game. Blocking: call through asyncio.to_thread."""
+        rows = self.writer.read(lambda conn: conn.execute(
+            "SELECT game_id, guild_id, channel_id, thread_id, players, record, seed, seq, started, updated FROM snapshots"
+        ).fetchall())
+        snapshots = []
+        for game_id, guild_id, channel_id, thread_id, players, record, seed, seq, started, updated in rows:
+            players = [tuple(p) for p in json.loads(players)]
+            packed = PackedState(bytes(record), tuple(p[0] for p in players))
+            snapshots.append(Snapshot(game_id, guild_id, channel_id, thread_id, players, packed, seed, seq, started, updated))
+        return snapshots
@@ -0,0 +1,227 @@
+# stats.py
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from coup.ai import is_bot_id
+from coup.engine import GameResult
+from .history import GameHistory
+
+logger = logging.getLogger("coup")
+
+GLOBAL = 0 # guild_id of the all-servers scope
+START_RATING = 1500.0
+BOT_RATING = 1500.0 # Bots are rated opponents but are not ranked themselves
+K_FACTOR = 32.0
+CACHE_SIZE = 1024 # Stats and leaderboards kept in memory
+TOP_ACTIONS = 3
+
+SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS user_stats (
+        guild_id INTEGER NOT NULL, -- GLOBAL for all servers
+        user_id INTEGER NOT NULL,
+        name TEXT NOT NULL,
+        games INTEGER NOT NULL DEFAULT 0,
+        wins INTEGER NOT NULL DEFAULT 0,
+        bluffs INTEGER NOT NULL DEFAULT 0,
+        bluffs_caught INTEGER NOT NULL DEFAULT 0,
+        challenges_won INTEGER NOT NULL DEFAULT 0,
+        challenges_lost INTEGER NOT NULL DEFAULT 0,
+        rating REAL NOT NULL,
+        PRIMARY KEY (guild_id, user_id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS user_actions (
+        guild_id INTEGER NOT NULL,
+        user_id INTEGER NOT NULL,
+        action TEXT NOT NULL,
+        count INTEGER NOT NULL,
+        PRIMARY KEY (guild_id, user_id, action)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS user_stats_by_rating ON user_stats (guild_id, rating DESC)",
+)
+
+
+def rating_changes(ratings: list[float], placements: list[int], k: float = K_FACTOR) -> list[float]:
+    """
+    Multiplayer Elo: every pair of players is scored as a game between the two,
+    the better placement winning. Changes are scaled by k / (n - 1).
+    """
+    n = len(ratings)
+    scale = k / (n - 1)
+    changes = []
+    for i in range(n):
+        delta = 0.0
+        for j in range(n):
+            if i == j:
+                continue
+            expected = 1 / (1 + 10 ** ((ratings[j] - ratings[i]) / 400))
+            score = 1.0 if placements[i] < placements[j] else 0.0 if placements[i] > placements[j] else 0.5
+            delta += score - expected
+        changes.append(scale * delta)
+    return changes
+
+
+class LRUCache:
+    """
+    Thread-safe least-recently-used cache.
+    A value loaded while any invalidation happened is not stored, so a load
+    racing a stats update can never cache the old numbers.
+    """
+    def __init__(self, maxsize: int = CACHE_SIZE):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.generation = 0 # Bumped by every invalidation
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __repr__(self):
+        return f"<LRUCache size={len(self)}/{self.maxsize} hits={self.hits} misses={self.misses}>"
+
+    def get(self, key):
+        """Returns (found, value, generation); pass generation back to put()."""
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return True, self.entries[key], self.generation
+            self.misses += 1
+            return False, None, self.generation
+
+    def put(self, key, value, generation: int):
+        with self.lock:
+            if generation != self.generation:
+                return
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, predicate):
+        """Drop every cached key matching predicate."""
+        with self.lock:
+            self.generation += 1
+            for key in [k for k in self.entries if predicate(k)]:
+                del self.entries[key]
+
+
+class StatsStore:
+    """
+    Per-user and per-guild aggregates, updated in the same transaction that archives
+    each finished game, so reads never scan the game history.
+    """
+    def __init__(self, history: GameHistory, cache_size: int = CACHE_SIZE):
+        self.writer = history.writer
+        self.writer.add_schema(*SCHEMA)
+        history.hooks.append(self._apply)
+        self.cache = LRUCache(cache_size)
+
+    def __repr__(self):
+        return f"<StatsStore cache={self.cache}>"
+
+    # -----------------------
+    # Incremental updates (writer thread)
+    # -----------------------
+
+    def _apply(self, conn, game_row_id: int, result: GameResult):
+        humans = [p for p in result.players if not is_bot_id(p.id)]
+        if not humans:
+            return
+        scopes = [GLOBAL] if result.guild_id is None else [GLOBAL, result.guild_id]
+        for scope in scopes:
+            self._apply_scope(conn, scope, result)
+        ids = {p.id for p in humans}
+        self.cache.invalidate(lambda key: key[1] in scopes and (key[0] == "board" or key[2] in ids))
+
+    def _apply_scope(self, conn, scope: int, result: GameResult):
+        ids = [p.id for p in result.players if not is_bot_id(p.id)]
+        rows = conn.execute(
+            f"SELECT user_id, rating FROM user_stats WHERE guild_id = ? AND user_id IN ({','.join('?' * len(ids))})",
+            (scope, *ids),
+        ).fetchall()
+        current = dict(rows)
+        ratings = [BOT_RATING if is_bot_id(p.id) else current.get(p.id, START_RATING) for p in result.players]
+        changes = rating_changes(ratings, [p.placement for p in result.players])
+
+        for player, rating, change in zip(result.players, ratings, changes):
+            if is_bot_id(player.id):
+                continue
+            conn.execute(
+                """
+                INSERT INTO user_stats (guild_id, user_id, name, games, wins, bluffs, bluffs_caught,
+                                        challenges_won, challenges_lost, rating)
+                VALUES (?, ?, ?, 1, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (guild_id, user_id) DO UPDATE SET
+                    name = excluded.name,
+                    games = games + 1,
+                    wins = wins + excluded.wins,
+                    bluffs = bluffs + excluded.bluffs,
+                    bluffs_caught = bluffs_caught + excluded.bluffs_caught,
+                    challenges_won = challenges_won + excluded.challenges_won,
+                    challenges_lost = challenges_lost + excluded.challenges_lost,
+                    rating = excluded.rating
+                """,
+                (scope, player.id, player.name, int(player.placement == 1), player.bluffs, player.bluffs_caught,
+                 player.challenges_won, player.challenges_lost, rating + change),
+            )
+            conn.executemany(
+                """
+                INSERT INTO user_actions VALUES (?, ?, ?, ?)
+                ON CONFLICT (guild_id, user_id, action) DO UPDATE SET count = count + excluded.count
+                """,
+                [(scope, player.id, action, count) for action, count in player.actions.items()],
+            )
+
+    # -----------------------
+    # Queries
+    # -----------------------
+
+    async def user_stats(self, user_id: int, guild_id: int | None = None) -> dict | None:
+        """Aggregate stats of a user in a guild (or across all guilds if guild_id is None)."""
+        scope = GLOBAL if guild_id is None else guild_id
+        return await self._cached(("user", scope, user_id), self._load_user, scope, user_id)
+
+    async def leaderboard(self, guild_id: int | None = None, limit: int = 10) -> list[dict]:
+        """Top rated players of a guild (or across all guilds if guild_id is None)."""
+        scope = GLOBAL if guild_id is None else guild_id
+        return await self._cached(("board", scope, limit), self._load_leaderboard, scope, limit)
+
+    async def _cached(self, key, load, *args):
+        found, value, generation = self.cache.get(key)
+        if found:
+            return value
+        value = await asyncio.to_thread(self.writer.read, lambda conn: load(conn, *args))
+        self.cache.put(key, value, generation)
+        return value
+
+    @staticmethod
+    def _load_user(conn, scope: int, user_id: int) -> dict | None:
+        row = conn.execute(
+            "SELECT name, games, wins, bluffs, bluffs_caught, challenges_won, challenges_lost, rating "
+            "FROM user_stats WHERE guild_id = ? AND user_id = ?", (scope, user_id)
+        ).fetchone()
+        if row is None:
+            return None
+        stats = dict(zip(
+            ("name", "games", "wins", "bluffs", "bluffs_caught", "challenges_won", "challenges_lost", "rating"), row
+        ))
+        stats["actions"] = conn.execute(
+            "SELECT action, count FROM user_actions WHERE guild_id = ? AND user_id = ? ORDER BY count DESC LIMIT ?",
+            (scope, user_id, TOP_ACTIONS)
+        ).fetchall()
+        return stats
+
+    @staticmethod
+    def _load_leaderboard(conn, scope: int, limit: int) -> list[dict]:
+        rows = conn.execute(
+            "SELECT user_id, name, rating, games, wins FROM user_stats "
+            "WHERE guild_id = ? ORDER BY rating DESC LIMIT ?", (scope, limit)
+        ).fetchall()
+        return [dict(zip(("user_id", "name", "rating", "games", "wins"), row)) for row in rows]
@@ -0,0 +1,166 @@
+# writer.py
+import os
+import time
+import queue
+import sqlite3
+import logging
+import threading
+from typing import Callable
+
+logger = logging.getLogger("coup")
+
+DB_PATH = os.getenv("COUP_DB_PATH", os.path.join("data", "coup.db"))
+MAX_QUEUE = 10000 # Writes waiting for the writer thread before new ones are dropped
+BATCH_SIZE = 500 # Writes applied per transaction
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """Open a connection with the settings every coup database connection uses."""
+    if path != ":memory:":
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+class DatabaseWriter:
+    """
+    Write-behind queue in front of a SQLite database.
+    submit() never blocks: writes are queued and a background thread applies
+    them in batched transactions on its own connection.
+    """
+    def __init__(self, path: str = DB_PATH, schema: tuple[str, ...] = (), batch_size: int = BATCH_SIZE,
+                 max_queue: int = MAX_QUEUE):
+        self.path = path
+        self.schema = list(schema)
+        self.batch_size = batch_size
+        self.queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self.thread: threading.Thread | None = None
+        self.conn: sqlite3.Connection | None = None
+        self.lock = threading.Lock() # Guards the connection for reads made from other threads
+
+        # Stats
+        self.written = 0
+        self.batches = 0
+        self.dropped = 0
+        self.failed = 0
+        self.latency_total = 0.0 # Seconds from submit to commit, summed
+        self.latency_max = 0.0
+
+    def __repr__(self):
+        return f"<DatabaseWriter path={self.path} queued={self.queue.qsize()} written={self.written}>"
+
+    def add_schema(self, *statements: str):
+        """Register schema statements; applied when the writer starts (or immediately if running)."""
+        self.schema.extend(statements)
+        if self.conn is not None:
+            with self.lock:
+                for statement in statements:
+                    self.conn.execute(statement)
+                self.conn.commit()
+
+    def start(self):
+        if self.thread and self.thread.is_alive():
+            return
+        self.conn = connect(self.path)
+        with self.lock:
+            for statement in self.schema:
+                self.conn.execute(statement)
+            self.conn.commit()
+        self.thread = threading.Thread(target=self.run, name="coup-db-writer", daemon=True)
+        self.thread.start()
+        logger.info(f"Started {self}")
+
+    def stop(self, timeout: float = 5.0):
+        """Flush queued writes and stop the writer thread."""
+        if not self.thread:
+            return
+        self.queue.put(None)
+        self.thread.join(timeout)
+        self.thread = None
+        with self.lock:
+            self.conn.close()
+            self.conn = None
+        logger.info(f"Stopped {self}")
+
+    def submit(self, write: Callable[[sqlite3.Connection], None]) -> bool:
+        """Queue a write. Returns False (and counts a drop) if the queue is full."""
+        try:
+            self.queue.put_nowait((time.perf_counter(), write))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            logger.warning(f"{self} queue full; dropped a write")
+            return False
+
+    def read(self, query: Callable[[sqlite3.Connection], object]):
+        """Run a read on the writer's connection. Blocking: call through asyncio.to_thread."""
+        with self.lock:
+            return query(self.conn)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until every write queued so far is committed."""
+        done = threading.Event()
+        self.queue.put((time.perf_counter(), lambda conn: done.set()))
+        return done.wait(timeout)
+
+    def run(self):
+        """Writer thread: drain the queue in batches, one transaction per batch."""
+        stopping = False
+        while not stopping:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in batch:
+                stopping = True
+                batch = [item for item in batch if item is not None]
+            if batch:
+                self.apply(batch)
+
+    def apply(self, batch: list):
+        """
+        Apply a batch in one transaction. Each write runs in its own savepoint,
+        so a write that fails is rolled back on its own and the rest still commit.
+        """
+        applied = [] # Submit times of the writes that went through
+        with self.lock:
+            try:
+                self.conn.execute("BEGIN")
+                for enqueued, write in batch:
+                    self.conn.execute("SAVEPOINT write")
+                    try:
+                        write(self.conn)
+                        applied.append(enqueued)
+                    except Exception as e:
+                        self.conn.execute("ROLLBACK TO write")
+                        self.failed += 1
+                        logger.exception(f"{self} failed to apply a write: {e}")
+                    self.conn.execute("RELEASE write")
+                self.conn.commit()
+            except Exception as e:
+                self.conn.rollback()
+                self.failed += len(applied)
+                logger.exception(f"{self} failed to commit a batch of {len(batch)}: {e}")
+                return
+        now = time.perf_counter()
+        for enqueued in applied:
+            latency = now - enqueued
+            self.latency_total += latency
+            self.latency_max = max(self.latency_max, latency)
+        self.written += len(applied)
+        self.batches += 1
+
+    def stats(self) -> dict:
+        return {
+            "queued": self.queue.qsize(),
+            "written": self.written,
+            "batches": self.batches,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "avg_latency_ms": self.latency_total / self.written * 1000 if self.written else 0.0,
+            "max_latency_ms": self.latency_max * 1000,
+        }
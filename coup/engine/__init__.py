@@ -0,0 +1,27 @@
+from .state import (
+    GameState, PlayerState,
+    ROLES,
+    ACTION, RESPONSE, BLOCK_RESPONSE, LOSE_INFLUENCE,
+    EXCHANGE, EXAMINE_REVEAL, EXAMINE_DECIDE, GAME_OVER,
+    new_game, from_models, to_models
+)
+from .rules import (
+    Move,
+    ACT, CHALLENGE, BLOCK, ALLOW, LOSE, RETURN, REVEAL, SWAP, KEEP,
+    legal_actions, is_legal, deciding_seats, default_move, apply
+)
+from .packed import PackedState, pack, unpack, RECORD_SIZE
+from .result import GameResult, PlayerResult
+from .log import move_rng, encode_move, decode_move, encode_events, decode_events
+
+__all__ = ["GameState", "PlayerState",
+           "ROLES",
+           "ACTION", "RESPONSE", "BLOCK_RESPONSE", "LOSE_INFLUENCE",
+           "EXCHANGE", "EXAMINE_REVEAL", "EXAMINE_DECIDE", "GAME_OVER",
+           "new_game", "from_models", "to_models",
+           "Move",
+           "ACT", "CHALLENGE", "BLOCK", "ALLOW", "LOSE", "RETURN", "REVEAL", "SWAP", "KEEP",
+           "legal_actions", "is_legal", "deciding_seats", "default_move", "apply",
+           "PackedState", "pack", "unpack", "RECORD_SIZE",
+           "GameResult", "PlayerResult",
+           "move_rng", "encode_move", "decode_move", "encode_events", "decode_events"]
@@ -0,0 +1,103 @@
+# log.py
+import random
+from .rules import Move, ACT, CHALLENGE, BLOCK, ALLOW, LOSE, RETURN, REVEAL, SWAP, KEEP
+from .packed import ROLE_CODES, ACTION_CODES, NONE, _ROLE_FROM_CODE, _ACTION_FROM_CODE
+
+# Field types of each engine event, in tuple order after the kind
+SEAT, ACTION_, ROLE, DELTA = range(4)
+EVENTS = {
+    "act": (SEAT, ACTION_, SEAT),
+    "challenge": (SEAT, SEAT, ROLE),
+    "challenge_won": (SEAT, SEAT, ROLE),
+    "challenge_lost": (SEAT, SEAT, ROLE),
+    "block": (SEAT, ROLE),
+    "blocked": (SEAT, ACTION_),
+    "resolve": (SEAT, ACTION_, SEAT),
+    "coins": (SEAT, DELTA),
+    "draw": (SEAT, ROLE),
+    "return": (SEAT, ROLE),
+    "lose": (SEAT, ROLE),
+    "eliminated": (SEAT,),
+    "reveal": (SEAT, ROLE),
+    "swap": (SEAT, SEAT),
+    "keep": (SEAT, SEAT),
+    "turn": (SEAT,),
+    "game_over": (SEAT,),
+}
+EVENT_KINDS = tuple(EVENTS)
+EVENT_CODES = {kind: i for i, kind in enumerate(EVENT_KINDS)}
+MOVE_KINDS = (ACT, CHALLENGE, BLOCK, ALLOW, LOSE, RETURN, REVEAL, SWAP, KEEP)
+MOVE_CODES = {kind: i for i, kind in enumerate(MOVE_KINDS)}
+MOVE_SIZE = 5
+
+
+def move_rng(seed: int, seq: int) -> random.Random:
+    """
+    The rng a game's seq-th move is applied with.
+    Seeding each move separately lets a replay start from any checkpoint.
+    """
+    return random.Random(f"{seed}:{seq}")
+
+
+def _encode(kind: int, value) -> int:
+    if kind == SEAT:
+        return NONE if value is None else value
+    if kind == ACTION_:
+        return ACTION_CODES.get(value, 0)
+    if kind == ROLE:
+        return ROLE_CODES.get(value, 0)
+    return value & 0xFF # DELTA, two's complement
+
+
+def _decode(kind: int, code: int):
+    if kind == SEAT:
+        return None if code == NONE else code
+    if kind == ACTION_:
+        return _ACTION_FROM_CODE[code]
+    if kind == ROLE:
+        return _ROLE_FROM_CODE[code]
+    return code - 0x100 if code & 0x80 else code
+
+
+def encode_move(move: Move) -> bytes:
+    """Encode a move as MOVE_SIZE bytes: kind, seat, action, target, card."""
+    return bytes((
+        MOVE_CODES[move.kind],
+        _encode(SEAT, move.seat),
+        _encode(ACTION_, move.action),
+        _encode(SEAT, move.target),
+        _encode(ROLE, move.card),
+    ))
+
+
+def decode_move(data: bytes) -> Move:
+    kind, seat, action, target, card = data
+    return Move(
+        MOVE_KINDS[kind],
+        _decode(SEAT, seat),
+        _decode(ACTION_, action),
+        _decode(SEAT, target),
+        _decode(ROLE, card),
+    )
+
+
+def encode_events(events: list[tuple]) -> bytes:
+    """Encode engine events as one kind byte followed by one byte per field."""
+    data = bytearray()
+    for event in events:
+        fields = EVENTS[event[0]]
+        data.append(EVENT_CODES[event[0]])
+        data.extend(_encode(field, value) for field, value in zip(fields, event[1:]))
+    return bytes(data)
+
+
+def decode_events(data: bytes) -> list[tuple]:
+    events = []
+    i = 0
+    while i < len(data):
+        kind = EVENT_KINDS[data[i]]
+        fields = EVENTS[kind]
+        values = data[i + 1:i + 1 + len(fields)]
+        events.append((kind, *(_decode(field, code) for field, code in zip(fields, values))))
+        i += 1 + len(fields)
+    return events
@@ -0,0 +1,156 @@
+# packed.py
+import hashlib
+from coup.models import Player, Deck, ACTIONS
+from .state import (
+    GameState, PlayerState, ROLES, COPIES,
+    ACTION, RESPONSE, BLOCK_RESPONSE, LOSE_INFLUENCE,
+    EXCHANGE, EXAMINE_REVEAL, EXAMINE_DECIDE, GAME_OVER,
+    RESOLVE, BLOCKED, END,
+    from_models, to_models,
+)
+
+# Small-int codes. 0 means "no role/action/step"; NONE means "no seat".
+ROLE_CODES = {role: i + 1 for i, role in enumerate(ROLES)}
+ACTION_CODES = {action: i + 1 for i, action in enumerate(ACTIONS)}
+PHASES = (ACTION, RESPONSE, BLOCK_RESPONSE, LOSE_INFLUENCE, EXCHANGE, EXAMINE_REVEAL, EXAMINE_DECIDE, GAME_OVER)
+PHASE_CODES = {phase: i for i, phase in enumerate(PHASES)}
+STEPS = (None, RESOLVE, BLOCKED, END)
+STEP_CODES = {step: i for i, step in enumerate(STEPS)}
+NONE = 0xFF
+
+MAX_PLAYERS = 6
+HAND_SLOTS = 3 # An Exchange briefly holds three cards
+CARD_SLOTS = len(ROLES) * COPIES
+
+# Record layout (one byte per field unless noted)
+N_PLAYERS, TURN, PHASE, ACTION_, TARGET, BLOCKER, BLOCK_ROLE, CHALLENGER, THEN, EXAMINED, WINNER, BURNED = range(12)
+TURN_COUNT = 12 # uint16, little endian
+LOSSES = 14 # MAX_PLAYERS seats, NONE padded
+DECK_COUNT = LOSSES + MAX_PLAYERS
+DECK = DECK_COUNT + 1
+REVEALED_COUNT = DECK + CARD_SLOTS
+REVEALED = REVEALED_COUNT + 1
+PLAYERS = REVEALED + CARD_SLOTS # MAX_PLAYERS x (coins, card, card, card)
+PLAYER_SIZE = 1 + HAND_SLOTS
+RECORD_SIZE = PLAYERS + MAX_PLAYERS * PLAYER_SIZE
+
+_ROLE_FROM_CODE = (None,) + ROLES
+_ACTION_FROM_CODE = (None,) + ACTIONS
+
+
+def _seat(seat):
+    return NONE if seat is None else seat
+
+
+def _unseat(code):
+    return None if code == NONE else code
+
+
+def pack(state: GameState) -> bytes:
+    """Encode a state as a fixed-size RECORD_SIZE byte record. Player ids are not included."""
+    record = bytearray(RECORD_SIZE)
+    record[N_PLAYERS] = len(state.players)
+    record[TURN] = state.turn
+    record[PHASE] = PHASE_CODES[state.phase]
+    record[ACTION_] = ACTION_CODES.get(state.action, 0)
+    record[TARGET] = _seat(state.target)
+    record[BLOCKER] = _seat(state.blocker)
+    record[BLOCK_ROLE] = ROLE_CODES.get(state.block_role, 0)
+    record[CHALLENGER] = _seat(state.challenger)
+    record[THEN] = STEP_CODES[state.then]
+    record[EXAMINED] = ROLE_CODES.get(state.examined, 0)
+    record[WINNER] = _seat(state.winner)
+    record[BURNED] = ROLE_CODES.get(state.burned, 0)
+    record[TURN_COUNT:TURN_COUNT + 2] = min(state.turn_count, 0xFFFF).to_bytes(2, "little")
+
+    record[LOSSES:LOSSES + MAX_PLAYERS] = bytes([NONE]) * MAX_PLAYERS
+    record[LOSSES:LOSSES + len(state.losses)] = bytes(state.losses)
+    record[DECK_COUNT] = len(state.deck)
+    record[DECK:DECK + len(state.deck)] = bytes(ROLE_CODES[c] for c in state.deck)
+    record[REVEALED_COUNT] = len(state.revealed)
+    record[REVEALED:REVEALED + len(state.revealed)] = bytes(ROLE_CODES[c] for c in state.revealed)
+
+    for seat, player in enumerate(state.players):
+        base = PLAYERS + seat * PLAYER_SIZE
+        record[base] = min(player.coins, 0xFF)
+        record[base + 1:base + 1 + len(player.hand)] = bytes(ROLE_CODES[c] for c in player.hand)
+    return bytes(record)
+
+
+def unpack(record: bytes, ids: tuple[int, ...]) -> GameState:
+    """Decode a record produced by pack. ids gives the player id of each seat."""
+    n = record[N_PLAYERS]
+    players = []
+    for seat in range(n):
+        base = PLAYERS + seat * PLAYER_SIZE
+        hand = tuple(_ROLE_FROM_CODE[c] for c in record[base + 1:base + PLAYER_SIZE] if c)
+        players.append(PlayerState(ids[seat], record[base], hand))
+    losses = tuple(c for c in record[LOSSES:LOSSES + MAX_PLAYERS] if c != NONE)
+    deck = record[DECK:DECK + record[DECK_COUNT]]
+    revealed = record[REVEALED:REVEALED + record[REVEALED_COUNT]]
+    return GameState(
+        players=tuple(players),
+        deck=tuple(_ROLE_FROM_CODE[c] for c in deck),
+        revealed=tuple(_ROLE_FROM_CODE[c] for c in revealed),
+        burned=_ROLE_FROM_CODE[record[BURNED]],
+        turn=record[TURN],
+        phase=PHASES[record[PHASE]],
+        action=_ACTION_FROM_CODE[record[ACTION_]],
+        target=_unseat(record[TARGET]),
+        blocker=_unseat(record[BLOCKER]),
+        block_role=_ROLE_FROM_CODE[record[BLOCK_ROLE]],
+        challenger=_unseat(record[CHALLENGER]),
+        losses=losses,
+        then=STEPS[record[THEN]],
+        examined=_ROLE_FROM_CODE[record[EXAMINED]],
+        winner=_unseat(record[WINNER]),
+        turn_count=int.from_bytes(record[TURN_COUNT:TURN_COUNT + 2], "little"),
+    )
+
+
+class PackedState:
+    """
+    A game state as an immutable fixed-size byte record plus the seat -> player id table.
+    Copies share the record, equality and hashing compare bytes, and digest() is stable across processes.
+    """
+    __slots__ = ("record", "ids")
+
+    def __init__(self, record: bytes, ids: tuple[int, ...]):
+        self.record = record
+        self.ids = ids
+
+    def __repr__(self):
+        return f"<PackedState {self.record.hex()}>"
+
+    def __eq__(self, other):
+        return isinstance(other, PackedState) and self.record == other.record and self.ids == other.ids
+
+    def __hash__(self):
+        return hash(self.record)
+
+    def copy(self) -> "PackedState":
+        return PackedState(self.record, self.ids)
+
+    def mutable(self) -> bytearray:
+        """A writable copy of the record, e.g. for in-place search."""
+        return bytearray(self.record)
+
+    def digest(self) -> int:
+        """64-bit hash that is the same in every process (unlike hash() of bytes)."""
+        return int.from_bytes(hashlib.blake2b(self.record, digest_size=8).digest(), "little")
+
+    @classmethod
+    def from_state(cls, state: GameState) -> "PackedState":
+        return cls(pack(state), tuple(p.id for p in state.players))
+
+    def to_state(self) -> GameState:
+        return unpack(self.record, self.ids)
+
+    @classmethod
+    def from_models(cls, players: list[Player], deck: Deck, turn: int = 0) -> "PackedState":
+        """Pack Player and Deck objects; seats follow the order of players."""
+        return cls.from_state(from_models(players, deck, turn))
+
+    def to_models(self, players: list[Player], deck: Deck):
+        """Write the packed state back into the Player and Deck objects it describes."""
+        to_models(self.to_state(), players, deck)
@@ -0,0 +1,93 @@
+# result.py
+from collections import Counter
+from .state import GameState
+
+
+class PlayerResult:
+    """How a single player fared in a finished game."""
+    def __init__(self, id: int, name: str, seat: int):
+        self.id = id
+        self.name = name
+        self.seat = seat
+        self.placement = 0 # 1 for the winner, n for the first player eliminated
+        self.eliminated_turn = None # Turn count at elimination, None for the winner
+        self.actions = Counter() # Action name -> times declared
+        self.bluffs = 0 # Role claims (actions or blocks) made without the role that went through
+        self.bluffs_caught = 0 # Role claims made without the role that were challenged
+        self.challenges_won = 0
+        self.challenges_lost = 0
+
+    def __repr__(self):
+        return f"<PlayerResult {self.name} placement={self.placement}>"
+
+
+class GameResult:
+    """
+    Summary of a game, built incrementally from engine events.
+    Feed every move's events to record() and call finish() once the game is over.
+    """
+    def __init__(self, state: GameState, names: dict[int, str], game_id: int = 0, started: float = 0.0):
+        self.game_id = game_id
+        self.guild_id = None
+        self.channel_id = None
+        self.started = started
+        self.ended = started
+        self.turns = state.turn_count
+        self.winner_id = None
+        self.players = [PlayerResult(p.id, names.get(p.id, str(p.id)), seat) for seat, p in enumerate(state.players)]
+        self.eliminated: list[int] = [] # Seats in elimination order
+        self.claims: dict[int, bool] = {} # Seat -> whether its open role claim this turn is a bluff
+
+    def __repr__(self):
+        return f"<GameResult game={self.game_id} winner={self.winner_id} turns={self.turns}>"
+
+    @property
+    def duration(self) -> float:
+        return self.ended - self.started
+
+    def record(self, events: list[tuple], before: GameState):
+        """Tally the events produced by one move. before is the state the move was applied to."""
+        for event in events:
+            kind = event[0]
+            if kind == "act":
+                _, seat, action, _ = event
+                self.players[seat].actions[action.name] += 1
+                if action.role:
+                    self.claims[seat] = action.role not in before.players[seat].hand
+            elif kind == "block":
+                _, seat, role = event
+                self.claims[seat] = role not in before.players[seat].hand
+            elif kind == "challenge_won":
+                _, challenger, defender, _ = event
+                self.players[challenger].challenges_won += 1
+                if self.claims.pop(defender, False):
+                    self.players[defender].bluffs_caught += 1
+            elif kind == "challenge_lost":
+                self.players[event[1]].challenges_lost += 1
+            elif kind in ("resolve", "blocked"):
+                if self.claims.pop(event[1], False):
+                    self.players[event[1]].bluffs += 1
+            elif kind == "eliminated":
+                seat = event[1]
+                self.eliminated.append(seat)
+                self.players[seat].eliminated_turn = before.turn_count
+            elif kind == "turn":
+                self.claims.clear()
+
+    def finish(self, state: GameState, ended: float = 0.0):
+        """Fill in the winner, placements and turn count from the final state."""
+        self.ended = ended
+        self.turns = state.turn_count
+        n = len(self.players)
+        # Players knocked out before a restore were never seen being eliminated; rank them last
+        unseen = [seat for seat, p in enumerate(state.players) if not p.hand and seat not in self.eliminated]
+        for place, seat in enumerate(unseen + self.eliminated):
+            self.players[seat].placement = n - place
+        if state.winner is not None:
+            winner = self.players[state.winner]
+            winner.placement = 1
+            self.winner_id = winner.id
+
+    def action_counts(self) -> Counter:
+        """Action name -> times declared, over all players."""
+        return sum((p.actions for p in self.players), Counter())
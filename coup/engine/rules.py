@@ -0,0 +1,351 @@
+# rules.py
+import random
+from typing import NamedTuple, Optional
+from coup.models import ACTIONS, Coup, Income
+from .state import (
+    GameState, PlayerState,
+    ACTION, RESPONSE, BLOCK_RESPONSE, LOSE_INFLUENCE,
+    EXCHANGE, EXAMINE_REVEAL, EXAMINE_DECIDE, GAME_OVER,
+    RESOLVE, BLOCKED, END,
+)
+
+MUST_COUP = 10 # Coins at which Coup is the only legal action
+
+# Move kinds
+ACT = "act" # Choose an action (and target)
+CHALLENGE = "challenge"
+BLOCK = "block" # card is the role claimed
+ALLOW = "allow" # Response window closed without a challenge or block
+LOSE = "lose" # card is the influence lost
+RETURN = "return" # card is returned to the deck after an Exchange
+REVEAL = "reveal" # card is shown to the actor of an Examine
+SWAP = "swap"
+KEEP = "keep"
+
+
+class Move(NamedTuple):
+    """A single decision. seat is the deciding player, None for ALLOW."""
+    kind: str
+    seat: Optional[int] = None
+    action: Optional[type] = None
+    target: Optional[int] = None
+    card: Optional[str] = None
+
+
+# -----------------------
+# Legal Moves
+# -----------------------
+
+def legal_actions(state: GameState) -> list[Move]:
+    """Every move that can be applied to state, for all players."""
+    phase = state.phase
+    players = state.players
+
+    if phase == ACTION:
+        actor = state.turn
+        coins = players[actor].coins
+        others = [seat for seat, p in enumerate(players) if p.hand and seat != actor]
+        actions = (Coup,) if coins >= MUST_COUP else ACTIONS
+        moves = []
+        for action in actions:
+            if coins < action.cost:
+                continue
+            if action.targeted:
+                moves.extend(Move(ACT, actor, action, target) for target in others)
+            else:
+                moves.append(Move(ACT, actor, action))
+        return moves
+
+    if phase == RESPONSE:
+        action = state.action
+        actor = state.turn
+        moves = []
+        if action.role:
+            moves.extend(
+                Move(CHALLENGE, seat) for seat, p in enumerate(players) if p.hand and seat != actor
+            )
+        if action.block_roles:
+            if action.targeted:
+                blockers = [state.target] if players[state.target].hand else []
+            else:
+                blockers = [seat for seat, p in enumerate(players) if p.hand and seat != actor]
+            moves.extend(Move(BLOCK, seat, card=role) for seat in blockers for role in action.block_roles)
+        moves.append(Move(ALLOW))
+        return moves
+
+    if phase == BLOCK_RESPONSE:
+        moves = [
+            Move(CHALLENGE, seat) for seat, p in enumerate(players) if p.hand and seat != state.blocker
+        ]
+        moves.append(Move(ALLOW))
+        return moves
+
+    if phase == LOSE_INFLUENCE:
+        seat = state.losses[0]
+        return [Move(LOSE, seat, card=card) for card in _distinct(players[seat].hand)]
+
+    if phase == EXCHANGE:
+        seat = state.turn
+        return [Move(RETURN, seat, card=card) for card in _distinct(players[seat].hand)]
+
+    if phase == EXAMINE_REVEAL:
+        seat = state.target
+        return [Move(REVEAL, seat, card=card) for card in _distinct(players[seat].hand)]
+
+    if phase == EXAMINE_DECIDE:
+        return [Move(SWAP, state.turn), Move(KEEP, state.turn)]
+
+    return []
+
+
+def is_legal(state: GameState, move: Move) -> bool:
+    """Validate an untrusted move before applying it."""
+    return move in legal_actions(state)
+
+
+def default_move(state: GameState, rng: random.Random = random) -> Move:
+    """
+    The move made for a player whose decision timed out: Income (a Coup on a
+    random target when it is forced), a random card, keep, or ALLOW.
+    """
+    if state.phase in (RESPONSE, BLOCK_RESPONSE):
+        return Move(ALLOW)
+    if state.phase == EXAMINE_DECIDE:
+        return Move(KEEP, state.turn)
+    moves = legal_actions(state)
+    if state.phase == ACTION:
+        income = Move(ACT, state.turn, Income)
+        return income if income in moves else rng.choice(moves)
+    return rng.choice(moves)
+
+
+def deciding_seats(state: GameState) -> list[int]:
+    """Seats that have a decision to make in the current phase."""
+    if state.phase in (RESPONSE, BLOCK_RESPONSE):
+        return sorted({m.seat for m in legal_actions(state) if m.seat is not None})
+    if state.phase == ACTION or state.phase == EXCHANGE or state.phase == EXAMINE_DECIDE:
+        return [state.turn]
+    if state.phase == LOSE_INFLUENCE:
+        return [state.losses[0]]
+    if state.phase == EXAMINE_REVEAL:
+        return [state.target]
+    return []
+
+
+def _distinct(hand: tuple[str, ...]) -> list[str]:
+    return list(dict.fromkeys(hand))
+
+
+# -----------------------
+# Transitions
+# -----------------------
+
+def apply(state: GameState, move: Move, rng: random.Random = random, events: Optional[list] = None) -> GameState:
+    """
+    Apply a legal move and return the next state. state is never modified.
+    When events is a list, tuples describing what happened are appended to it:
+        ("act", seat, action, target), ("challenge", seat, defender, role),
+        ("challenge_won", challenger, defender, role), ("challenge_lost", challenger, defender, role),
+        ("block", seat, role), ("blocked", blocker, action), ("resolve", seat, action, target),
+        ("coins", seat, delta), ("draw", seat, card), ("return", seat, card), ("lose", seat, card),
+        ("eliminated", seat), ("reveal", seat, card), ("swap", seat, target), ("keep", seat, target),
+        ("turn", seat), ("game_over", seat)
+    Use is_legal to validate moves from untrusted input first.
+    """
+    ev = events.append if events is not None else _discard
+    kind = move.kind
+
+    if kind == ACT:
+        action = move.action
+        ev(("act", move.seat, action, move.target))
+        state = state._replace(action=action, target=move.target)
+        if action.role or action.block_roles:
+            return state._replace(phase=RESPONSE)
+        return _resolve(state, rng, ev)
+
+    if kind == CHALLENGE:
+        if state.phase == RESPONSE:
+            defender, role, proven, bluffed = state.turn, state.action.role, RESOLVE, END
+        else:
+            defender, role, proven, bluffed = state.blocker, state.block_role, BLOCKED, RESOLVE
+        challenger = move.seat
+        state = state._replace(challenger=challenger)
+        ev(("challenge", challenger, defender, role))
+        if role in state.players[defender].hand:
+            # Defender proves the role, shuffles it back and draws a replacement
+            ev(("challenge_lost", challenger, defender, role))
+            state = _return_card(state, defender, role, rng, ev)
+            state = _draw(state, defender, ev)
+            return _start_losses(state, (challenger,), proven, rng, ev)
+        ev(("challenge_won", challenger, defender, role))
+        return _start_losses(state, (defender,), bluffed, rng, ev)
+
+    if kind == BLOCK:
+        ev(("block", move.seat, move.card))
+        return state._replace(phase=BLOCK_RESPONSE, blocker=move.seat, block_role=move.card)
+
+    if kind == ALLOW:
+        if state.phase == RESPONSE:
+            return _resolve(state, rng, ev)
+        return _blocked(state, rng, ev)
+
+    if kind == LOSE:
+        state = _lose(state, move.seat, move.card, ev)
+        return _next_loss(state._replace(losses=state.losses[1:]), rng, ev)
+
+    if kind == RETURN:
+        state = _return_card(state, move.seat, move.card, rng, ev)
+        return _end_turn(state, ev)
+
+    if kind == REVEAL:
+        ev(("reveal", move.seat, move.card))
+        return state._replace(phase=EXAMINE_DECIDE, examined=move.card)
+
+    if kind == SWAP:
+        ev(("swap", move.seat, state.target))
+        state = _return_card(state, state.target, state.examined, rng, ev)
+        state = _draw(state, state.target, ev)
+        return _end_turn(state, ev)
+
+    if kind == KEEP:
+        ev(("keep", move.seat, state.target))
+        return _end_turn(state, ev)
+
+    raise ValueError(f"Unknown move kind: {kind}")
+
+
+def _discard(event):
+    pass
+
+
+def _set_player(state: GameState, seat: int, player: PlayerState) -> GameState:
+    players = state.players
+    return state._replace(players=players[:seat] + (player,) + players[seat + 1:])
+
+
+def _coins(state: GameState, seat: int, delta: int, ev) -> GameState:
+    if not delta:
+        return state
+    p = state.players[seat]
+    ev(("coins", seat, delta))
+    return _set_player(state, seat, p._replace(coins=p.coins + delta))
+
+
+def _draw(state: GameState, seat: int, ev) -> GameState:
+    deck = state.deck
+    card = deck[-1]
+    p = state.players[seat]
+    ev(("draw", seat, card))
+    state = _set_player(state, seat, p._replace(hand=p.hand + (card,)))
+    return state._replace(deck=deck[:-1])
+
+
+def _remove(hand: tuple[str, ...], card: str) -> tuple[str, ...]:
+    i = hand.index(card)
+    return hand[:i] + hand[i + 1:]
+
+
+def _return_card(state: GameState, seat: int, card: str, rng, ev) -> GameState:
+    """Shuffle a card from a player's hand back into the deck."""
+    p = state.players[seat]
+    state = _set_player(state, seat, p._replace(hand=_remove(p.hand, card)))
+    deck = state.deck
+    # Inserting at a random position keeps an already shuffled deck uniformly shuffled
+    i = rng.randrange(len(deck) + 1)
+    ev(("return", seat, card))
+    return state._replace(deck=deck[:i] + (card,) + deck[i:])
+
+
+def _lose(state: GameState, seat: int, card: str, ev) -> GameState:
+    """Reveal a card from a player's hand."""
+    p = state.players[seat]
+    hand = _remove(p.hand, card)
+    ev(("lose", seat, card))
+    if not hand:
+        ev(("eliminated", seat))
+    state = _set_player(state, seat, p._replace(hand=hand))
+    return state._replace(revealed=state.revealed + (card,))
+
+
+def _start_losses(state: GameState, seats: tuple[int, ...], then: str, rng, ev) -> GameState:
+    return _next_loss(state._replace(losses=seats, then=then), rng, ev)
+
+
+def _next_loss(state: GameState, rng, ev) -> GameState:
+    """Resolve pending losses that need no choice; stop at the first that does."""
+    losses = state.losses
+    while losses:
+        seat = losses[0]
+        hand = state.players[seat].hand
+        if len(hand) >= 2:
+            return state._replace(phase=LOSE_INFLUENCE, losses=losses)
+        if hand:
+            state = _lose(state, seat, hand[0], ev)
+        losses = losses[1:]
+    state = state._replace(losses=())
+
+    if len(state.alive()) <= 1:
+        return _end_turn(state, ev)
+    then = state.then
+    if then == RESOLVE:
+        return _resolve(state, rng, ev)
+    if then == BLOCKED:
+        return _blocked(state, rng, ev)
+    return _end_turn(state, ev)
+
+
+def _resolve(state: GameState, rng, ev) -> GameState:
+    """Carry out the current action."""
+    action = state.action
+    actor = state.turn
+    target = state.target
+    ev(("resolve", actor, action, target))
+
+    state = _coins(state, actor, action.gain - action.cost, ev)
+
+    if action.name == "Steal":
+        amount = min(2, state.players[target].coins)
+        state = _coins(state, target, -amount, ev)
+        state = _coins(state, actor, amount, ev)
+    elif action.name in ("Coup", "Assassinate"):
+        if state.players[target].hand:
+            return _start_losses(state, (target,), END, rng, ev)
+    elif action.name == "Exchange Roles":
+        state = _draw(state, actor, ev)
+        return state._replace(phase=EXCHANGE)
+    elif action.name == "Examine":
+        hand = state.players[target].hand
+        if len(hand) >= 2:
+            return state._replace(phase=EXAMINE_REVEAL)
+        if hand:
+            ev(("reveal", target, hand[0]))
+            return state._replace(phase=EXAMINE_DECIDE, examined=hand[0])
+
+    return _end_turn(state, ev)
+
+
+def _blocked(state: GameState, rng, ev) -> GameState:
+    """The action is blocked; costs are still paid."""
+    ev(("blocked", state.blocker, state.action))
+    state = _coins(state, state.turn, -state.action.cost, ev)
+    return _end_turn(state, ev)
+
+
+def _end_turn(state: GameState, ev) -> GameState:
+    """Advance to the next living player, or finish the game."""
+    alive = state.alive()
+    cleared = dict(
+        action=None, target=None, blocker=None, block_role=None, challenger=None,
+        losses=(), then=None, examined=None,
+    )
+    if len(alive) <= 1:
+        winner = alive[0] if alive else None
+        ev(("game_over", winner))
+        return state._replace(phase=GAME_OVER, winner=winner, **cleared)
+
+    n = len(state.players)
+    seat = (state.turn + 1) % n
+    while not state.players[seat].hand:
+        seat = (seat + 1) % n
+    ev(("turn", seat))
+    return state._replace(phase=ACTION, turn=seat, turn_count=state.turn_count + 1, **cleared)
@@ -0,0 +1,110 @@
+# state.py
+import random
+from typing import NamedTuple, Optional
+from coup.models import Player, Deck, Action
+
+# Roles in play and copies of each in a fresh deck
+ROLES = ("Duke", "Assassin", "Inquisitor", "Captain", "Contessa")
+COPIES = 3
+STARTING_COINS = 2
+HAND_SIZE = 2
+
+# Phases: who the game is waiting on
+ACTION = "action" # Current player chooses an action (and target)
+RESPONSE = "response" # Others may challenge or block the action
+BLOCK_RESPONSE = "block_response" # Others may challenge the block
+LOSE_INFLUENCE = "lose_influence" # losses[0] chooses a card to reveal
+EXCHANGE = "exchange" # Actor chooses a card to return to the deck
+EXAMINE_REVEAL = "examine_reveal" # Target chooses a card to show the actor
+EXAMINE_DECIDE = "examine_decide" # Actor decides whether the target swaps the shown card
+GAME_OVER = "game_over"
+
+# Steps taken once every pending influence loss is resolved
+RESOLVE = "resolve" # Carry out the action
+BLOCKED = "blocked" # The action is blocked
+END = "end" # End the turn
+
+
+class PlayerState(NamedTuple):
+    """Immutable snapshot of a player."""
+    id: int
+    coins: int
+    hand: tuple[str, ...]
+
+    def is_alive(self) -> bool:
+        return len(self.hand) > 0
+
+
+class GameState(NamedTuple):
+    """
+    Immutable snapshot of a game.
+    Seats are indexes into players and also the turn order.
+    Copying is free: every transition builds a new state sharing unchanged parts.
+    """
+    players: tuple[PlayerState, ...]
+    deck: tuple[str, ...] # Top of the deck is the last card
+    revealed: tuple[str, ...] = ()
+    burned: Optional[str] = None
+    turn: int = 0 # Seat of the current player
+    phase: str = ACTION
+    action: Optional[type[Action]] = None
+    target: Optional[int] = None
+    blocker: Optional[int] = None
+    block_role: Optional[str] = None
+    challenger: Optional[int] = None
+    losses: tuple[int, ...] = () # Seats that still have to lose an influence, in order
+    then: Optional[str] = None # Step taken after losses resolve
+    examined: Optional[str] = None # Card shown to the actor by an Examine
+    winner: Optional[int] = None
+    turn_count: int = 1
+
+    def alive(self) -> list[int]:
+        """Seats of players still in the game."""
+        return [seat for seat, p in enumerate(self.players) if p.hand]
+
+    def seat_of(self, player_id: int) -> Optional[int]:
+        for seat, p in enumerate(self.players):
+            if p.id == player_id:
+                return seat
+        return None
+
+
+def new_deck() -> list[str]:
+    return [role for role in ROLES for _ in range(COPIES)]
+
+
+def new_game(player_ids: list[int], rng: random.Random = random) -> GameState:
+    """Deal a new game. Seats follow the order of player_ids."""
+    deck = new_deck()
+    rng.shuffle(deck)
+    burned = deck.pop() # burn a card at the start of the game
+    players = []
+    for pid in player_ids:
+        hand = tuple(deck.pop() for _ in range(HAND_SIZE))
+        players.append(PlayerState(pid, STARTING_COINS, hand))
+    return GameState(players=tuple(players), deck=tuple(deck), burned=burned)
+
+
+# -----------------------
+# Model Conversion
+# -----------------------
+
+def from_models(players: list[Player], deck: Deck, turn: int = 0) -> GameState:
+    """Build a state from Player and Deck objects. Seats follow the order of players."""
+    return GameState(
+        players=tuple(PlayerState(p.id, p.coins, tuple(p.hand)) for p in players),
+        deck=tuple(deck.cards),
+        revealed=tuple(deck.revealed),
+        burned=deck.burned,
+        turn=turn,
+    )
+
+
+def to_models(state: GameState, players: list[Player], deck: Deck):
+    """Write a state back into the Player and Deck objects it was built from."""
+    for player, ps in zip(players, state.players):
+        player.coins = ps.coins
+        player.hand = list(ps.hand)
+    deck.cards = list(state.deck)
+    deck.revealed = list(state.revealed)
+    deck.burned = state.burned
@@ -3,11 +3,13 @@ from .player import Player
 from .action import (
     Action, 
     Income, Foreign_Aid, Coup, 
-    Tax, Exchange, Assassinate, Steal, Examine
+    Tax, Exchange, Assassinate, Steal, Examine,
+    ACTIONS
 )
 
 __all__ = ["Deck", 
            "Player", 
            "Action",
            "Income", "Foreign_Aid", "Coup",
-           "Tax", "Exchange", "Assassinate", "Steal", "Examine"]
\ No newline at end of file
+           "Tax", "Exchange", "Assassinate", "Steal", "Examine",
+           "ACTIONS"]
\ No newline at end of file
@@ -7,9 +7,17 @@ import logging
 logger = logging.getLogger("coup")
 
 class Action(ABC):
-    """Base class for all game actions"""
+    """
+    Base class for all game actions.
+    Subclasses declare the rules of an action; coup.engine applies them.
+    Instances describe the action being taken in the current turn.
+    """
     name: str = "base"
-    role: str = "base"
+    role: Optional[str] = None # Role claimed to take the action, None if it cannot be challenged
+    cost: int = 0 # Coins paid when the action resolves (or is blocked)
+    targeted: bool = False # Whether the action needs a target
+    block_roles: tuple[str, ...] = () # Roles that can block the action
+    gain: int = 0 # Coins gained when the action resolves
 
     def __init__(self, actor: Player, target: Optional[Player] = None):
         self.actor = actor
@@ -30,154 +38,63 @@ class Action(ABC):
             f"challenged={self.challenged} "
             f"challenger={self.challenger} "
         )
-    async def execute(self, game):
-        logger.error("Base Class Method Called")
-        
-    async def on_block(self, game):
-        # Default Behavior: Action doesn't go through, end turn
-        if self.blocked and not self.challenged:
-            await game.send_update_msg(
-                f"{self.name} got blocked by {self.blocker.name}."
-            )
-        await game.end_turn()
 
     def is_valid(self) -> bool:
-        return True
+        return self.actor.coins >= self.cost
 
     def has_target(self) -> bool:
-        return False
+        return self.targeted
     
     def can_respond(self) -> bool:
-        return True
+        return self.challengeable() or self.blockable()
     
     def blockable(self) -> bool:
-        return False
+        return bool(self.block_roles)
+
+    @classmethod
+    def challengeable(cls) -> bool:
+        return cls.role is not None
     
 class Income(Action):
     name = "Collect Income"
-
-    async def execute(self, game):
-        self.actor.gain_income(1)
-        await game.send_update_msg(
-            content=f"{self.actor.name} gained 1 coin. They now have {self.actor.coins} coin(s)."
-        )
-        await game.end_turn()
-
-    def can_respond(self):
-        return False
+    gain = 1
 
 class Foreign_Aid(Action):
     name = "Collect Foreign Aid"
-
-    async def execute(self, game):
-        self.actor.gain_income(2)
-        await game.send_update_msg(
-            content=f"{self.actor.name} gained 2 coins. They now have {self.actor.coins} coin(s)."
-        )
-        await game.end_turn()
-    
-    def blockable(self):
-        return True
+    gain = 2
+    block_roles = ("Duke",)
 
 class Tax(Action):
     name = "Collect Tax"
     role = "Duke"
-
-    async def execute(self, game):
-        self.actor.gain_income(3)
-        await game.send_update_msg(
-            content=f"{self.actor.name} gained 3 coins. They now have {self.actor.coins} coin(s)."
-        )
-        await game.end_turn()
+    gain = 3
 
 class Coup(Action):
     name = "Coup"
-
-    async def execute(self, game):
-        # Target Loses Influence
-        await game.handle_lose_influence(self.target)
-        self.actor.spend_coins(7) # Actor spends 7 coins
-        await game.end_turn()
-
-    def is_valid(self):
-        if self.actor.coins >= 7:
-            return True
-        return False
-    
-    def has_target(self):
-        return True
-    
-    def can_respond(self):
-        return False
+    cost = 7
+    targeted = True
 
 class Exchange(Action):
     name = "Exchange Roles"
     role = "Inquisitor"
 
-    async def execute(self, game):
-        # Draw 1 card from the deck
-        self.actor.gain_influence(game.deck.draw())
-
-        # Return a Choice of Role Card to the Deck
-        await game.handle_lose_influence(player=self.actor, exchange=True)
-        
-        await game.end_turn()
-
 class Examine(Action):
     name = "Examine"
     role = "Inquisitor"
-
-    async def execute(self, game):
-        # Target chooses card to reveal
-        await game.handle_examine()
-        await game.end_turn()
-
-    async def has_target(self):
-        return True
+    targeted = True
 
 class Assassinate(Action):
-    name = "Assasinate"
+    name = "Assassinate"
     role = "Assassin"
-
-    async def execute(self, game):
-        # Target Loses Influence
-        await game.handle_lose_influence(self.target)
-        self.actor.spend_coins(3) # Actor spends 3 coins
-        await game.end_turn()
-
-    async def on_block(self, game):
-        self.actor.spend_coins(3) # Actor spends 3 coins
-        await game.end_turn()
-
-    def is_valid(self):
-        if self.actor.coins >= 3:
-            return True
-        return False
-    
-    def has_target(self):
-        return True
-    
-    def blockable(self):
-        return True
+    cost = 3
+    targeted = True
+    block_roles = ("Contessa",)
 
 class Steal(Action):
     name = "Steal"
     role = "Captain"
+    targeted = True
+    block_roles = ("Captain", "Inquisitor")
 
-    async def execute(self, game):
-        amount = min(2, self.target.coins)
-        self.actor.gain_income(amount) # Actor gains up to 2 coins
-        self.target.lose_coins(amount) # Target loses 2 coins
-        logger.info(f"{self.actor} stole {amount} coins from {self.target}")
-        await game.end_turn()
-
-    def has_target(self):
-        return True
-    
-    def blockable(self):
-        return True
-
-
-
-
-        
\ No newline at end of file
+# All actions in the order they are offered to players
+ACTIONS = (Income, Foreign_Aid, Coup, Tax, Exchange, Assassinate, Steal, Examine)
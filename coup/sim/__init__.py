@@ -0,0 +1,5 @@
+from .policies import Policy, RandomPolicy, HeuristicPolicy, POLICIES, make_policy
+from .runner import Results, play_game, run_batch, run
+
+__all__ = ["Policy", "RandomPolicy", "HeuristicPolicy", "POLICIES", "make_policy",
+           "Results", "play_game", "run_batch", "run"]
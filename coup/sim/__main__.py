@@ -0,0 +1,75 @@
+# __main__.py
+"""
+Monte Carlo self-play for Coup.
+
+Examples:
+    python -m coup.sim --games 20000 --policies heuristic random random random
+    python -m coup.sim --games 5000 --policies heuristic heuristic --scaling
+"""
+import os
+import argparse
+from .policies import POLICIES
+from .runner import run
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def rate(wins, games) -> str:
+    return f"{wins / games * 100:6.2f}%" if games else "   n/a"
+
+
+def report(results, elapsed: float, workers: int):
+    print(f"\n{results.games} games in {elapsed:.2f}s on {workers} worker(s): "
+          f"{results.games / elapsed:,.0f} games/s, {results.turns / elapsed:,.0f} turns/s")
+    print(f"avg turns/game {results.turns / results.games:.1f}, draws {results.draws}")
+
+    print("\nWin rate by seat:")
+    for seat in sorted(results.seat_games):
+        print(f"  seat {seat}: {rate(results.seat_wins[seat], results.seat_games[seat])}")
+
+    print("\nWin rate by policy:")
+    for name in sorted(results.policy_games):
+        print(f"  {name:<10} {rate(results.policy_wins[name], results.policy_games[name])}  ({results.policy_games[name]} seats)")
+
+    print("\nWin rate by starting hand:")
+    hands = sorted(results.hand_games, key=lambda h: -results.hand_wins[h] / results.hand_games[h])
+    for hand in hands:
+        print(f"  {' + '.join(hand):<24} {rate(results.hand_wins[hand], results.hand_games[hand])}  ({results.hand_games[hand]})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=positive_int, default=10000)
+    parser.add_argument("--policies", nargs="+", default=["heuristic", "random"], choices=list(POLICIES),
+                        help="one policy per seat (2-6 seats)")
+    parser.add_argument("--workers", type=positive_int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk", type=positive_int, default=500, help="games per worker batch")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--scaling", action="store_true", help="also time 1, 2, 4, ... workers")
+    args = parser.parse_args()
+
+    if not 2 <= len(args.policies) <= 6:
+        parser.error("Coup needs 2-6 seats")
+
+    if args.scaling:
+        print(f"{'workers':>8} {'games/s':>10} {'speedup':>8} {'per-core':>9}")
+        baseline = None
+        workers = 1
+        while workers <= args.workers:
+            results, elapsed = run(args.policies, args.games, workers, args.seed, args.chunk)
+            speed = results.games / elapsed
+            baseline = baseline or speed
+            print(f"{workers:>8} {speed:>10,.0f} {speed / baseline:>7.2f}x {speed / baseline / workers * 100:>8.0f}%")
+            workers *= 2
+
+    results, elapsed = run(args.policies, args.games, args.workers, args.seed, args.chunk)
+    report(results, elapsed, args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# policies.py
+import random
+from coup.models import Income, Foreign_Aid, Coup, Tax, Exchange, Assassinate, Steal
+from coup.engine import (
+    GameState, Move,
+    ACTION, RESPONSE, BLOCK_RESPONSE, LOSE_INFLUENCE, EXCHANGE, EXAMINE_REVEAL, EXAMINE_DECIDE,
+    CHALLENGE, BLOCK, ALLOW, SWAP, KEEP,
+)
+
+# Rough value of holding each role, used to pick which card to give up
+ROLE_VALUE = {"Duke": 5, "Captain": 4, "Assassin": 4, "Contessa": 3, "Inquisitor": 2}
+
+
+class Policy:
+    """
+    Base class for self-play policies.
+    choose() gets the moves available to one seat; in response windows ALLOW means pass.
+    Policies may only look at public information and their own hand.
+    """
+    name = "base"
+
+    def choose(self, state: GameState, seat: int, moves: list[Move], rng: random.Random) -> Move:
+        raise NotImplementedError
+
+    def __repr__(self):
+        return f"<Policy {self.name}>"
+
+
+class RandomPolicy(Policy):
+    """Uniformly random legal moves."""
+    name = "random"
+
+    def choose(self, state, seat, moves, rng):
+        return rng.choice(moves)
+
+
+class HeuristicPolicy(Policy):
+    """
+    Plays mostly honestly: claims roles it holds, bluffs at bluff_rate,
+    challenges claims it can count out, and blocks with roles it holds.
+    """
+    name = "heuristic"
+
+    def __init__(self, bluff_rate: float = 0.1, challenge_rate: float = 0.05):
+        self.bluff_rate = bluff_rate
+        self.challenge_rate = challenge_rate
+
+    def choose(self, state, seat, moves, rng):
+        phase = state.phase
+        hand = state.players[seat].hand
+
+        if phase == ACTION:
+            return self.choose_action(state, seat, moves, rng)
+
+        if phase in (RESPONSE, BLOCK_RESPONSE):
+            claimed = state.action.role if phase == RESPONSE else state.block_role
+            blocks = [m for m in moves if m.kind == BLOCK]
+            if blocks:
+                honest = [m for m in blocks if m.card in hand]
+                if honest:
+                    return honest[0]
+                # Bluff a block when our influence is on the line
+                if state.action is Assassinate and rng.random() < self.bluff_rate * 3:
+                    return blocks[0]
+                if rng.random() < self.bluff_rate:
+                    return rng.choice(blocks)
+            challenge = next((m for m in moves if m.kind == CHALLENGE), None)
+            if challenge and claimed:
+                if self.visible_copies(state, seat, claimed) >= 3:
+                    return challenge
+                if rng.random() < self.challenge_rate:
+                    return challenge
+            return Move(ALLOW)
+
+        if phase in (LOSE_INFLUENCE, EXCHANGE, EXAMINE_REVEAL):
+            # Give up (or show) the least valuable card
+            return min(moves, key=lambda m: ROLE_VALUE.get(m.card, 0))
+
+        if phase == EXAMINE_DECIDE:
+            # Force a swap if the shown card is strong
+            move = SWAP if ROLE_VALUE.get(state.examined, 0) >= 4 else KEEP
+            return Move(move, seat)
+
+        return rng.choice(moves)
+
+    def choose_action(self, state, seat, moves, rng):
+        hand = state.players[seat].hand
+        coins = state.players[seat].coins
+        by_action = {}
+        for move in moves:
+            by_action.setdefault(move.action, []).append(move)
+
+        def richest(options):
+            # Target the opponent with the most influence, then coins
+            return max(options, key=lambda m: (len(state.players[m.target].hand), state.players[m.target].coins))
+
+        if Coup in by_action and (coins >= 10 or coins >= 7 and rng.random() < 0.8):
+            return richest(by_action[Coup])
+        if Assassinate in by_action and ("Assassin" in hand or rng.random() < self.bluff_rate):
+            return richest(by_action[Assassinate])
+        if "Duke" in hand or rng.random() < self.bluff_rate:
+            return by_action[Tax][0]
+        if Steal in by_action and ("Captain" in hand or rng.random() < self.bluff_rate):
+            targets = [m for m in by_action[Steal] if state.players[m.target].coins >= 2]
+            if targets:
+                return rng.choice(targets)
+        if "Inquisitor" in hand and rng.random() < 0.3:
+            return by_action[Exchange][0]
+        return by_action[Foreign_Aid][0] if rng.random() < 0.5 else by_action[Income][0]
+
+    @staticmethod
+    def visible_copies(state: GameState, seat: int, role: str) -> int:
+        """Copies of role this seat can see: its own hand plus revealed cards."""
+        return state.players[seat].hand.count(role) + state.revealed.count(role)
+
+
+POLICIES = {
+    "random": RandomPolicy,
+    "heuristic": HeuristicPolicy,
+    "honest": lambda: HeuristicPolicy(bluff_rate=0.0, challenge_rate=0.0),
+}
+
+
+def make_policy(name: str) -> Policy:
+    if name not in POLICIES:
+        raise ValueError(f"Unknown policy {name!r}; choose from {', '.join(POLICIES)}")
+    policy = POLICIES[name]()
+    policy.name = name
+    return policy
@@ -0,0 +1,114 @@
+# runner.py
+import os
+import time
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from coup.engine import (
+    GameState, Move, new_game, legal_actions, apply,
+    RESPONSE, BLOCK_RESPONSE, GAME_OVER, ALLOW,
+)
+from .policies import Policy, make_policy
+
+MAX_MOVES = 2000 # Safety cap; games that hit it are counted as draws
+
+
+class Results:
+    """Aggregated outcome counts for a batch of games. Batches merge with +=."""
+    def __init__(self):
+        self.games = 0
+        self.draws = 0
+        self.turns = 0
+        self.moves = 0
+        self.seat_games = Counter()
+        self.seat_wins = Counter()
+        self.hand_games = Counter()
+        self.hand_wins = Counter()
+        self.policy_games = Counter()
+        self.policy_wins = Counter()
+
+    def __iadd__(self, other: "Results"):
+        self.games += other.games
+        self.draws += other.draws
+        self.turns += other.turns
+        self.moves += other.moves
+        for name in ("seat_games", "seat_wins", "hand_games", "hand_wins", "policy_games", "policy_wins"):
+            getattr(self, name).update(getattr(other, name))
+        return self
+
+    def record(self, start: GameState, end: GameState, seat_policies: list[str], moves: int):
+        self.games += 1
+        self.turns += end.turn_count
+        self.moves += moves
+        for seat, player in enumerate(start.players):
+            hand = tuple(sorted(player.hand))
+            won = end.winner == seat
+            self.seat_games[seat] += 1
+            self.hand_games[hand] += 1
+            self.policy_games[seat_policies[seat]] += 1
+            if won:
+                self.seat_wins[seat] += 1
+                self.hand_wins[hand] += 1
+                self.policy_wins[seat_policies[seat]] += 1
+        if end.winner is None:
+            self.draws += 1
+
+
+def choose(state: GameState, policies: list[Policy], rng: random.Random) -> Move:
+    """Ask the deciding policies for the next move."""
+    moves = legal_actions(state)
+    if state.phase in (RESPONSE, BLOCK_RESPONSE):
+        # Offer the window to each seat clockwise from the actor; first non-pass wins
+        n = len(state.players)
+        for i in range(1, n + 1):
+            seat = (state.turn + i) % n
+            options = [m for m in moves if m.seat == seat]
+            if not options:
+                continue
+            move = policies[seat].choose(state, seat, options + [Move(ALLOW)], rng)
+            if move.kind != ALLOW:
+                return move
+        return Move(ALLOW)
+    seat = moves[0].seat
+    return policies[seat].choose(state, seat, moves, rng)
+
+
+def play_game(policies: list[Policy], rng: random.Random) -> tuple[GameState, GameState, int]:
+    """Play one complete game. Returns the starting state, final state and move count."""
+    start = state = new_game(list(range(len(policies))), rng)
+    moves = 0
+    while state.phase != GAME_OVER and moves < MAX_MOVES:
+        state = apply(state, choose(state, policies, rng), rng)
+        moves += 1
+    return start, state, moves
+
+
+def run_batch(policy_names: list[str], games: int, seed: int, offset: int = 0) -> Results:
+    """Play a batch of games in one process. Policies rotate seats each game to cancel seat bias."""
+    rng = random.Random(seed)
+    policies = [make_policy(name) for name in policy_names]
+    n = len(policies)
+    results = Results()
+    for g in range(games):
+        shift = (offset + g) % n
+        seated = policies[shift:] + policies[:shift]
+        start, end, moves = play_game(seated, rng)
+        results.record(start, end, [p.name for p in seated], moves)
+    return results
+
+
+def run(policy_names: list[str], games: int, workers: int | None = None, seed: int = 0, chunk: int = 500) -> tuple[Results, float]:
+    """Spread games across a process pool. Returns merged results and elapsed seconds."""
+    workers = workers or os.cpu_count() or 1
+    batches = [(i, min(chunk, games - i)) for i in range(0, games, chunk)]
+    results = Results()
+    start = time.perf_counter()
+    if workers == 1:
+        for offset, size in batches:
+            results += run_batch(policy_names, size, seed + offset, offset)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(run_batch, policy_names, size, seed + offset, offset) for offset, size in batches]
+            for future in futures:
+                results += future.result()
+    return results, time.perf_counter() - start
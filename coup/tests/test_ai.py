@@ -0,0 +1,38 @@
+# tests/test_ai.py
+import random
+import pytest
+from collections import Counter
+from coup.engine import new_game, apply, legal_actions, Move, ACT, ALLOW, RESPONSE
+from coup.models import Tax
+from coup.ai import search, determinize, is_bot_id
+
+def all_cards(state):
+    cards = list(state.deck) + [state.burned]
+    for player in state.players:
+        cards.extend(player.hand)
+    return Counter(cards)
+
+class TestAI:
+    def test_determinize_keeps_own_hand_and_cards(self):
+        rng = random.Random(0)
+        state = new_game([1, 2, 3], rng)
+        world = determinize(state, 0, rng)
+        assert world.players[0] == state.players[0]
+        assert all_cards(world) == all_cards(state)
+        assert [len(p.hand) for p in world.players] == [len(p.hand) for p in state.players]
+
+    def test_search_returns_own_legal_move(self):
+        state = new_game([1, 2], random.Random(1))
+        move = search(state, 0, budget_ms=50, seed=1)
+        assert move in legal_actions(state)
+
+    def test_search_can_pass_response(self):
+        state = new_game([1, 2], random.Random(2))
+        state = apply(state, Move(ACT, 0, Tax))
+        assert state.phase == RESPONSE
+        move = search(state, 1, budget_ms=50, seed=1)
+        assert move.kind == ALLOW or move.seat == 1
+
+    def test_bot_ids(self):
+        assert is_bot_id(-1)
+        assert not is_bot_id(1234)
@@ -0,0 +1,90 @@
+# tests/test_board.py
+import asyncio
+from collections import Counter
+from coup.controllers.board import Board, ABANDONED
+from coup.controllers.outbound import get_outbound
+from coup.controllers.game import Game
+from coup.engine import Move, ACT, ALLOW
+from coup.views import board_fields
+
+class BoardMessage:
+    def __init__(self, thread, embed):
+        self.thread = thread
+        self.embed = embed
+
+    async def edit(self, embed=None, **kwargs):
+        self.thread.calls["edit"] += 1
+        self.embed = embed
+        return self
+
+    async def pin(self):
+        self.thread.calls["pin"] += 1
+
+    async def delete(self):
+        self.thread.calls["delete"] += 1
+
+class BoardThread:
+    def __init__(self):
+        self.calls = Counter()
+        self.messages = []
+
+    async def send(self, content=None, embed=None, **kwargs):
+        self.calls["send"] += 1
+        message = BoardMessage(self, embed)
+        self.messages.append(message)
+        return message
+
+def board_game():
+    game = Game({1: "a", 2: "b", 3: "c"}, game_id=8)
+    game.board = Board()
+    game.game_thread = BoardThread()
+    return game
+
+class TestBoard:
+    def test_fields(self):
+        game = board_game()
+        fields = board_fields(game, ["x", "y"])
+        actor = game.seats[game.state.turn].name
+        assert fields["title"] == f"{actor}'s Turn"
+        assert f"▶ {actor} - Influence: 2; Coins: 2" in fields["Players"].splitlines()
+        assert fields["Log"] == "x\ny"
+        assert len(board_fields(game, ["z" * 300] * 10)["Log"]) <= 1024
+
+    def test_unchanged_status_is_not_re_rendered(self):
+        async def run():
+            game = board_game()
+            await game.board.show_status(game)
+            await game.board.show_status(game)
+            await get_outbound().join()
+            assert game.game_thread.calls == Counter(send=1, pin=1) # The pin is queued like every other call
+            assert game.board.skipped == 1
+        asyncio.run(run())
+
+    def test_a_game_stays_on_two_messages(self):
+        async def run():
+            game = board_game()
+            game.outbox.start()
+            await game.begin_turn()
+            for _ in range(4): # Tax, unchallenged, four times over
+                tax = next(m for m in game.legal_moves if m.kind == ACT and m.action.name == "Collect Tax")
+                await game.submit(tax)
+                await game.submit(Move(ALLOW))
+                await game.begin_turn()
+            await game.drain()
+            game.tasks.cancel_all()
+            game.outbox.stop()
+            calls = game.game_thread.calls
+            assert calls["send"] == 2 and calls["delete"] == 0 # The status board and the control message
+            status, control = game.game_thread.messages
+            assert "Collect Tax" in "".join(field.value for field in status.embed.fields)
+            assert calls["edit"] > 0
+        asyncio.run(run())
+
+    def test_close_shows_the_outcome(self):
+        async def run():
+            for abandoned, title in ((False, "The game is over."), (True, ABANDONED)):
+                game = board_game()
+                control = await game.board.show_control(game, None, None)
+                await game.board.close(abandoned=abandoned)
+                assert control.embed.title == title
+        asyncio.run(run())
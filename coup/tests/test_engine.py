@@ -0,0 +1,151 @@
+# tests/test_engine.py
+import random
+import pytest
+from coup.models import Player, Deck, Income, Foreign_Aid, Tax, Coup, Exchange, Assassinate, Steal, Examine
+from coup.engine import (
+    GameState, PlayerState, Move, new_game, from_models, to_models, legal_actions, default_move, apply,
+    ACTION, RESPONSE, BLOCK_RESPONSE, LOSE_INFLUENCE, EXCHANGE, EXAMINE_DECIDE, GAME_OVER,
+    ACT, CHALLENGE, BLOCK, ALLOW, LOSE, RETURN, SWAP, KEEP,
+)
+
+def make_state(hands, coins=None, deck=("Duke", "Captain", "Contessa")):
+    coins = coins or [2] * len(hands)
+    players = tuple(PlayerState(i, c, tuple(h)) for i, (h, c) in enumerate(zip(hands, coins)))
+    return GameState(players=players, deck=tuple(deck))
+
+class TestEngine:
+    def test_new_game(self):
+        state = new_game([10, 20, 30], random.Random(0))
+        assert [p.id for p in state.players] == [10, 20, 30]
+        assert all(len(p.hand) == 2 and p.coins == 2 for p in state.players)
+        assert len(state.deck) == 15 - 1 - 6
+        assert state.phase == ACTION
+
+    def test_income_ends_turn(self):
+        state = make_state([["Duke", "Duke"], ["Captain", "Contessa"]])
+        state = apply(state, Move(ACT, 0, Income))
+        assert state.players[0].coins == 3
+        assert state.phase == ACTION and state.turn == 1
+
+    def test_must_coup(self):
+        state = make_state([["Duke", "Duke"], ["Captain", "Contessa"]], coins=[10, 2])
+        moves = legal_actions(state)
+        assert moves == [Move(ACT, 0, Coup, 1)]
+
+    def test_unaffordable_actions_not_offered(self):
+        state = make_state([["Duke", "Duke"], ["Captain", "Contessa"]])
+        actions = {m.action for m in legal_actions(state)}
+        assert Coup not in actions and Assassinate not in actions
+
+    def test_challenge_bluff(self):
+        state = make_state([["Captain", "Contessa"], ["Duke", "Duke"]])
+        state = apply(state, Move(ACT, 0, Tax))
+        assert state.phase == RESPONSE
+        state = apply(state, Move(CHALLENGE, 1))
+        # Actor bluffed and must choose a card to lose; no coins gained
+        assert state.phase == LOSE_INFLUENCE and state.losses == (0,)
+        state = apply(state, Move(LOSE, 0, card="Captain"))
+        assert state.players[0].hand == ("Contessa",)
+        assert state.players[0].coins == 2
+        assert state.revealed == ("Captain",)
+        assert state.phase == ACTION and state.turn == 1
+
+    def test_challenge_proven(self):
+        state = make_state([["Duke", "Contessa"], ["Captain"]], coins=[2, 2])
+        state = apply(state, Move(ACT, 0, Tax), rng=random.Random(0))
+        events = []
+        state = apply(state, Move(CHALLENGE, 1), rng=random.Random(0), events=events)
+        # Challenger loses their last card; actor swaps Duke for a new card
+        assert state.phase == GAME_OVER and state.winner == 0
+        assert len(state.players[0].hand) == 2
+        assert ("challenge_lost", 1, 0, "Duke") in events
+        assert ("eliminated", 1) in events
+
+    def test_block_and_allow(self):
+        state = make_state([["Assassin", "Duke"], ["Contessa", "Captain"]], coins=[3, 2])
+        state = apply(state, Move(ACT, 0, Assassinate, 1))
+        assert Move(BLOCK, 1, card="Contessa") in legal_actions(state)
+        state = apply(state, Move(BLOCK, 1, card="Contessa"))
+        assert state.phase == BLOCK_RESPONSE
+        state = apply(state, Move(ALLOW))
+        # Blocked assassination still costs the actor
+        assert state.players[0].coins == 0
+        assert len(state.players[1].hand) == 2
+        assert state.turn == 1
+
+    def test_foreign_aid_blockable_by_anyone(self):
+        state = make_state([["Duke", "Duke"], ["Captain", "Contessa"], ["Captain", "Contessa"]])
+        state = apply(state, Move(ACT, 0, Foreign_Aid))
+        blockers = {m.seat for m in legal_actions(state) if m.kind == BLOCK}
+        assert blockers == {1, 2}
+
+    def test_steal(self):
+        state = make_state([["Captain", "Duke"], ["Contessa", "Duke"]], coins=[2, 1])
+        state = apply(state, Move(ACT, 0, Steal, 1))
+        state = apply(state, Move(ALLOW))
+        assert state.players[0].coins == 3
+        assert state.players[1].coins == 0
+
+    def test_exchange(self):
+        state = make_state([["Inquisitor", "Duke"], ["Contessa", "Duke"]])
+        state = apply(state, Move(ACT, 0, Exchange))
+        state = apply(state, Move(ALLOW))
+        assert state.phase == EXCHANGE
+        assert len(state.players[0].hand) == 3
+        state = apply(state, Move(RETURN, 0, card="Duke"), rng=random.Random(0))
+        assert len(state.players[0].hand) == 2
+        assert len(state.deck) == 3
+
+    def test_examine_single_card_skips_reveal(self):
+        state = make_state([["Inquisitor", "Duke"], ["Contessa"]])
+        state = apply(state, Move(ACT, 0, Examine, 1))
+        state = apply(state, Move(ALLOW))
+        assert state.phase == EXAMINE_DECIDE and state.examined == "Contessa"
+        state = apply(state, Move(SWAP, 0), rng=random.Random(0))
+        assert len(state.players[1].hand) == 1
+        assert state.phase == ACTION
+
+    def test_coup_eliminates(self):
+        state = make_state([["Duke", "Duke"], ["Captain"]], coins=[7, 2])
+        state = apply(state, Move(ACT, 0, Coup, 1))
+        assert state.phase == GAME_OVER and state.winner == 0
+        assert state.players[0].coins == 0
+
+    def test_random_games_conserve_cards(self):
+        rng = random.Random(1)
+        for _ in range(200):
+            state = new_game(list(range(rng.randint(2, 6))), rng)
+            while state.phase != GAME_OVER:
+                state = apply(state, rng.choice(legal_actions(state)), rng)
+                cards = sum(len(p.hand) for p in state.players) + len(state.deck) + len(state.revealed)
+                assert cards == 14
+                assert all(p.coins >= 0 for p in state.players)
+
+    def test_default_moves(self):
+        state = make_state([["Duke", "Duke"], ["Captain", "Contessa"]])
+        assert default_move(state) == Move(ACT, 0, Income)
+        forced = make_state([["Duke", "Duke"], ["Captain", "Contessa"]], coins=[10, 2])
+        assert default_move(forced) == Move(ACT, 0, Coup, 1)
+        rng = random.Random(4)
+        for _ in range(50):
+            state = new_game([1, 2, 3], rng)
+            while state.phase != GAME_OVER:
+                move = default_move(state, rng)
+                assert move in legal_actions(state)
+                if state.phase in (RESPONSE, BLOCK_RESPONSE):
+                    assert move == Move(ALLOW)
+                if state.phase == EXAMINE_DECIDE:
+                    assert move == Move(KEEP, state.turn)
+                state = apply(state, rng.choice(legal_actions(state)), rng)
+
+    def test_model_round_trip(self):
+        deck = Deck()
+        players = [Player(1, "a"), Player(2, "b")]
+        for player in players:
+            player.gain_influence(deck.draw())
+            player.gain_influence(deck.draw())
+        state = from_models(players, deck)
+        state = apply(state, Move(ACT, 0, Income))
+        to_models(state, players, deck)
+        assert players[0].coins == 3
+        assert deck.deck_size() == len(state.deck)
@@ -0,0 +1,83 @@
+# tests/test_events.py
+import random
+import pytest
+from coup.engine import (
+    new_game, legal_actions, apply, GAME_OVER,
+    move_rng, encode_move, decode_move, encode_events, decode_events,
+)
+from coup.db import DatabaseWriter, EventStore, ReplayError
+
+class FakeGame:
+    """Just the attributes EventStore.start reads from a Game."""
+    def __init__(self, game_id, state, seed):
+        self.game_id = game_id
+        self.state = state
+        self.seed = seed
+        self.started = 0.0
+        self.seats = [type("Seat", (), {"id": p.id, "name": f"P{p.id}"}) for p in state.players]
+
+def log_game(store, game_id, seed):
+    """Play a random game the way Game does, logging every move. Returns the state after each move."""
+    rng = random.Random(seed)
+    state = new_game([1, 2, 3, 4], rng)
+    store.start(FakeGame(game_id, state, seed))
+    states = [state]
+    seq = 0
+    while state.phase != GAME_OVER:
+        seq += 1
+        events = []
+        move = rng.choice(legal_actions(state))
+        after = apply(state, move, move_rng(seed, seq), events)
+        store.append(game_id, seq, move, events, state, after)
+        state = after
+        states.append(state)
+    assert store.writer.flush()
+    return states
+
+@pytest.fixture
+def store(tmp_path):
+    writer = DatabaseWriter(str(tmp_path / "coup.db"))
+    store = EventStore(writer, interval=8)
+    writer.start()
+    yield store
+    writer.stop()
+
+class TestEncoding:
+    def test_round_trip(self):
+        rng = random.Random(0)
+        for _ in range(20):
+            state = new_game([1, 2, 3], rng)
+            while state.phase != GAME_OVER:
+                move = rng.choice(legal_actions(state))
+                events = []
+                state = apply(state, move, rng, events)
+                assert decode_move(encode_move(move)) == move
+                assert decode_events(encode_events(events)) == events
+
+class TestEventStore:
+    def test_replay_every_move(self, store):
+        states = log_game(store, 1, 5)
+        for seq, state in enumerate(states):
+            replay = store.replay(1, seq=seq)
+            assert replay.seq == seq
+            assert replay.state == state
+            assert replay.applied < store.interval
+        assert store.replay(1).state == states[-1]
+        assert store.last_game_id() == 1
+
+    def test_replay_to_turn(self, store):
+        states = log_game(store, 2, 6)
+        for turn in range(1, states[-1].turn_count + 1):
+            expected = next(s for s in states if s.turn_count >= turn)
+            assert store.replay(2, turn=turn).state == expected
+
+    def test_tampered_log_is_detected(self, store):
+        log_game(store, 3, 7)
+        store.writer.submit(lambda conn: conn.execute(
+            "UPDATE event_log SET events = ? WHERE game_id = 3 AND seq = 1", (encode_events([("turn", 0)]),)
+        ))
+        assert store.writer.flush()
+        with pytest.raises(ReplayError):
+            store.replay(3, seq=1)
+        with pytest.raises(KeyError):
+            store.replay(99)
@@ -0,0 +1,25 @@
+# tests/test_game.py
+import random
+from coup.controllers.game import Game
+from coup.engine import legal_actions, apply, GAME_OVER
+
+class TestGameIndexes:
+    def test_indexes_match_scans(self):
+        rng = random.Random(4)
+        for _ in range(10):
+            game = Game({i: f"P{i}" for i in range(1, 6)})
+            while game.state.phase != GAME_OVER:
+                game.state = apply(game.state, rng.choice(legal_actions(game.state)), rng)
+                game.sync_models()
+
+                alive = [p for p in game.seats if p.is_alive()]
+                assert game.alive_ids == {p.id for p in alive}
+                assert game.get_player_ids() == [p.id for p in alive]
+                n = len(game.seats)
+                order = [game.seats[(game.state.turn + i) % n] for i in range(1, n)]
+                assert list(game.turn_order) == [p for p in order if p.is_alive()]
+                assert game.legal_moves == set(legal_actions(game.state))
+                for seat, player in enumerate(game.seats):
+                    assert game.moves_for(player.id) == [m for m in legal_actions(game.state) if m.seat == seat]
+                    assert game.get_player_by_id(player.id) is (player if player.is_alive() else None)
+            assert len(game.dead) == 4
@@ -0,0 +1,52 @@
+# tests/test_history.py
+import random
+import pytest
+from coup.engine import GameResult, new_game, legal_actions, apply, GAME_OVER
+from coup.db import DatabaseWriter, GameHistory
+
+def play(ids, seed, game_id=1):
+    """Play a random game, recording it the way Game does."""
+    rng = random.Random(seed)
+    state = new_game(ids, rng)
+    result = GameResult(state, {i: f"P{i}" for i in ids}, game_id, started=100.0)
+    while state.phase != GAME_OVER:
+        events = []
+        before = state
+        state = apply(state, rng.choice(legal_actions(state)), rng, events)
+        result.record(events, before)
+    result.finish(state, ended=160.0)
+    return state, result
+
+@pytest.fixture
+def history(tmp_path):
+    writer = DatabaseWriter(str(tmp_path / "coup.db"))
+    history = GameHistory(writer)
+    writer.start()
+    yield history
+    writer.stop()
+
+class TestGameResult:
+    def test_placements_and_winner(self):
+        for seed in range(30):
+            ids = list(range(1, 2 + seed % 5 + 1))
+            state, result = play(ids, seed)
+            assert sorted(p.placement for p in result.players) == list(range(1, len(ids) + 1))
+            assert result.winner_id == state.players[state.winner].id
+            assert result.turns == state.turn_count
+            assert result.duration == 60.0
+            assert sum(result.action_counts().values()) > 0
+
+class TestGameHistory:
+    def test_record_and_query(self, history):
+        for game_id in range(1, 4):
+            _, result = play([1, 2, 3], game_id, game_id)
+            result.guild_id = 50
+            assert history.record(result)
+        assert history.writer.flush()
+
+        games = history.games_for_user(2)
+        assert len(games) == 3
+        assert all(players == 3 for _, _, _, players in games)
+        assert len(history.games_in_guild(50, limit=2)) == 2
+        assert history.games_in_guild(51) == []
+        assert history.writer.stats()["failed"] == 0
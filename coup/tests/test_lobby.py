@@ -0,0 +1,177 @@
+# tests/test_lobby.py
+import random
+import asyncio
+from coup.controllers import lobby as lobby_module
+from coup.controllers.game import Game
+from coup.controllers.lobby import Lobby
+from coup.controllers.registry import LobbyRegistry
+from coup.db.snapshots import Snapshot
+from coup.engine import PackedState, new_game, legal_actions, apply, GAME_OVER
+from coup.controllers.timers import get_timers
+from coup.views.lobby_views import CLOSED_STATUS, START, CANCEL, EMPTY, EXPIRED, leave_bt, cancel_bt
+
+class FakeUser:
+    def __init__(self, user_id, name):
+        self.id = user_id
+        self.display_name = name
+
+class FakeMessage:
+    def __init__(self, ctx, embed, view):
+        self.ctx = ctx
+        self.embed = embed
+        self.view = view
+
+    async def edit(self, embed=None, view=None, **kwargs):
+        self.ctx.edits += 1
+        self.embed = embed
+        self.view = view
+        return self
+
+class FakeContext:
+    def __init__(self, host):
+        self.author = host
+        self.sends = 0
+        self.edits = 0
+        self.message = None
+
+    async def send(self, embed=None, view=None, **kwargs):
+        self.sends += 1
+        self.message = FakeMessage(self, embed, view)
+        return self.message
+
+class FakeResponse:
+    def __init__(self):
+        self.sent = []
+
+    async def send_message(self, content=None, **kwargs):
+        self.sent.append(content)
+
+    async def defer(self):
+        self.sent.append("defer")
+
+class FakeInteraction:
+    def __init__(self, user):
+        self.user = user
+        self.response = FakeResponse()
+
+HOST = FakeUser(1, "host")
+
+async def opened(lobby, ctx):
+    """Run the lobby until its message is up and its expiry timer armed."""
+    task = asyncio.create_task(lobby.run(ctx))
+    while not get_timers().pending:
+        await asyncio.sleep(0.001)
+    return task
+
+def footer(ctx):
+    return ctx.message.embed.footer.text
+
+class TestLobbyLifecycle:
+    def test_close_keeps_the_first_reason(self):
+        async def run():
+            lobby = Lobby(1, FakeContext(HOST))
+            assert not lobby.is_closed()
+            lobby.close(CANCEL)
+            lobby.close(START)
+            assert lobby.is_closed() and lobby.closed.result() == CANCEL
+        asyncio.run(run())
+
+    def test_unstarted_lobby_expires(self, monkeypatch):
+        monkeypatch.setattr(lobby_module, "LOBBY_TIMEOUT", 0.01)
+        async def run():
+            ctx = FakeContext(HOST)
+            lobby = Lobby(1, ctx)
+            assert await lobby.run(ctx) is None
+            assert lobby.closed.result() == EXPIRED
+            assert footer(ctx) == CLOSED_STATUS[EXPIRED] and ctx.message.view is None
+            assert ctx.sends == 1 and ctx.edits == 1 # The open lobby, then edited closed
+            get_timers().stop()
+        asyncio.run(run())
+
+    def test_host_cancels_the_lobby(self):
+        async def run():
+            ctx = FakeContext(HOST)
+            lobby = Lobby(1, ctx)
+            task = await opened(lobby, ctx)
+            assert get_timers().pending == 1 # The expiry timer
+
+            guest = FakeInteraction(FakeUser(2, "guest"))
+            await cancel_bt(lobby, ctx).callback(guest)
+            assert guest.response.sent == ["Only the host can cancel the lobby."] and not lobby.is_closed()
+
+            await cancel_bt(lobby, ctx).callback(FakeInteraction(HOST))
+            assert await task is None
+            assert lobby.closed.result() == CANCEL and footer(ctx) == CLOSED_STATUS[CANCEL]
+            assert get_timers().pending == 0 # Expiry cancelled
+            get_timers().stop()
+        asyncio.run(run())
+
+    def test_lobby_closes_when_the_last_player_leaves(self):
+        async def run():
+            ctx = FakeContext(HOST)
+            lobby = Lobby(1, ctx)
+            lobby.add_bot()
+            task = await opened(lobby, ctx)
+            await leave_bt(lobby, ctx).callback(FakeInteraction(HOST))
+            assert await task is None
+            assert lobby.closed.result() == EMPTY and footer(ctx) == CLOSED_STATUS[EMPTY]
+            get_timers().stop()
+        asyncio.run(run())
+
+class TestLobbyUpdates:
+    def test_updates_within_the_window_share_one_edit(self, monkeypatch):
+        monkeypatch.setattr(lobby_module, "UPDATE_WINDOW", 0.02)
+        async def run():
+            ctx = FakeContext(HOST)
+            lobby = Lobby(1, ctx)
+            await lobby.update_message(ctx)
+            for i in range(5):
+                lobby.add_player(FakeUser(10 + i, f"guest {i}"))
+                lobby.request_update(ctx)
+            await asyncio.sleep(0.05)
+            assert ctx.sends == 1 and ctx.edits == 1
+            assert len(ctx.message.embed.fields[0].value.splitlines()) == 6
+            assert lobby.rest_calls == 2 and lobby.update_requests == 6
+            assert lobby.rest_calls_saved() == 2 * 6 - 1 - 2 # Versus a delete and a send per update
+            get_timers().stop()
+        asyncio.run(run())
+
+    def test_closing_drops_the_pending_update(self, monkeypatch):
+        monkeypatch.setattr(lobby_module, "UPDATE_WINDOW", 0.02)
+        async def run():
+            ctx = FakeContext(HOST)
+            lobby = Lobby(1, ctx)
+            await lobby.update_message(ctx)
+            lobby.request_update(ctx)
+            lobby.close(CANCEL)
+            await asyncio.sleep(0.05)
+            assert ctx.edits == 0 and lobby.update_timer is None and get_timers().pending == 0
+            get_timers().stop()
+        asyncio.run(run())
+
+def snapshot_with_a_dead_seat() -> Snapshot:
+    """Snapshot of a 4 player game that is still running after someone was eliminated."""
+    rng = random.Random(5)
+    while True:
+        state = new_game([1, 2, 3, 4], rng)
+        while state.phase != GAME_OVER and all(p.hand for p in state.players):
+            state = apply(state, rng.choice(legal_actions(state)), rng)
+        if state.phase != GAME_OVER:
+            players = [(p.id, f"P{p.id}") for p in state.players]
+            return Snapshot(9, 100, 200, 300, players, PackedState.from_state(state), 1, 20, 0.0, 0.0)
+
+class TestRestoredLobby:
+    def test_eliminated_players_are_not_indexed(self):
+        async def run():
+            snapshot = snapshot_with_a_dead_seat()
+            game = Game.from_snapshot(snapshot)
+            dead = [p.id for p in game.seats if p.id not in game.alive_ids]
+            assert len(dead) == 1
+            lobby = Lobby(snapshot.game_id, game=game)
+            registry = LobbyRegistry()
+            registry.add(lobby, snapshot.guild_id, snapshot.channel_id)
+            assert lobby.is_closed() and lobby.closed.result() == START
+            assert set(lobby.players) == game.alive_ids
+            assert registry.lobby_of_user(dead[0]) is None
+            assert all(registry.lobby_of_user(user_id) is lobby for user_id in game.alive_ids)
+        asyncio.run(run())
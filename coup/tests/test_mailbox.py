@@ -0,0 +1,59 @@
+# tests/test_mailbox.py
+import asyncio
+from coup.controllers.mailbox import Mailbox
+
+class TestMailbox:
+    def test_commands_run_one_at_a_time_in_order(self):
+        async def run():
+            mailbox = Mailbox("test")
+            trace = []
+            async def command(i):
+                trace.append(("start", i))
+                await asyncio.sleep(0) # Yield mid-command: nothing else may interleave
+                trace.append(("end", i))
+            for i in range(5):
+                assert mailbox.post(command, i)
+            mailbox.start()
+            await mailbox.join()
+            mailbox.stop()
+            assert trace == [(edge, i) for i in range(5) for edge in ("start", "end")]
+            assert mailbox.stats()["processed"] == 5
+        asyncio.run(run())
+
+    def test_failing_command_does_not_stop_the_consumer(self):
+        async def run():
+            mailbox = Mailbox("test")
+            ran = []
+            async def fail():
+                raise RuntimeError("boom")
+            async def succeed():
+                ran.append(True)
+            mailbox.start()
+            mailbox.post(fail)
+            mailbox.post(succeed)
+            await mailbox.join()
+            mailbox.stop()
+            assert ran == [True]
+            assert mailbox.stats()["failed"] == 1
+        asyncio.run(run())
+
+    def test_backpressure(self):
+        async def run():
+            mailbox = Mailbox("test", maxsize=2)
+            async def noop():
+                pass
+            assert mailbox.post(noop) and mailbox.post(noop)
+            assert not mailbox.post(noop) # Full: interactions are turned away
+            assert mailbox.stats()["rejected"] == 1
+
+            # send() waits for room instead
+            sent = asyncio.create_task(mailbox.send(noop))
+            await asyncio.sleep(0)
+            assert not sent.done()
+            mailbox.start()
+            await sent
+            await mailbox.join()
+            mailbox.stop()
+            stats = mailbox.stats()
+            assert stats["processed"] == 3 and stats["depth_max"] == 2
+        asyncio.run(run())
@@ -0,0 +1,104 @@
+# tests/test_outbound.py
+import asyncio
+import pytest
+from coup.controllers.outbound import OutboundScheduler, PROMPT, LOG, EDIT, CLEANUP
+
+class FakeMessage:
+    def __init__(self, channel, content):
+        self.channel = channel
+        self.content = content
+
+    async def edit(self, content=None, **kwargs):
+        self.channel.calls.append(("edit", content))
+        self.content = content
+        return self
+
+    async def delete(self):
+        self.channel.calls.append(("delete", self.content))
+
+class FakeChannel:
+    def __init__(self, channel_id=1):
+        self.id = channel_id
+        self.calls = []
+
+    async def send(self, content=None, **kwargs):
+        await asyncio.sleep(0)
+        if content == "boom":
+            raise RuntimeError("boom")
+        self.calls.append(("send", content))
+        return FakeMessage(self, content)
+
+class TestOutboundScheduler:
+    def test_prompts_keep_their_place_behind_queued_logs(self):
+        async def run():
+            outbound = OutboundScheduler()
+            channel = FakeChannel()
+            old = await outbound.send(channel, PROMPT, content="old prompt")
+            outbound.delete(old)
+            for i in range(3):
+                outbound.send(channel, LOG, content=f"log {i}")
+            prompt = await outbound.send(channel, PROMPT, content="prompt")
+            await outbound.join(channel)
+            assert prompt.content == "prompt"
+            assert channel.calls == (
+                [("send", "old prompt")] + [("send", f"log {i}") for i in range(3)]
+                + [("send", "prompt"), ("delete", "old prompt")] # Ahead of the cleanup queued before it
+            )
+            stats = outbound.stats()
+            assert stats["delivered"] == 6 and stats["queued"] == 0 and stats["depth_max"] == 5
+        asyncio.run(run())
+
+    def test_a_throttled_log_holds_back_the_prompt(self):
+        async def run():
+            outbound = OutboundScheduler(rate=1, per=0.05)
+            channel = FakeChannel()
+            lobby = await outbound.send(channel, EDIT, content="lobby")
+            outbound.send(channel, LOG, content="log") # Waits for the send bucket to refill
+            outbound.send(channel, PROMPT, content="prompt")
+            outbound.edit(lobby, content="edited") # Has its own bucket: free to go first
+            await outbound.join()
+            assert channel.calls == [("send", "lobby"), ("edit", "edited"), ("send", "log"), ("send", "prompt")]
+        asyncio.run(run())
+
+    def test_superseded_edits_are_dropped(self):
+        async def run():
+            outbound = OutboundScheduler()
+            channel = FakeChannel()
+            message = await outbound.send(channel, content="lobby")
+            first = outbound.edit(message, content="1 player")
+            second = outbound.edit(message, content="2 players")
+            assert first is second
+            await outbound.join()
+            assert channel.calls == [("send", "lobby"), ("edit", "2 players")]
+
+            outbound.edit(message, content="3 players")
+            outbound.delete(message)
+            await outbound.join()
+            assert channel.calls[-1] == ("delete", "2 players") # The edit never went out
+            assert outbound.stats()["superseded"] == 2
+        asyncio.run(run())
+
+    def test_rate_limit_per_channel(self):
+        async def run():
+            outbound = OutboundScheduler(rate=2, per=0.1)
+            busy, quiet = FakeChannel(1), FakeChannel(2)
+            for i in range(4):
+                outbound.send(busy, content=i)
+            outbound.send(quiet, content="q")
+            await outbound.join(quiet)
+            assert quiet.calls == [("send", "q")] and len(busy.calls) == 2 # Throttled after 2
+            await outbound.join()
+            assert len(busy.calls) == 4 and outbound.stats()["throttled"] >= 1
+        asyncio.run(run())
+
+    def test_failures_reach_the_caller_and_the_queue_goes_on(self):
+        async def run():
+            outbound = OutboundScheduler()
+            channel = FakeChannel()
+            failed = outbound.send(channel, content="boom")
+            outbound.send(channel, CLEANUP, content="after")
+            with pytest.raises(RuntimeError):
+                await failed
+            await outbound.join()
+            assert channel.calls == [("send", "after")] and outbound.stats()["failed"] == 1
+        asyncio.run(run())
@@ -0,0 +1,44 @@
+# tests/test_packed.py
+import random
+import pytest
+from coup.models import Player, Deck
+from coup.engine import PackedState, new_game, legal_actions, apply, RECORD_SIZE, GAME_OVER
+
+class TestPackedState:
+    def test_round_trip_through_random_games(self):
+        rng = random.Random(3)
+        for _ in range(50):
+            state = new_game(list(range(100, 100 + rng.randint(2, 6))), rng)
+            while True:
+                packed = PackedState.from_state(state)
+                assert len(packed.record) == RECORD_SIZE
+                assert packed.to_state() == state
+                if state.phase == GAME_OVER:
+                    break
+                state = apply(state, rng.choice(legal_actions(state)), rng)
+
+    def test_equal_states_hash_equal(self):
+        state = new_game([1, 2, 3], random.Random(0))
+        a = PackedState.from_state(state)
+        b = PackedState.from_state(state)
+        assert a == b and hash(a) == hash(b) and a.digest() == b.digest()
+        assert a.copy() == a
+
+        changed = PackedState.from_state(state._replace(turn=1))
+        assert changed != a and changed.digest() != a.digest()
+
+    def test_models_round_trip(self):
+        deck = Deck()
+        players = [Player(1, "a"), Player(2, "b")]
+        for player in players:
+            player.gain_influence(deck.draw())
+            player.gain_influence(deck.draw())
+        players[0].gain_income(3)
+
+        packed = PackedState.from_models(players, deck)
+        copies = [Player(1, "a"), Player(2, "b")]
+        other = Deck()
+        packed.to_models(copies, other)
+        assert [p.hand for p in copies] == [p.hand for p in players]
+        assert copies[0].coins == 5
+        assert other.cards == deck.cards and other.burned == deck.burned
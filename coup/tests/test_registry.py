@@ -0,0 +1,131 @@
+# tests/test_registry.py
+import pytest
+from coup.controllers.registry import LobbyRegistry
+
+class FakeLobby:
+    def __init__(self, lobby_id, players):
+        self.lobby_id = lobby_id
+        self.players = dict(players)
+        self.game = None
+        self.registry = None
+        self.reason = None
+
+    def is_closed(self):
+        return self.reason is not None
+
+    def close(self, reason):
+        self.reason = self.reason or reason
+
+class FakeGame:
+    def __init__(self):
+        self.registry = None
+        self.game_id = 2
+        self.last_activity = 0.0
+        self.snapshots = None
+
+class FakeSnapshots:
+    def __init__(self):
+        self.deleted = []
+
+    def delete(self, game_id):
+        self.deleted.append(game_id)
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestLobbyRegistry:
+    def test_add_and_lookup(self):
+        registry = LobbyRegistry()
+        lobby = FakeLobby(1, {10: "a", 11: "b"})
+        registry.add(lobby, guild_id=100, channel_id=200)
+
+        assert registry.get(1) is lobby
+        assert lobby.registry is registry
+        assert registry.lobbies_in_guild(100) == [lobby]
+        assert registry.lobbies_in_channel(200) == [lobby]
+        assert registry.lobbies_for_user(11) == [lobby]
+
+    def test_join_and_leave_update_user_index(self):
+        registry = LobbyRegistry()
+        lobby = FakeLobby(1, {10: "a"})
+        registry.add(lobby, 100, 200)
+
+        registry.on_join(lobby, 12)
+        assert registry.lobbies_for_user(12) == [lobby]
+        registry.on_leave(lobby, 12)
+        assert registry.lobbies_for_user(12) == []
+        assert 12 not in registry.by_user
+
+    def test_user_and_thread_routing(self):
+        registry = LobbyRegistry()
+        lobby = FakeLobby(1, {10: "a", 11: "b", -1: "bot"})
+        lobby.game = FakeGame()
+        registry.add(lobby, 100, 200)
+        assert lobby.game.registry is registry
+        assert registry.lobby_of_user(10) is lobby
+        assert registry.lobby_of_user(-1) is None
+        assert registry.game_in_thread(300) is None
+
+        registry.on_thread(1, 300)
+        assert registry.game_in_thread(300) is lobby
+        registry.on_eliminated(1, 11)
+        assert registry.lobby_of_user(11) is None
+
+        registry.remove(1)
+        assert registry.lobby_of_user(10) is None
+        assert registry.game_in_thread(300) is None
+        assert not registry.by_thread
+        assert lobby.game.registry is None
+
+    def test_remove_clears_indexes(self):
+        registry = LobbyRegistry()
+        lobby = FakeLobby(1, {10: "a"})
+        registry.add(lobby, 100, 200)
+
+        registry.remove(1, "finished")
+        assert len(registry) == 0
+        assert not registry.by_guild and not registry.by_channel and not registry.by_user
+        assert lobby.registry is None
+        assert registry.stats()["evictions"] == {"finished": 1}
+        # Removing twice is a no-op
+        assert registry.remove(1) is None
+
+    def test_caps(self):
+        registry = LobbyRegistry(max_lobbies=3, max_per_guild=2)
+        registry.add(FakeLobby(1, {}), 100, 200)
+        assert registry.check_capacity(100) is None
+        registry.add(FakeLobby(2, {}), 100, 200)
+        assert registry.check_capacity(100) is not None
+        assert registry.check_capacity(101) is None
+        assert registry.stats()["guilds"] == 1 # Checking capacity does not index the guild
+        registry.add(FakeLobby(3, {}), 101, 201)
+        assert registry.check_capacity(102) is not None
+
+    def test_sweep_expires_lobbies_and_abandoned_games(self):
+        clock = FakeClock()
+        registry = LobbyRegistry(lobby_ttl=10, game_ttl=100, clock=clock)
+        waiting = FakeLobby(1, {10: "a"})
+        playing = FakeLobby(2, {11: "b"})
+        playing.game = FakeGame()
+        registry.add(waiting, 100, 200)
+        registry.add(playing, 100, 200)
+
+        clock.now = 50
+        assert registry.sweep() == [1]
+        assert waiting.reason == "expired"
+        assert 2 in registry
+
+        clock.now = 150
+        playing.game.last_activity = 120 # Still being played: kept past its TTL from creation
+        assert registry.sweep() == []
+
+        playing.game.snapshots = FakeSnapshots()
+        clock.now = 220
+        assert registry.sweep() == [2]
+        assert playing.game.snapshots.deleted == [2]
+        assert registry.stats()["evictions"] == {"expired": 1, "abandoned": 1}
+        assert len(registry) == 0
@@ -0,0 +1,62 @@
+# tests/test_response.py
+import random
+import asyncio
+from coup.controllers.game import Game
+from coup.controllers.response import ResponseWindow
+from coup.controllers.turn import RESPONSE_WINDOW
+from coup.models import Foreign_Aid
+from coup.engine import new_game, legal_actions, apply, Move, ACT, ALLOW, BLOCK, CHALLENGE, RESPONSE
+
+def foreign_aid_window(players: int = 4):
+    """A window on seat 0's Foreign Aid, which every other seat may block (and no one may challenge)."""
+    state = new_game(list(range(1, players + 1)), random.Random(0))
+    state = apply(state, Move(ACT, 0, Foreign_Aid), random.Random(0))
+    assert state.phase == RESPONSE
+    return state, ResponseWindow(1, state, legal_actions(state))
+
+class TestResponseWindow:
+    def test_first_seat_clockwise_wins(self):
+        _, window = foreign_aid_window()
+        assert window.react(3, Move(BLOCK, 3, card="Duke"))
+        assert not window.is_decided() # Seats 1 and 2 could still block first
+        assert window.react(2, Move(BLOCK, 2, card="Duke"))
+        assert not window.is_decided()
+        assert window.react(1, None)
+        assert window.is_decided()
+        assert window.resolution() == Move(BLOCK, 2, card="Duke")
+
+    def test_closes_early_once_nothing_can_change(self):
+        _, window = foreign_aid_window()
+        assert window.react(1, Move(BLOCK, 1, card="Duke"))
+        assert window.is_decided() and window.pending() == [2, 3]
+
+    def test_everyone_passing_allows(self):
+        _, window = foreign_aid_window()
+        for seat in (3, 1):
+            window.react(seat, None)
+        assert not window.is_decided()
+        window.react(2, None)
+        assert window.is_decided() and window.resolution() == Move(ALLOW)
+
+    def test_refuses_bad_reactions(self):
+        _, window = foreign_aid_window()
+        assert not window.react(0, None) # The actor has nothing to react to
+        assert not window.react(1, Move(CHALLENGE, 1)) # Foreign Aid claims no role
+        assert window.react(1, None)
+        assert not window.react(1, Move(BLOCK, 1, card="Duke")) # One reaction per seat
+
+class TestGameWindow:
+    def test_all_passes_resolve_without_the_timer(self):
+        async def run():
+            game = Game({1: "a", 2: "b", 3: "c"}, game_id=3)
+            tax = next(m for m in game.legal_moves if m.kind == ACT and m.action.name == "Collect Tax")
+            await game.submit(tax)
+            assert game.step == RESPONSE_WINDOW and game.window.version == game.seq
+            timer = game.window_timer
+            for seat in game.window.pending():
+                assert await game.react(seat, None)
+            assert game.seq == 2 and game.state.phase != RESPONSE # Resolved by ALLOW
+            assert game.window is None
+            await asyncio.sleep(0)
+            assert timer.cancelled()
+        asyncio.run(run())
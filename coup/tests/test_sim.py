@@ -0,0 +1,20 @@
+# tests/test_sim.py
+import pytest
+from coup.sim import run_batch, make_policy
+
+class TestSim:
+    def test_run_batch_counts(self):
+        results = run_batch(["heuristic", "random", "honest"], games=30, seed=1)
+        assert results.games == 30
+        assert sum(results.seat_wins.values()) + results.draws == 30
+        assert sum(results.policy_games.values()) == 90
+        assert sum(results.hand_games.values()) == 90
+
+    def test_batches_are_reproducible(self):
+        a = run_batch(["heuristic", "random"], games=20, seed=7)
+        b = run_batch(["heuristic", "random"], games=20, seed=7)
+        assert a.seat_wins == b.seat_wins and a.turns == b.turns
+
+    def test_unknown_policy(self):
+        with pytest.raises(ValueError):
+            make_policy("nope")
@@ -0,0 +1,78 @@
+# tests/test_snapshots.py
+import random
+import pytest
+from coup.models import Player
+from coup.engine import PackedState, new_game, legal_actions, apply
+from coup.db import DatabaseWriter, SnapshotStore
+
+class FakeGuild:
+    id = 10
+
+class FakeThread:
+    id = 30
+    parent_id = 20
+    guild = FakeGuild()
+
+class FakeGame:
+    """Just the attributes SnapshotStore reads from a Game."""
+    def __init__(self, game_id, state):
+        self.game_id = game_id
+        self.state = state
+        self.seats = [Player(p.id, f"P{p.id}") for p in state.players]
+        self.game_thread = FakeThread()
+        self.started = 1.0
+        self.seed = 12345
+        self.seq = 6
+
+    def snapshot(self):
+        return PackedState.from_state(self.state)
+
+@pytest.fixture
+def store(tmp_path):
+    writer = DatabaseWriter(str(tmp_path / "coup.db"))
+    store = SnapshotStore(writer)
+    writer.start()
+    yield store
+    writer.stop()
+
+class TestSnapshotStore:
+    def test_checkpoint_round_trip(self, store):
+        rng = random.Random(1)
+        game = FakeGame(7, new_game([1, 2, 3], rng))
+        store.checkpoint(game)
+        for _ in range(5):
+            game.state = apply(game.state, rng.choice(legal_actions(game.state)), rng)
+            store.checkpoint(game)
+        assert store.writer.flush()
+
+        [snapshot] = store.load_all()
+        assert snapshot.game_id == 7
+        assert (snapshot.guild_id, snapshot.channel_id, snapshot.thread_id) == (10, 20, 30)
+        assert snapshot.players == [(1, "P1"), (2, "P2"), (3, "P3")]
+        assert snapshot.packed.to_state() == game.state
+        assert (snapshot.started, snapshot.seed, snapshot.seq) == (1.0, 12345, 6)
+
+    def test_delete(self, store):
+        store.checkpoint(FakeGame(1, new_game([1, 2], random.Random(0))))
+        store.checkpoint(FakeGame(2, new_game([3, 4], random.Random(0))))
+        store.delete(1)
+        assert store.writer.flush()
+        assert [s.game_id for s in store.load_all()] == [2]
+
+    def test_survives_restart(self, tmp_path):
+        path = str(tmp_path / "coup.db")
+        state = new_game([1, 2], random.Random(2))
+        writer = DatabaseWriter(path)
+        SnapshotStore(writer)
+        writer.start()
+        SnapshotStore(writer).checkpoint(FakeGame(3, state))
+        writer.stop()
+
+        writer = DatabaseWriter(path)
+        store = SnapshotStore(writer)
+        writer.start()
+        try:
+            [snapshot] = store.load_all()
+            assert snapshot.packed.to_state() == state
+        finally:
+            writer.stop()
@@ -0,0 +1,79 @@
+# tests/test_stats.py
+import asyncio
+import pytest
+from coup.db import DatabaseWriter, GameHistory, StatsStore, LRUCache, rating_changes
+from coup.tests.test_history import play
+
+@pytest.fixture
+def db(tmp_path):
+    writer = DatabaseWriter(str(tmp_path / "coup.db"))
+    history = GameHistory(writer)
+    stats = StatsStore(history)
+    writer.start()
+    yield history, stats
+    writer.stop()
+
+class TestRatings:
+    def test_zero_sum_and_ordered(self):
+        changes = rating_changes([1500, 1500, 1500, 1500], [2, 1, 4, 3])
+        assert sum(changes) == pytest.approx(0)
+        assert changes[1] > changes[0] > changes[3] > changes[2]
+
+    def test_upset_pays_more(self):
+        upset = rating_changes([1400, 1600], [1, 2])
+        expected = rating_changes([1600, 1400], [1, 2])
+        assert upset[0] > expected[0] > 0
+
+class TestLRUCache:
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(2)
+        for key in "ab":
+            cache.put(key, key.upper(), cache.get(key)[2])
+        cache.get("a")
+        cache.put("c", "C", cache.get("c")[2])
+        assert [cache.get(k)[0] for k in "abc"] == [True, False, True]
+
+    def test_load_racing_invalidation_is_not_stored(self):
+        cache = LRUCache()
+        _, _, generation = cache.get("a")
+        cache.invalidate(lambda key: key == "a")
+        cache.put("a", "stale", generation)
+        assert not cache.get("a")[0]
+
+class TestStatsStore:
+    def test_aggregates_match_history(self, db):
+        history, stats = db
+        results = []
+        for seed in range(20):
+            _, result = play([1, 2, 3, -1], seed, seed)
+            result.guild_id = 50
+            history.record(result)
+            results.append(result)
+        assert stats.writer.flush()
+
+        user = asyncio.run(stats.user_stats(1, 50))
+        mine = [p for r in results for p in r.players if p.id == 1]
+        assert user["games"] == 20
+        assert user["wins"] == sum(p.placement == 1 for p in mine)
+        assert user["bluffs"] == sum(p.bluffs for p in mine)
+        assert user["challenges_won"] == sum(p.challenges_won for p in mine)
+        assert asyncio.run(stats.user_stats(1)) == user # Only one guild, so global matches
+        assert asyncio.run(stats.user_stats(-1, 50)) is None # Bots are not ranked
+
+        board = asyncio.run(stats.leaderboard(50))
+        assert len(board) == 3
+        assert [row["rating"] for row in board] == sorted((row["rating"] for row in board), reverse=True)
+
+    def test_cache_invalidated_by_new_game(self, db):
+        history, stats = db
+        _, result = play([1, 2], 0)
+        history.record(result)
+        assert stats.writer.flush()
+        assert asyncio.run(stats.user_stats(1))["games"] == 1
+        asyncio.run(stats.user_stats(1))
+        assert stats.cache.hits == 1
+
+        _, result = play([1, 2], 1)
+        history.record(result)
+        assert stats.writer.flush()
+        assert asyncio.run(stats.user_stats(1))["games"] == 2
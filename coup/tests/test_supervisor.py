@@ -0,0 +1,66 @@
+# tests/test_supervisor.py
+import asyncio
+from coup.controllers.supervisor import TaskSupervisor
+from coup.controllers.timers import get_timers
+from coup.controllers.game import Game
+from coup.engine import ACT
+
+class TestTaskSupervisor:
+    def test_tracks_until_done(self):
+        async def run():
+            tasks = TaskSupervisor("test")
+            release = asyncio.Event()
+            task = tasks.spawn(release.wait())
+            future = tasks.track(asyncio.get_running_loop().create_future())
+            assert len(tasks) == 2
+            release.set()
+            future.set_result(None)
+            await task
+            await asyncio.sleep(0)
+            assert len(tasks) == 0 and tasks.stats()["spawned"] == 1
+        asyncio.run(run())
+
+    def test_cancel_stale_keeps_current_and_game_wide(self):
+        async def run():
+            tasks = TaskSupervisor("test")
+            old = tasks.spawn(asyncio.sleep(60), version=1)
+            current = tasks.spawn(asyncio.sleep(60), version=2)
+            game_wide = tasks.spawn(asyncio.sleep(60))
+            timer = tasks.track(get_timers().call_later(60, lambda: None), version=1)
+            tasks.cancel_stale(2)
+            await asyncio.sleep(0)
+            assert old.cancelled() and timer.cancelled()
+            assert not current.done() and not game_wide.done()
+            assert len(tasks) == 2
+            tasks.cancel_all()
+            await asyncio.sleep(0)
+            assert current.cancelled() and game_wide.cancelled()
+            assert len(tasks) == 0 and tasks.stats()["cancelled"] == 4
+        asyncio.run(run())
+
+    def test_fired_timers_and_failures_are_dropped(self):
+        async def run():
+            tasks = TaskSupervisor("test")
+            tasks.track(get_timers().call_later(0, lambda: None))
+            async def fail():
+                raise RuntimeError("boom")
+            tasks.spawn(fail())
+            await asyncio.sleep(0.01)
+            assert len(tasks) == 0 and tasks.stats()["failed"] == 1
+        asyncio.run(run())
+
+class TestGameTasks:
+    def test_transitions_cancel_the_previous_state(self):
+        async def run():
+            game = Game({1: "a", 2: "b", 3: "c"}, game_id=11)
+            tax = next(m for m in game.legal_moves if m.kind == ACT and m.action.name == "Collect Tax")
+            stale = game.tasks.spawn(asyncio.sleep(60), game.seq) # Stand-in for a bot still thinking
+            await game.submit(tax)
+            await asyncio.sleep(0)
+            assert stale.cancelled()
+            assert game.window_timer in game.tasks.live # The new window's deadline belongs to the game
+
+            game.tasks.cancel_all()
+            assert len(game.tasks) == 0 and game.window_timer.cancelled()
+            assert game.tasks in TaskSupervisor.supervisors
+        asyncio.run(run())
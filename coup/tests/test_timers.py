@@ -0,0 +1,66 @@
+# tests/test_timers.py
+import asyncio
+from coup.controllers.timers import TimerService, get_timers
+
+class TestTimerService:
+    def test_fires_in_deadline_order(self):
+        async def run():
+            timers = TimerService(asyncio.get_running_loop())
+            fired = []
+            for delay in (0.03, 0.01, 0.02):
+                timers.call_later(delay, fired.append, delay)
+            assert timers.pending == 3
+            await asyncio.sleep(0.05)
+            assert fired == [0.01, 0.02, 0.03]
+            stats = timers.stats()
+            assert stats["pending"] == 0 and stats["fired"] == 3
+            assert stats["jitter_max_ms"] >= 0
+        asyncio.run(run())
+
+    def test_cancelled_timers_never_fire(self):
+        async def run():
+            timers = TimerService(asyncio.get_running_loop())
+            fired = []
+            first = timers.call_later(0.01, fired.append, "first")
+            timers.call_later(0.02, fired.append, "second")
+            first.cancel()
+            first.cancel() # Idempotent
+            assert timers.pending == 1 and first.cancelled()
+            await asyncio.sleep(0.03)
+            assert fired == ["second"]
+            assert timers.stats()["cancelled"] == 1
+        asyncio.run(run())
+
+    def test_heap_is_compacted_when_mostly_cancelled(self):
+        async def run():
+            timers = TimerService(asyncio.get_running_loop())
+            handles = [timers.call_later(60, lambda: None) for _ in range(200)]
+            for handle in handles[:150]:
+                handle.cancel()
+            assert timers.pending == 50
+            assert len(timers.heap) <= 2 * timers.pending + 1
+            timers.stop()
+            assert timers.pending == 0 and all(handle.cancelled() for handle in handles)
+        asyncio.run(run())
+
+    def test_coroutine_callbacks_and_failures(self):
+        async def run():
+            timers = TimerService(asyncio.get_running_loop())
+            done = asyncio.Event()
+            async def later():
+                done.set()
+            def fail():
+                raise RuntimeError("boom")
+            timers.call_later(0, fail)
+            timers.call_later(0, later)
+            await asyncio.wait_for(done.wait(), 1)
+            assert timers.stats()["failed"] == 1
+        asyncio.run(run())
+
+    def test_one_service_per_event_loop(self):
+        async def run():
+            return get_timers()
+        async def twice():
+            assert get_timers() is get_timers()
+        asyncio.run(twice())
+        assert asyncio.run(run()) is not asyncio.run(run())
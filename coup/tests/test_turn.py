@@ -0,0 +1,137 @@
+# tests/test_turn.py
+import random
+import asyncio
+from coup.controllers import turn
+from coup.controllers.game import Game
+from coup.engine import new_game, legal_actions, apply, Move, ACT, ALLOW, CHALLENGE, ACTION, GAME_OVER
+
+class SlowThread:
+    """Game thread whose sends take a while, like a rate-limited REST call."""
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, content=None, embed=None, embeds=(), **kwargs):
+        await asyncio.sleep(0.05)
+        self.sent.append(content or "\n".join(e.title or e.description for e in embeds or [embed]))
+        return self
+
+    async def delete(self):
+        pass
+
+class TestTurnTable:
+    def test_every_waiting_state_renders_its_decision(self):
+        rng = random.Random(3)
+        for _ in range(30):
+            state = new_game([1, 2, 3], rng)
+            while state.phase != GAME_OVER:
+                effects = turn.begin_turn(state, 7)
+                kinds = [e.kind for e in effects]
+                step = turn.STEPS[state.phase]
+                assert kinds == [turn.TURN_START, step.render, turn.BOTS]
+                if step.render == turn.RENDER_PROMPT:
+                    seat, mode = effects[1].args
+                    assert mode == step.mode and state.players[seat].hand
+                assert all(e.version == 7 for e in effects)
+                state = apply(state, rng.choice(legal_actions(state)), rng)
+
+    def test_after_move(self):
+        state = new_game([1, 2, 3], random.Random(0))
+        effects = turn.after_move(Move(ALLOW), state, ["a", "b"], 4)
+        assert effects == [
+            turn.Effect(turn.UPDATE, 4, ("No one responded. Proceeding...",)),
+            turn.Effect(turn.UPDATE, 4, ("a",)),
+            turn.Effect(turn.UPDATE, 4, ("b",)),
+            turn.Effect(turn.END_TURN, 4),
+        ]
+
+class TestGameTransitions:
+    def test_submit_does_not_wait_for_rendering(self):
+        async def run():
+            game = Game({1: "a", 2: "b", 3: "c"}, game_id=5)
+            game.game_thread = SlowThread()
+            game.outbox.start()
+            move = next(m for m in game.legal_moves if m.kind == ACT and m.action.name == "Collect Income")
+
+            assert await game.submit(move)
+            # The turn is fully resolved before a single message went out
+            assert game.seq == 1 and game.state.phase == ACTION and game.step == turn.AWAIT_ACTION
+            assert game.turn_completed.is_set() and game.game_thread.sent == []
+
+            await game.drain()
+            assert game.game_thread.sent == [] # The income update waits for the next turn's header
+            await game.begin_turn()
+            await game.drain()
+            game.outbox.stop()
+            header = game.game_thread.sent[0].splitlines()
+            assert "gained 1 coin" in header[0] and header[-1].endswith("'s Turn Has Begun!")
+        asyncio.run(run())
+        asyncio.run(run())
+
+    def test_stale_renders_are_skipped(self):
+        async def run():
+            game = Game({1: "a", 2: "b", 3: "c"}, game_id=5)
+            game.game_thread = SlowThread()
+            tax = next(m for m in game.legal_moves if m.kind == ACT and m.action.name == "Collect Tax")
+            await game.submit(tax) # Queues the response window
+            await game.submit(Move(ALLOW)) # Closes it before it was rendered
+            await game.begin_turn()
+            game.outbox.start()
+            await game.drain()
+            game.outbox.stop()
+            assert game.outbox.processed == 3 # Response window, then the next turn's header and its action select
+            assert len(game.game_thread.sent) == 2
+            assert game.game_thread.sent[0].splitlines()[1] == "No one responded. Proceeding..." # Opens the header
+        asyncio.run(run())
+
+    def test_log_lines_of_a_resolution_share_one_message(self):
+        async def run():
+            game = Game({1: "a", 2: "b", 3: "c"}, game_id=5)
+            game.game_thread = SlowThread()
+            game.outbox.start()
+            tax = next(m for m in game.legal_moves if m.kind == ACT and m.action.name == "Collect Tax")
+            await game.submit(tax)
+            await game.drain()
+            assert len(game.game_thread.sent) == 1 # The response window; it names the action, so the log waits
+            challenge = next(m for m in game.legal_moves if m.kind == CHALLENGE)
+            await game.submit(challenge)
+            await game.drain()
+            game.outbox.stop()
+            log, prompt = game.game_thread.sent[1:] # The log explains the influence prompt, so it comes first
+            lines = log.splitlines()
+            assert "attempting" in lines[0] and "challenged" in lines[1] and len(lines) >= 3
+            assert prompt.endswith("Choose an influence card to lose:")
+        asyncio.run(run())
+
+class TestDeadlines:
+    def test_timed_out_decision_gets_the_default_move(self):
+        async def run():
+            game = Game({1: "a", 2: "b", 3: "c"}, game_id=6)
+            game.game_thread = SlowThread()
+            actor = game.seats[game.state.turn]
+            game.mailbox.start()
+            game.outbox.start()
+            game.decision_timeouts[turn.AWAIT_ACTION] = 0.01
+            await game.begin_turn()
+            game.decision_timeouts[turn.AWAIT_ACTION] = 60 # Only the first decision times out
+            await asyncio.sleep(0.05)
+            assert game.seq == 1 and game.timeouts == 1
+            assert game.state.players[game.seat_of(actor.id)].coins == 3 # Income
+            await game.begin_turn()
+            await game.drain()
+            assert f"{actor.name} ran out of time." in game.game_thread.sent[-2].splitlines() # The next turn's header
+            game.tasks.cancel_all()
+            game.mailbox.stop()
+            game.outbox.stop()
+        asyncio.run(run())
+
+    def test_idle_game_is_abandoned(self):
+        async def run():
+            game = Game({1: "a", 2: "b", 3: "c"}, game_id=6)
+            game.game_thread = SlowThread()
+            game.decision_timeouts = dict.fromkeys(game.decision_timeouts, 0.01)
+            game.idle_limit = 0
+            result = await asyncio.wait_for(game.play(), 1)
+            assert result is None and game.abandoned and game.seq == 0
+            assert game.game_thread.sent[-1] == "Nobody has played for a while; the game has been abandoned."
+            assert len(game.tasks) == 0
+        asyncio.run(run())
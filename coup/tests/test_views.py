@@ -0,0 +1,206 @@
+# tests/test_views.py
+import math
+import random
+import asyncio
+from coup.controllers.game import Game
+from coup.controllers.turn import step_of
+from coup.engine import Move, legal_actions, apply, CHALLENGE, RESPONSE
+from coup.views import (
+    DYNAMIC_ITEMS, interaction_stats, create_action_view, create_response_view, create_hand_view,
+    create_prompt_view, create_swap_view, create_influence_select_view, create_block_role_view,
+    create_response_embed,
+)
+
+class FakeResponse:
+    def __init__(self):
+        self.sent = []
+
+    async def send_message(self, content=None, **kwargs):
+        self.sent.append(content)
+
+    async def defer(self):
+        self.sent.append("defer")
+
+class SlowResponse(FakeResponse):
+    """Interaction response whose REST round-trip takes a while."""
+    async def send_message(self, content=None, **kwargs):
+        await asyncio.sleep(0.05)
+        self.sent.append(content)
+
+class FakeCog:
+    def __init__(self, game):
+        self.registry = type("Registry", (), {"get": lambda _, i: type("Lobby", (), {"game": game})() if i == game.game_id else None})()
+
+class FakeInteraction:
+    def __init__(self, game, user_id):
+        self.user = type("User", (), {"id": user_id})()
+        self.client = type("Client", (), {"get_cog": lambda _, name: FakeCog(game)})()
+        self.response = FakeResponse()
+
+def response_game():
+    """A game (ids 1-3) waiting in an open response window where an unblocked action can be challenged."""
+    rng = random.Random(2)
+    while True:
+        game = Game({1: "a", 2: "b", 3: "c"}, game_id=7)
+        for _ in range(10):
+            if game.state.phase == RESPONSE and not game.current_action.blocked and any(m.kind == CHALLENGE for m in game.legal_moves):
+                game.step = step_of(game.state)
+                game.sync_window()
+                return game
+            game.state = apply(game.state, rng.choice(legal_actions(game.state)), rng)
+            game.seq += 1
+            game.sync_models()
+
+def challengers(game):
+    """Players who may challenge, in the order the window gives them priority."""
+    seats = [seat for seat in range(len(game.seats)) if game.can_move(Move(CHALLENGE, seat))]
+    return [game.seats[seat] for seat in sorted(seats, key=game.window.order)]
+
+def matching(custom_id):
+    return [cls for cls in DYNAMIC_ITEMS if cls.__discord_ui_compiled_template__.fullmatch(custom_id)]
+
+class TestDynamicItems:
+    def test_every_custom_id_routes_to_its_own_class(self):
+        async def run():
+            game = response_game()
+            player = game.seats[0]
+            views = [
+                create_action_view(game), create_response_view(game), create_hand_view(game),
+                create_prompt_view(game, player, "lose"), create_swap_view(game, "Duke"),
+                create_influence_select_view(game, player, "return"),
+                create_block_role_view(game, player, ["Captain", "Inquisitor"]),
+            ]
+            items = [item for view in views for item in view.children]
+            assert items
+            for item in items:
+                assert matching(item.custom_id) == [type(item)]
+                assert item.custom_id.startswith(f"coup:{game.game_id}:")
+                match = type(item).__discord_ui_compiled_template__.fullmatch(item.custom_id)
+                rebuilt = await type(item).from_custom_id(None, item.item, match)
+                assert rebuilt.custom_id == item.custom_id
+        asyncio.run(run())
+
+    def test_challenge_button_dispatches_to_game(self):
+        async def run():
+            game = response_game()
+            challenger = challengers(game)[0] # First in priority: decides the window on its own
+            button = next(i for i in create_response_view(game).children if "challenge" in i.custom_id)
+            submitted = []
+            async def submit(move):
+                submitted.append(move)
+            game.submit = submit
+
+            interaction = FakeInteraction(game, 999) # Not a player
+            await button.callback(interaction)
+            assert interaction.response.sent == ["You cannot challenge this action!"] and not submitted
+
+            game.mailbox.start()
+            interaction = FakeInteraction(game, challenger.id)
+            await button.callback(interaction)
+            await game.mailbox.join()
+            assert interaction.response.sent == ["Challenge submitted."]
+            assert submitted == [Move(CHALLENGE, game.seat_of(challenger.id))]
+
+            # The window is closed: a second reaction is refused
+            interaction = FakeInteraction(game, challenger.id)
+            await button.callback(interaction)
+            assert interaction.response.sent == ["You have already responded!"]
+            game.mailbox.stop()
+        asyncio.run(run())
+
+    def test_click_after_the_window_resolved_is_expired(self):
+        async def run():
+            game = response_game()
+            first, second = challengers(game)[:2]
+            button = next(i for i in create_response_view(game).children if "pass" in i.custom_id)
+            async def submit(move):
+                pass
+            game.submit = submit
+            game.mailbox.start()
+
+            # The first challenge decides the window; the second player never reacted
+            assert await game.react(game.seat_of(first.id), Move(CHALLENGE, game.seat_of(first.id)))
+            interaction = FakeInteraction(game, second.id)
+            await button.callback(interaction)
+            await game.mailbox.join()
+            game.mailbox.stop()
+            assert interaction.response.sent == ["This prompt has expired; the game has moved on."]
+        asyncio.run(run())
+
+    def test_replies_do_not_hold_up_the_mailbox(self):
+        async def run():
+            game = response_game()
+            button = next(i for i in create_response_view(game).children if "pass" in i.custom_id)
+            interaction = FakeInteraction(game, challengers(game)[-1].id)
+            interaction.response = SlowResponse()
+            ran = []
+            async def next_command():
+                ran.append(interaction.response.sent[:])
+
+            await button.callback(interaction)
+            game.mailbox.post(next_command)
+            game.mailbox.start()
+            await game.mailbox.join()
+            assert ran == [[]] # Ran while the pass confirmation was still on its way
+            await asyncio.sleep(0.1)
+            assert interaction.response.sent == ["Pass submitted."]
+            game.tasks.cancel_all()
+            game.mailbox.stop()
+        asyncio.run(run())
+
+    def test_stale_click_is_rejected_before_game_logic(self):
+        async def run():
+            game = response_game()
+            challenger = challengers(game)[0]
+            button = next(i for i in create_response_view(game).children if "challenge" in i.custom_id)
+            submitted = []
+            async def submit(move):
+                submitted.append(move)
+            game.submit = submit
+            game.seq += 1 # The response window closed after the message was sent
+
+            stale = interaction_stats["stale"]
+            interaction = FakeInteraction(game, challenger.id)
+            await button.callback(interaction)
+            assert interaction.response.sent == ["This prompt has expired; the game has moved on."]
+            assert not submitted and game.mailbox.queue.empty()
+            assert interaction_stats["stale"] == stale + 1
+
+            # Components without a version (Check Hand) are never stale
+            hand = create_hand_view(game).children[0]
+            interaction = FakeInteraction(game, challenger.id)
+            await hand.callback(interaction)
+            assert interaction.response.sent[0].startswith("Hand:")
+        asyncio.run(run())
+
+    def test_clicks_queued_behind_a_move_expire(self):
+        async def run():
+            game = response_game()
+            first_seat, *_, last_seat = challengers(game)
+            button = next(i for i in create_response_view(game).children if "challenge" in i.custom_id)
+            submitted = []
+            async def submit(move):
+                submitted.append(move)
+                game.seq += 1
+            game.submit = submit
+
+            # Both clicks pass validation and are queued before either runs
+            first, second = FakeInteraction(game, first_seat.id), FakeInteraction(game, last_seat.id)
+            await button.callback(first)
+            await button.callback(second)
+            assert game.mailbox.queue.qsize() == 2
+
+            game.mailbox.start()
+            await game.mailbox.join()
+            game.mailbox.stop()
+            assert submitted == [Move(CHALLENGE, game.seat_of(first_seat.id))]
+            assert first.response.sent == ["Challenge submitted."]
+            assert second.response.sent == ["This prompt has expired; the game has moved on."]
+        asyncio.run(run())
+
+    def test_response_countdown_is_a_relative_timestamp(self):
+        async def run():
+            game = response_game()
+            embed = create_response_embed(game)
+            assert f"<t:{math.ceil(game.window.deadline)}:R>" in embed.description
+        asyncio.run(run())
@@ -0,0 +1,35 @@
+# tests/test_writer.py
+import time
+import pytest
+from coup.db import DatabaseWriter
+
+@pytest.fixture
+def writer(tmp_path):
+    writer = DatabaseWriter(str(tmp_path / "coup.db"), schema=("CREATE TABLE rows (game_id INTEGER PRIMARY KEY)",))
+    writer.start()
+    yield writer
+    writer.stop()
+
+def insert(game_id):
+    return lambda conn: conn.execute("INSERT INTO rows VALUES (?)", (game_id,))
+
+def rows(writer):
+    return [row[0] for row in writer.read(lambda conn: conn.execute("SELECT game_id FROM rows ORDER BY game_id").fetchall())]
+
+class TestDatabaseWriter:
+    def test_a_failing_write_does_not_lose_its_batch(self, writer):
+        def broken(conn):
+            conn.execute("INSERT INTO rows VALUES (3)")
+            raise RuntimeError("boom") # After writing: its own insert must be rolled back too
+        batch = [(time.perf_counter(), write) for write in (insert(1), insert(2), broken, insert(4))]
+        writer.apply(batch)
+        assert rows(writer) == [1, 2, 4]
+        assert writer.stats()["written"] == 3 and writer.stats()["failed"] == 1 and writer.batches == 1
+
+    def test_submitted_writes_commit_around_a_failure(self, writer):
+        writer.submit(insert(1))
+        writer.submit(insert(1)) # Duplicate key
+        writer.submit(insert(2))
+        assert writer.flush()
+        assert rows(writer) == [1, 2]
+        assert writer.stats()["failed"] == 1
@@ -7,16 +7,27 @@ from .game_views import (
     create_action_embed, create_action_view,
     create_target_view, create_target_embed,
     create_response_view, create_response_embed,
-    update_response_timer,
     create_prompt_embed, create_prompt_view,
     create_turn_start_embed, create_hand_view,
-    create_swap_view, create_swap_embed
+    board_fields, create_board_embed,
+    create_swap_view, create_swap_embed,
+    create_influence_select_view, create_block_role_view,
+    DYNAMIC_ITEMS, interaction_stats,
+)
+
+from .stats_views import (
+    create_stats_embed,
+    create_leaderboard_embed,
 )
 
 __all__ = ["create_lobby_view", "create_lobby_embed", 
            "create_action_embed", "create_action_view",
            "create_target_view", "create_target_embed",
-           "create_response_view", "create_response_embed", "update_response_timer",
+           "create_response_view", "create_response_embed",
            "create_prompt_embed", "create_prompt_view",
            "create_turn_start_embed", "create_hand_view",
-           "create_swap_view", "create_swap_embed"]
\ No newline at end of file
+           "board_fields", "create_board_embed",
+           "create_swap_view", "create_swap_embed",
+           "create_influence_select_view", "create_block_role_view",
+           "DYNAMIC_ITEMS", "interaction_stats",
+           "create_stats_embed", "create_leaderboard_embed"]
\ No newline at end of file
@@ -1,47 +1,46 @@
 # game_views.py
-import asyncio
+import math
 import discord
+import functools
 import logging
-from discord.ui import Select, Button, View
-from coup.models import Action, Income, Foreign_Aid, Tax, Coup, Exchange, Assassinate, Steal, Examine
+from collections import Counter
+from discord.ui import Select, Button, View, DynamicItem
+from coup.models import Action, ACTIONS
+from coup.engine import Move, ACT, CHALLENGE, BLOCK, LOSE, RETURN, REVEAL, SWAP, KEEP
 
 logger = logging.getLogger("coup")
 
-# === HELPERS === 
+ACTIONS_BY_NAME = {action.name: action for action in ACTIONS}
 
-class InteractionLock:
-    """Prevents race conditions on interactions"""
-    def __init__(self):
-        self.processing = False
+EXPIRED_PROMPT = "This prompt has expired; the game has moved on."
 
-    def acquire(self):
-        """Attempt to acquire lock. Returns True if acquired"""
-        if self.processing:
-            return False
-        self.processing = True
-        return True
-    
-    def release(self):
-        """Release the lock"""
-        self.processing = False
-    
-    def is_processing(self):
-        """Check if currently processing"""
-        return self.processing
+# Outcome of every component interaction: "current", "stale" (rendered for, or
+# queued behind, an older state version), "busy" (mailbox full) or "gone"
+# (game finished). Logged by the cog's sweep.
+interaction_stats = Counter()
 
 # === VIEWS ===
+# Every component is a DynamicItem whose custom_id encodes the game id, the
+# state version (moves applied) it was rendered for, and its intent. The item
+# classes are registered once on the bot, so sent messages keep no per-message
+# View in discord.py's view store and keep working across restarts.
 
 def create_action_view(game):
     """Create and return a Discord UI View allowing current player to choose an action for their turn"""
+    # Only offer actions the current player can take (e.g. only Coup at 10+ coins)
+    actions = list(dict.fromkeys(m.action for m in game.legal_moves if m.kind == ACT))
+    actions.sort(key=ACTIONS.index)
     view = View(timeout=None)
-    view.add_item(create_action_select(game, view))
+    view.add_item(ActionSelect(game.game_id, game.seq, [a.name for a in actions]))
     return view
 
 
-def create_target_view(game, force_coup=False):
+def create_target_view(game, action):
     """Create dropdown select for a targeted action."""
+    seats = sorted(m.target for m in game.legal_moves if m.kind == ACT and m.action is action)
+    options = [(game.seat_player(seat).name, seat) for seat in seats]
     view = View(timeout=None)
-    view.add_item(create_target_select(game, view))
+    view.add_item(TargetSelect(game.game_id, game.seq, ACTIONS.index(action), options))
     return view
 
 
@@ -54,38 +53,57 @@ def create_response_view(game):
         logger.error("No action found.")
         return
 
-    # Only add block buttons if not already blocked
-    if action.blocked == False and action.blockable():
-        view.add_item(create_block_button(game))
+    moves = game.legal_moves
+
+    # Only add block buttons if someone can block
+    if any(m.kind == BLOCK for m in moves):
+        view.add_item(BlockButton(game.game_id, game.seq))
         logger.info("Adding Block Button to Response Message.")
 
-    # Only add challenge button if action is blockable or action has been role blocked
-    if isinstance(action, (Tax, Assassinate, Exchange, Examine, Steal)) or action.blocked:
-        view.add_item(create_challenge_button(game))
+    # Only add challenge button if the action or block claims a role
+    if any(m.kind == CHALLENGE for m in moves):
+        view.add_item(ChallengeButton(game.game_id, game.seq))
         logger.info("Adding Challenge Button to Response Message.")
+
+    # Anyone who may react can pass, closing the window early once everyone has
+    view.add_item(PassButton(game.game_id, game.seq))
     
     return view
 
 
-def create_prompt_view(target, future):
-    """Creates a prompt button to choose influence to lose"""
+def create_prompt_view(game, target, mode: str):
+    """Creates a prompt button for a player to choose one of their cards"""
     view = View(timeout=None)
-    view.add_item(create_prompt_button(target, future))
+    view.add_item(PromptButton(game.game_id, game.seq, mode, game.seat_of(target.id)))
     return view
 
 
 def create_hand_view(game):
     """Creates a prompt allowing players to see their hand/coins"""
     view = View(timeout=None)
-    view.add_item(create_hand_button(game))
+    view.add_item(HandButton(game.game_id))
     return view
 
 
-def create_swap_view(game, role, future):
+def create_swap_view(game, role):
     """Creates a prompt button to choose whether player should swap examined role"""
     view = View(timeout=None)
-    view.add_item(create_swap_select(game.current_player, future))
-    view.add_item(create_examine_button(game, role))
+    view.add_item(SwapSelect(game.game_id, game.seq))
+    view.add_item(ExamineButton(game.game_id, game.seq))
+    return view
+
+
+def create_influence_select_view(game, player, mode: str):
+    """Ephemeral dropdown of a player's cards"""
+    view = View(timeout=None)
+    view.add_item(InfluenceSelect(game.game_id, game.seq, mode, game.seat_of(player.id), player.hand))
+    return view
+
+
+def create_block_role_view(game, player, roles):
+    """Ephemeral dropdown of the roles a player may block as"""
+    view = View(timeout=None)
+    view.add_item(BlockRoleSelect(game.game_id, game.seq, game.seat_of(player.id), roles))
     return view
 
 # === EMBEDS ===
@@ -104,21 +122,26 @@ def create_response_embed(game):
         title += f"{action.blocker.name}, as {action.blocking_role}, is attempting to block "
     title += f"{action.actor.name} attempting to {action.name}."
 
+    # Discord renders the deadline as a live countdown, so the message is never edited
+    description = "If you would like to respond, choose a response."
+    if game.window is not None:
+        description += f"\nThe window closes <t:{math.ceil(game.window.deadline)}:R>."
     return discord.Embed(
         title=title,
-        description="If you would like to respond, choose a response."
+        description=description
     )
 
 
-def create_target_embed(game):
+def create_target_embed(game, action):
     return discord.Embed(
-        title=f"{game.current_player.name}, Choose a target for {game.current_action.name}:"
+        title=f"{game.current_player.name}, Choose a target for {action.name}:"
     )
 
 
 def create_prompt_embed(target, mode: str):
     descriptions = {
         "lose": f"{target.name}: Choose an influence card to lose:",
+        "return": f"{target.name}: Choose a card to return to the deck:",
         "examine": f"{target.name}: Choose an influence card to be examined:",
         "swap": f"{target.name}: Force {target.name} to swap their card?"
     }
@@ -127,9 +150,14 @@ def create_prompt_embed(target, mode: str):
     return discord.Embed(description=description)
 
 
-def create_influence_select_embed():
+def create_influence_select_embed(mode: str = "lose"):
+    descriptions = {
+        "lose": "Choose influence to lose:",
+        "return": "Choose a card to return to the deck:",
+        "examine": "Choose a card to be examined:",
+    }
     return discord.Embed(
-        description="Choose influence to lose:"
+        description=descriptions.get(mode)
     )
 
 
@@ -153,360 +181,484 @@ def create_turn_start_embed(game):
     return embed
 
 
+def board_fields(game, log: list[str]) -> dict[str, str]:
+    """Everything the status board of a game in board mode shows, as field name -> text."""
+    state = game.state
+    if state.winner is not None:
+        title = f"{game.seats[state.winner].name} has won the game!"
+    else:
+        title = f"{game.seats[state.turn].name}'s Turn"
+    players = []
+    for seat, player in enumerate(state.players):
+        name = game.seats[seat].name
+        if not player.hand:
+            players.append(f"~~{name}~~ - Eliminated")
+        else:
+            marker = "▶ " if seat == state.turn and state.winner is None else ""
+            players.append(f"{marker}{name} - Influence: {len(player.hand)}; Coins: {player.coins}")
+    revealed = f"Cards in Deck: {len(state.deck)}\n" + ("\n".join(state.revealed) or "None revealed")
+    text = "\n".join(log)
+    while len(text) > 1024: # Embed field limit: drop the oldest lines
+        text = text.split("\n", 1)[1] if "\n" in text else text[-1024:]
+    return {"title": title, "Players": "\n".join(players), "Revealed Cards": revealed, "Log": text or "-"}
+
+
+def create_board_embed(fields: dict[str, str]):
+    embed = discord.Embed(title=fields["title"])
+    for name in ("Players", "Revealed Cards"):
+        embed.add_field(name=name, value=fields[name])
+    embed.add_field(name="Log", value=fields["Log"], inline=False)
+    return embed
+
+
 def create_swap_embed(game):
     return discord.Embed(
         title=f"{game.current_action.target.name} is being examined by {game.current_player.name}...",
-        description=f"{game.current_player.name}, please review the examined role and choose decide whether {game.current_player.name} should swap or keep the role."
+        description=f"{game.current_player.name}, please review the examined role and choose decide whether {game.current_action.target.name} should swap or keep the role."
     )
 
-# === SELECT MENUS ===
+# === COMPONENTS ===
+
+def find_game(interaction: discord.Interaction, game_id: int):
+    """The running game a component belongs to, or None once it has finished."""
+    cog = interaction.client.get_cog("Coup")
+    lobby = cog.registry.get(game_id) if cog else None
+    return lobby.game if lobby else None
+
+
+async def resolve(interaction: discord.Interaction, game_id: int, version: int | None = None):
+    """
+    find_game, rejecting the click with one ephemeral reply if the game is gone
+    or has moved on since the component was rendered at version.
+    Runs before anything is queued on the game's mailbox.
+    """
+    game = find_game(interaction, game_id)
+    if game is None:
+        interaction_stats["gone"] += 1
+        await interaction.response.send_message("This game is no longer running.", ephemeral=True)
+        return None
+    if version is not None and await expired(interaction, game, version):
+        return None
+    interaction_stats["current"] += 1
+    return game
+
+
+def stale(game, version: int) -> bool:
+    """True, and counted, if game has moved on from version."""
+    if not game.is_stale(version):
+        return False
+    interaction_stats["stale"] += 1
+    logger.info(f"Rejected stale interaction on game {game.game_id}: version {version}, now {game.seq}")
+    return True
+
+
+async def expired(interaction: discord.Interaction, game, version: int) -> bool:
+    """If game has moved on from version, say so (once) and return True."""
+    if not stale(game, version):
+        return False
+    await interaction.response.send_message(EXPIRED_PROMPT, ephemeral=True)
+    return True
+
+
+def respond(interaction: discord.Interaction, content: str):
+    """A private reply to interaction, for run_current to send."""
+    return functools.partial(interaction.response.send_message, content, ephemeral=True)
+
+
+def disable(interaction: discord.Interaction):
+    """A reply disabling the clicked message's components to show a choice was made, for run_current to send."""
+    return functools.partial(interaction.response.edit_message, view=disabled_copy(interaction.message))
+
+
+async def dispatch(interaction: discord.Interaction, game, version: int, handler, *args):
+    """
+    Queue handler(*args) on the game's mailbox, so it runs in order with every
+    other change to the game. If the mailbox is full the click is turned away.
+    """
+    if not game.mailbox.post(run_current, interaction, game, version, handler, args):
+        interaction_stats["busy"] += 1
+        await interaction.response.send_message("The game is busy; try again in a moment.", ephemeral=True)
+
+
+async def already_reacted(interaction: discord.Interaction, game) -> bool:
+    """If the user has already reacted in the open response window, say so and return True."""
+    window = game.window
+    if window is None or not window.has_reacted(game.seat_of(interaction.user.id)):
+        return False
+    await interaction.response.send_message("You have already responded!", ephemeral=True)
+    return True
+
+
+async def react(interaction: discord.Interaction, game, move, label: str):
+    """Buffer a reaction in the open response window. Returns the private confirmation."""
+    seat = game.seat_of(interaction.user.id)
+    if await game.react(seat, move):
+        return respond(interaction, f"{label} submitted.")
+    if game.window is not None and game.window.has_reacted(seat):
+        return respond(interaction, "You have already responded!")
+    interaction_stats["stale"] += 1 # The window resolved between the click and its turn on the mailbox
+    return respond(interaction, EXPIRED_PROMPT)
+
+
+async def run_current(interaction: discord.Interaction, game, version: int, handler, args: tuple):
+    """
+    Mailbox command: run handler unless a command queued ahead of it moved the game on.
+    Handlers only change the game and return their reply to the interaction, which is
+    sent off the mailbox so its REST round-trip never holds up the next command.
+    """
+    reply = respond(interaction, EXPIRED_PROMPT) if stale(game, version) else await handler(*args)
+    if reply:
+        game.tasks.spawn(reply(), name=f"coup-reply-{game.game_id}")
+
+
+def disabled_copy(message: discord.Message) -> View:
+    """The message's components, disabled, to show a choice was made. Never enters the view store."""
+    view = View.from_message(message, timeout=None)
+    for item in view.children:
+        item.disabled = True
+    view.stop()
+    return view
 
-def create_action_select(game, view):
-    actions = [Income, Foreign_Aid, Coup, Tax, Exchange, Assassinate, Steal, Examine]
-    options = [discord.SelectOption(label=a.name, value=a.name) for a in actions]
-    mapping = {a.name: a for a in actions}
-    select = Select(placeholder="Choose your action...", options=options, min_values=1, max_values=1)
 
-    lock = InteractionLock()
+# -----------------------
+# Select Menus
+# -----------------------
 
-    async def callback(interaction: discord.Interaction):
-        # Check lock
-        if lock.is_processing():
+class ActionSelect(DynamicItem[Select], template=r"coup:(?P<game>\d+):(?P<version>\d+):act"):
+    def __init__(self, game_id: int, version: int, actions: list[str]):
+        super().__init__(Select(
+            custom_id=f"coup:{game_id}:{version}:act",
+            placeholder="Choose your action...",
+            options=[discord.SelectOption(label=name, value=name) for name in actions],
+        ))
+        self.game_id = game_id
+        self.version = version
+
+    @classmethod
+    async def from_custom_id(cls, interaction, item, match):
+        return cls(int(match["game"]), int(match["version"]), [o.value for o in item.options])
+
+    async def callback(self, interaction: discord.Interaction):
+        game = await resolve(interaction, self.game_id, self.version)
+        if game is None:
             return
-        
+
         # Validate User
-        user = interaction.user
-        if user.id != game.current_player.id:
+        if interaction.user.id != game.current_player.id:
             await interaction.response.send_message("It is not your turn!", ephemeral=True)
             return
-        
-        # Acquire lock
-        if not lock.acquire():
-            return
-        
-        # Set result
-        choice = select.values[0]
-        action_class: Action = mapping[choice]
 
-        # Disable select immediately
-        select.disabled = True
-        await interaction.message.edit(view=view)
+        await dispatch(interaction, game, self.version, self.handle, interaction, game)
 
-        # Send Update if respondable
-        if action_class not in (Income, Coup):
-            await game.send_update_msg(f"{game.current_player.name} is attempting to {choice}!")
+    async def handle(self, interaction: discord.Interaction, game):
+        action_class = ACTIONS_BY_NAME[self.item.values[0]]
 
-        # Handle Action
+        # Handle Action, then disable the select
         await game.action_selected(action_class)
-
-        # Release lock
-        lock.release()
-
-    select.callback = callback
-    return select
-
-
-def create_target_select(game, view):
-    targets = [p for p in game.players if p.id != game.current_player.id]
-    options = [discord.SelectOption(label=p.name, value=str(p.id)) for p in targets]
-    select = Select(placeholder=f"Choose a target for {game.current_action.name}...", options=options)
-
-    lock = InteractionLock()
-
-    async def callback(interaction: discord.Interaction):
-        # Check lock
-        if lock.is_processing():
+        return disable(interaction)
+
+
+class TargetSelect(DynamicItem[Select], template=r"coup:(?P<game>\d+):(?P<version>\d+):target:(?P<action>\d+)"):
+    def __init__(self, game_id: int, version: int, action: int, targets: list[tuple[str, int]]):
+        super().__init__(Select(
+            custom_id=f"coup:{game_id}:{version}:target:{action}",
+            placeholder=f"Choose a target for {ACTIONS[action].name}...",
+            options=[discord.SelectOption(label=name, value=str(seat)) for name, seat in targets],
+        ))
+        self.game_id = game_id
+        self.version = version
+        self.action = ACTIONS[action]
+
+    @classmethod
+    async def from_custom_id(cls, interaction, item, match):
+        targets = [(o.label, int(o.value)) for o in item.options]
+        return cls(int(match["game"]), int(match["version"]), int(match["action"]), targets)
+
+    async def callback(self, interaction: discord.Interaction):
+        game = await resolve(interaction, self.game_id, self.version)
+        if game is None:
             return
-        
+
         # Validate User
-        user = interaction.user
-        if user.id != game.current_player.id:
+        if interaction.user.id != game.current_player.id:
             await interaction.response.send_message("It is not your turn!", ephemeral=True)
             return
 
-        # Acquire lock
-        if not lock.acquire():
-            return
-        
-        # Set Result
-        target_id = int(select.values[0])
-        target_player = game.get_player_by_id(target_id)
-
-        # Disable Select
-        select.disabled = True
-        await interaction.message.edit(view=view)
-
-        game.current_action.target = target_player
-
-        await game.send_update_msg(
-            f"{game.get_player_by_id(user.id).name} is attempting {game.current_action.name} on {target_player.name} (<@{target_id}>)!"
-        )
+        await dispatch(interaction, game, self.version, self.handle, interaction, game)
 
-        await game.target_selected()
+    async def handle(self, interaction: discord.Interaction, game):
+        target_player = game.seat_player(int(self.item.values[0]))
 
-        # Release lock
-        lock.release()
+        await game.target_selected(self.action, target_player)
+        return disable(interaction)
 
-    select.callback = callback
-    return select
 
+class InfluenceSelect(DynamicItem[Select], template=r"coup:(?P<game>\d+):(?P<version>\d+):card:(?P<mode>\w+):(?P<seat>\d+)"):
+    KINDS = {"lose": LOSE, "return": RETURN, "examine": REVEAL}
 
-def create_influence_select(player, future):
-    cards = [card for card in player.hand]
-    options = [
-        discord.SelectOption(label=card, value=f"{card}_{i}")
-        for i, card in enumerate(cards)
-    ]
-    select = Select(placeholder="Choose role to lose...", options=options)
+    def __init__(self, game_id: int, version: int, mode: str, seat: int, cards: list[str]):
+        super().__init__(Select(
+            custom_id=f"coup:{game_id}:{version}:card:{mode}:{seat}",
+            placeholder="Choose a role...",
+            options=[discord.SelectOption(label=card, value=f"{card}_{i}") for i, card in enumerate(cards)],
+        ))
+        self.game_id = game_id
+        self.version = version
+        self.mode = mode
+        self.seat = seat
 
-    lock = InteractionLock()
+    @classmethod
+    async def from_custom_id(cls, interaction, item, match):
+        cards = [o.label for o in item.options]
+        return cls(int(match["game"]), int(match["version"]), match["mode"], int(match["seat"]), cards)
 
-    async def callback(interaction: discord.Interaction):
-        # Check lock
-        if lock.is_processing():
+    async def callback(self, interaction: discord.Interaction):
+        game = await resolve(interaction, self.game_id, self.version)
+        if game is None:
             return
-        
-        # Acquire lock
-        if not lock.acquire():
-            return
-
-        # Extract card name and set result
-        selected_value = select.values[0]
-        card_name = selected_value.rsplit("_", 1)[0]
-        future.set_result(card_name)
-
-        # Disable Select
-        select.disabled = True
-        await interaction.response.edit_message(view=select.view)
-
-        # Release lock
-        lock.release()
-
-    select.callback = callback
-    return select
-
-
-def choose_captain_inquisitor_select(player, future):
-    options = [discord.SelectOption(label=card, value=card) for card in ["Captain", "Inquisitor"]]
-    select = Select(placeholder="Choose role to block with...", options=options)
-
-    lock = InteractionLock()
-
-    async def callback(interaction: discord.Interaction):
-        # Check lock
-        if lock.is_processing():
+        await dispatch(interaction, game, self.version, self.handle, interaction, game)
+
+    async def handle(self, interaction: discord.Interaction, game):
+        # Extract card name
+        card_name = self.item.values[0].rsplit("_", 1)[0]
+
+        # Submit choice, then disable the select
+        await game.submit(Move(self.KINDS[self.mode], self.seat, card=card_name))
+        return disable(interaction)
+
+
+class BlockRoleSelect(DynamicItem[Select], template=r"coup:(?P<game>\d+):(?P<version>\d+):blockrole:(?P<seat>\d+)"):
+    def __init__(self, game_id: int, version: int, seat: int, roles: list[str]):
+        super().__init__(Select(
+            custom_id=f"coup:{game_id}:{version}:blockrole:{seat}",
+            placeholder="Choose role to block with...",
+            options=[discord.SelectOption(label=role, value=role) for role in roles],
+        ))
+        self.game_id = game_id
+        self.version = version
+        self.seat = seat
+
+    @classmethod
+    async def from_custom_id(cls, interaction, item, match):
+        roles = [o.value for o in item.options]
+        return cls(int(match["game"]), int(match["version"]), int(match["seat"]), roles)
+
+    async def callback(self, interaction: discord.Interaction):
+        game = await resolve(interaction, self.game_id, self.version)
+        if game is None:
             return
 
         # Validate User
-        if interaction.user.id != player.id:
+        if game.seat_of(interaction.user.id) != self.seat:
             await interaction.response.send_message("Not Your Choice!", ephemeral = True)
             return
-        
-        # Acquire lock
-        if not lock.acquire():
-            return
 
-        # Set result
-        future.set_result(select.values[0])
+        await dispatch(interaction, game, self.version, self.handle, interaction, game)
 
-        # Disable the Select to Show Choice Made
-        select.disabled = True
-        await interaction.response.send_message(view=select.view)
+    async def handle(self, interaction: discord.Interaction, game):
+        # Buffer the block in the response window, then disable the select to show the choice made
+        await game.react(self.seat, Move(BLOCK, self.seat, card=self.item.values[0]))
+        return disable(interaction)
 
-        # Release Lock
-        lock.release()
 
-    select.callback = callback
-    return select
+class SwapSelect(DynamicItem[Select], template=r"coup:(?P<game>\d+):(?P<version>\d+):swap"):
+    def __init__(self, game_id: int, version: int):
+        super().__init__(Select(
+            custom_id=f"coup:{game_id}:{version}:swap",
+            placeholder="Swap or Keep Examined Role?",
+            options=[discord.SelectOption(label=option, value=option) for option in ["swap", "keep"]],
+        ))
+        self.game_id = game_id
+        self.version = version
 
+    @classmethod
+    async def from_custom_id(cls, interaction, item, match):
+        return cls(int(match["game"]), int(match["version"]))
 
-def create_swap_select(player, future):
-    #TODO: Add intearaction lock
-    options = [discord.SelectOption(label=option, value=option) for option in ["swap", "keep"]]
-    select = Select(placeholder="Swap or Keep Examined Role?", options=options)
+    async def callback(self, interaction: discord.Interaction):
+        game = await resolve(interaction, self.game_id, self.version)
+        if game is None:
+            return
 
-    async def callback(interaction: discord.Interaction):
-        if interaction.user.id != player.id:
+        if interaction.user.id != game.current_player.id:
             await interaction.response.send_message("You are not the player examining!", ephemeral=True)
             return
 
-        if select.values[0] == 'swap':
-            future.set_result(True)
-        else:
-            future.set_result(False)
+        await dispatch(interaction, game, self.version, self.handle, interaction, game)
 
-        select.disabled = True
-        await interaction.response.send_message(view=select.view)
-        
-    select.callback = callback
-    return select
+    async def handle(self, interaction: discord.Interaction, game):
+        kind = SWAP if self.item.values[0] == 'swap' else KEEP
+        await game.submit(Move(kind, game.state.turn))
+        return disable(interaction)
 
 # -----------------------
 # Buttons
 # -----------------------
 
-def create_block_button(game):
+class BlockButton(DynamicItem[Button], template=r"coup:(?P<game>\d+):(?P<version>\d+):block"):
     """Generic Block Button"""
-    button = Button(label="Block", style=discord.ButtonStyle.danger)
-
-    lock = InteractionLock()
-
-    async def callback(interaction: discord.Interaction):
-        # Check lock
-        if lock.is_processing():
+    def __init__(self, game_id: int, version: int):
+        super().__init__(Button(
+            label="Block", style=discord.ButtonStyle.danger, custom_id=f"coup:{game_id}:{version}:block"
+        ))
+        self.game_id = game_id
+        self.version = version
+
+    @classmethod
+    async def from_custom_id(cls, interaction, item, match):
+        return cls(int(match["game"]), int(match["version"]))
+
+    async def callback(self, interaction: discord.Interaction):
+        game = await resolve(interaction, self.game_id, self.version)
+        if game is None:
             return
-        
+
         # Validate User
         user = interaction.user
-        action: Action = game.current_action
+        roles = [m.card for m in game.moves_for(user.id) if m.kind == BLOCK]
 
-        if user.id == action.actor.id or user.id not in game.get_turn_order_ids():
+        if not roles:
             await interaction.response.send_message("You cannot block!", ephemeral=True)
             return
-        
-        # Acquire Lock
-        if not lock.acquire():
+        if await already_reacted(interaction, game):
             return
 
-        # Update Action
-        action.blocked = True
-        action.blocker = game.get_player_by_id(user.id)
-
-        # If Action is Steal, Choose to block as Captain or Inquisitor
-        if action.name == "Steal":
-            future = asyncio.get_event_loop().create_future()
-
-            view = View(timeout=None)
-            view.add_item(choose_captain_inquisitor_select(action.blocker, future))
-
+        # If the action can be blocked by several roles (Steal), choose which to block as
+        if len(roles) > 1:
             await interaction.response.send_message(
                 content="Choose how to block:",
-                view=view,
+                view=create_block_role_view(game, game.get_player_by_id(user.id), roles),
                 ephemeral=True
             )
-            # Await Response
-            action.blocking_role = await future
-        
-        # Otherwise, map action blocked to role (only one choice)
+        # Otherwise, block as the only role that can
         else:
-            mapping = {"Collect Foreign Aid": "Duke", "Assassinate": "Contessa"}
-            action.blocking_role = mapping[action.name]
-        
-        # Send an update message
-        game.send_update_msg(f"{action.blocker.name} is blocking {action.name} as {action.blocking_role}.")
+            await dispatch(interaction, game, self.version, self.handle, interaction, game, roles[0])
 
-        # Give chance to challenge
-        await game.send_response_message()
-
-        # Release lock
-        lock.release()
-    
-    button.callback = callback
-    return button
+    async def handle(self, interaction: discord.Interaction, game, role: str):
+        return await react(interaction, game, Move(BLOCK, game.seat_of(interaction.user.id), card=role), f"Block as {role}")
 
 
-def create_challenge_button(game):
-    button = Button(label="Challenge", style=discord.ButtonStyle.danger)
+class ChallengeButton(DynamicItem[Button], template=r"coup:(?P<game>\d+):(?P<version>\d+):challenge"):
+    def __init__(self, game_id: int, version: int):
+        super().__init__(Button(
+            label="Challenge", style=discord.ButtonStyle.danger, custom_id=f"coup:{game_id}:{version}:challenge"
+        ))
+        self.game_id = game_id
+        self.version = version
 
-    lock = InteractionLock()
+    @classmethod
+    async def from_custom_id(cls, interaction, item, match):
+        return cls(int(match["game"]), int(match["version"]))
 
-    async def callback(interaction: discord.Interaction):
-        # Check lock
-        if lock.is_processing():
+    async def callback(self, interaction: discord.Interaction):
+        game = await resolve(interaction, self.game_id, self.version)
+        if game is None:
             return
-        
+
         # Validate User
-        user = interaction.user
-        action: Action = game.current_action
-
-        if action.blocked:
-            # Challenging the block
-            if user.id == action.blocker.id or user.id not in game.get_player_ids():
-                await interaction.response.send_message(
-                    "You cannot challenge this block!", 
-                    ephemeral=True
-                )
-                return
-        else:
-            # Challenging the Action
-            if user.id not in game.get_turn_order_ids() or user.id == action.actor.id:
-                await interaction.response.send_message(
-                    "You cannot challenge this action!", 
-                    ephemeral=True
-                )
-                return
-            
-        # Acquire lock
-        if not lock.acquire():
+        move = Move(CHALLENGE, game.seat_of(interaction.user.id))
+
+        if not game.can_move(move):
+            if game.current_action and game.current_action.blocked:
+                content = "You cannot challenge this block!"
+            else:
+                content = "You cannot challenge this action!"
+            await interaction.response.send_message(content, ephemeral=True)
+            return
+        if await already_reacted(interaction, game):
             return
 
-        # Update Action object
-        action.challenged = True
-        action.challenger = game.get_player_by_id(user.id)
+        await dispatch(interaction, game, self.version, self.handle, interaction, game, move)
 
-        # Send Update Message
-        if game.current_action.blocked == False:
-            await game.send_update_msg(f"{action.challenger.name} has challenged the action!")
-        else:
-            await game.send_update_msg(f"{action.challenger.name} has challenged the role block!")
+    async def handle(self, interaction: discord.Interaction, game, move: Move):
+        return await react(interaction, game, move, "Challenge")
 
-        # Handle the Challenge
-        await game.handle_challenge()
 
-        # Release lock
-        lock.release()
+class PassButton(DynamicItem[Button], template=r"coup:(?P<game>\d+):(?P<version>\d+):pass"):
+    """Lets a player waive the response window so it can close before its timer"""
+    def __init__(self, game_id: int, version: int):
+        super().__init__(Button(
+            label="Pass", style=discord.ButtonStyle.secondary, custom_id=f"coup:{game_id}:{version}:pass"
+        ))
+        self.game_id = game_id
+        self.version = version
 
-    button.callback = callback
-    return button
+    @classmethod
+    async def from_custom_id(cls, interaction, item, match):
+        return cls(int(match["game"]), int(match["version"]))
 
+    async def callback(self, interaction: discord.Interaction):
+        game = await resolve(interaction, self.game_id, self.version)
+        if game is None:
+            return
+
+        # Validate User
+        if not game.moves_for(interaction.user.id):
+            await interaction.response.send_message("You have nothing to respond to!", ephemeral=True)
+            return
+        if await already_reacted(interaction, game):
+            return
+
+        await dispatch(interaction, game, self.version, self.handle, interaction, game)
+
+    async def handle(self, interaction: discord.Interaction, game):
+        return await react(interaction, game, None, "Pass")
 
-def create_prompt_button(target, future):
-    button = Button(label="Choose", style=discord.ButtonStyle.danger)
 
-    lock = InteractionLock()
+class PromptButton(DynamicItem[Button], template=r"coup:(?P<game>\d+):(?P<version>\d+):prompt:(?P<mode>\w+):(?P<seat>\d+)"):
+    def __init__(self, game_id: int, version: int, mode: str, seat: int):
+        super().__init__(Button(
+            label="Choose", style=discord.ButtonStyle.danger, custom_id=f"coup:{game_id}:{version}:prompt:{mode}:{seat}"
+        ))
+        self.game_id = game_id
+        self.version = version
+        self.mode = mode
+        self.seat = seat
 
-    async def callback(interaction: discord.Interaction):
-        # Check lock
-        if lock.is_processing():
-            await interaction.response.send_message("Already Handling a request", ephemeral=True)
+    @classmethod
+    async def from_custom_id(cls, interaction, item, match):
+        return cls(int(match["game"]), int(match["version"]), match["mode"], int(match["seat"]))
+
+    async def callback(self, interaction: discord.Interaction):
+        game = await resolve(interaction, self.game_id, self.version)
+        if game is None:
             return
-        
+
         # Validate User
+        target = game.seat_player(self.seat)
         if interaction.user.id != target.id:
-            await interaction.response.send_message("You are not the player losing influence!", ephemeral=True)
-            return
-        
-        # Acquire lock
-        if not lock.acquire():
-            await interaction.response.send_message("Already Handling a request", ephemeral=True)
+            await interaction.response.send_message("You are not the player choosing!", ephemeral=True)
             return
-        
+
         # Send Prompt
         try:
-            view = View(timeout=None)
-            view.add_item(create_influence_select(target, future))
             await interaction.response.send_message(
-                view=view,
-                embed=create_influence_select_embed(),
+                view=create_influence_select_view(game, target, self.mode),
+                embed=create_influence_select_embed(self.mode),
                 ephemeral=True
             )
         except Exception as e:
             logger.exception(f"Failed to send influence select message: {e}")
 
-        # Release lock
-        lock.release()
-
-    button.callback = callback
-    return button
 
+class HandButton(DynamicItem[Button], template=r"coup:(?P<game>\d+):hand"):
+    def __init__(self, game_id: int):
+        super().__init__(Button(
+            label="Check Hand", style=discord.ButtonStyle.blurple, custom_id=f"coup:{game_id}:hand"
+        ))
+        self.game_id = game_id
 
-def create_hand_button(game):
-    button = Button(label="Check Hand", style=discord.ButtonStyle.blurple)
+    @classmethod
+    async def from_custom_id(cls, interaction, item, match):
+        return cls(int(match["game"]))
 
-    async def callback(interaction: discord.Interaction):
+    async def callback(self, interaction: discord.Interaction):
+        game = await resolve(interaction, self.game_id)
+        if game is None:
+            return
         user = interaction.user
 
-        if user.id not in game.get_player_ids():
+        if not game.is_alive(user.id):
             await interaction.response.send_message(
                 "You are not in this game!", ephemeral=True
             )
@@ -517,41 +669,31 @@ def create_hand_button(game):
                 ephemeral=True
             )
 
-    button.callback = callback
-    return button
-
 
-def create_examine_button(game, role):
+class ExamineButton(DynamicItem[Button], template=r"coup:(?P<game>\d+):(?P<version>\d+):examine"):
     """Button that reveals the examined role to the player examining"""
-    button = Button(label="Examine", style=discord.ButtonStyle.blurple)
-
-    async def callback(interaction: discord.Interaction):
+    def __init__(self, game_id: int, version: int):
+        super().__init__(Button(
+            label="Examine", style=discord.ButtonStyle.blurple, custom_id=f"coup:{game_id}:{version}:examine"
+        ))
+        self.game_id = game_id
+        self.version = version
+
+    @classmethod
+    async def from_custom_id(cls, interaction, item, match):
+        return cls(int(match["game"]), int(match["version"]))
+
+    async def callback(self, interaction: discord.Interaction):
+        game = await resolve(interaction, self.game_id, self.version)
+        if game is None:
+            return
         if interaction.user.id != game.current_player.id:
             await interaction.response.send_message("You are not the Examiner!", ephemeral=True)
         else:
-            await interaction.response.send_message(f"The examined role is {role}.", ephemeral=True)
-    
-    button.callback = callback
-    return button
+            await interaction.response.send_message(f"The examined role is {game.state.examined}.", ephemeral=True)
 
-# === MISC ===
-
-async def update_response_timer(game, msg, embed, timeout):
-    """Function that updates the response embed to show time left to respond"""
-    print("entered update_response_timer func.")
-    for remaining in range(timeout, 0, -1):
-        # Edit the embed description to update countdown
-        logger.info(f"{remaining} seconds left for a response.")
-        embed.description = f"{remaining} seconds left to respond."
-
-        try:
-            await msg.edit(embed=embed)
-        except Exception as e:
-            logger.error(f"Error editing message: {e}")
-            return
-        
-        await asyncio.sleep(1)
 
-    # Time's Up
-    await game.send_update_msg("No one responded. Proceeding...") # Should delete response message
-    await game.no_response()
\ No newline at end of file
+DYNAMIC_ITEMS = (
+    ActionSelect, TargetSelect, InfluenceSelect, BlockRoleSelect, SwapSelect,
+    BlockButton, ChallengeButton, PassButton, PromptButton, HandButton, ExamineButton,
+)
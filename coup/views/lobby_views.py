@@ -11,16 +11,32 @@ def create_lobby_view(lobby, ctx):
     view.add_item(join_bt(lobby, ctx))
     view.add_item(leave_bt(lobby, ctx))
     view.add_item(start_bt(lobby, ctx))
+    view.add_item(add_bot_bt(lobby, ctx))
+    view.add_item(cancel_bt(lobby, ctx))
 
     return view
 
 
-def create_lobby_embed(players: dict):
+# Reasons a lobby stops waiting for players, shared with coup.controllers
+START = "start"
+CANCEL = "cancel"
+EMPTY = "empty"
+EXPIRED = "expired"
+
+CLOSED_STATUS = {
+    START: "The game has started!",
+    CANCEL: "The lobby was cancelled by the host.",
+    EMPTY: "The lobby closed because all players left.",
+    EXPIRED: "The lobby closed because the game was never started.",
+}
+
+def create_lobby_embed(players: dict, status: str | None = None):
     """
     Create the lobby embed showing current players in the lobby.
     
     Args:
         players: Dictionary of current players {user_id: user_name}
+        status: Reason the lobby closed, or None while it is open
     """
 
     # Convert display names into a string
@@ -42,6 +58,9 @@ def create_lobby_embed(players: dict):
         inline=False
     )
 
+    if status:
+        embed.set_footer(text=CLOSED_STATUS.get(status, status))
+
     return embed
 
 # -------------------- 
@@ -55,6 +74,14 @@ def join_bt(lobby, ctx):
     async def callback(interaction: discord.Interaction):
         user = interaction.user
 
+        # Check if lobby is still open
+        if lobby.is_closed():
+            await interaction.response.send_message(
+                "This lobby is closed.", 
+                ephemeral=True
+            )
+            return
+
         # Check if game is full
         if lobby.is_full():
             await interaction.response.send_message(
@@ -70,10 +97,19 @@ def join_bt(lobby, ctx):
                 ephemeral=True
             )
             return
+
+        # Check if already playing elsewhere
+        other = lobby.registry.lobby_of_user(user.id) if lobby.registry else None
+        if other is not None:
+            await interaction.response.send_message(
+                f"You are already in Coup game #{other.lobby_id}. Use !coupwhere to find it.",
+                ephemeral=True
+            )
+            return
         # Add player
         lobby.add_player(user)
         await interaction.response.defer()  # Acknowledge the interaction
-        await lobby.update_message(ctx)
+        lobby.request_update(ctx)
 
     button.callback = callback
     return button
@@ -102,7 +138,12 @@ def leave_bt(lobby, ctx):
         # Remove player
         lobby.remove_player(user)
         await interaction.response.defer()  # Acknowledge the interaction
-        await lobby.update_message(ctx)
+
+        # Close the lobby once everyone has left
+        if lobby.is_empty():
+            lobby.close(EMPTY)
+            return
+        lobby.request_update(ctx)
 
     button.callback = callback
     return button
@@ -120,6 +161,13 @@ def start_bt(lobby, ctx):
                 ephemeral=True
             )
             return
+
+        if lobby.is_closed():
+            await interaction.response.send_message(
+                "This lobby is closed.", 
+                ephemeral=True
+            )
+            return
         
         if not lobby.can_start():
             await interaction.response.send_message(
@@ -135,9 +183,71 @@ def start_bt(lobby, ctx):
             )
             return
 
+        await interaction.response.defer()  # Acknowledge the interaction
         lobby.create_game()
     
     button.callback = callback
     return button
 
+def add_bot_bt(lobby, ctx):
+    """Create the Add Bot button"""
+    button = Button(label="Add Bot", style=discord.ButtonStyle.blurple)
+
+    async def callback(interaction: discord.Interaction):
+        user = interaction.user
+
+        if user.id != lobby.host_id:
+            await interaction.response.send_message(
+                "Only the host can add bots.", 
+                ephemeral=True
+            )
+            return
+
+        if lobby.is_closed():
+            await interaction.response.send_message(
+                "This lobby is closed.", 
+                ephemeral=True
+            )
+            return
+
+        if not lobby.add_bot():
+            await interaction.response.send_message(
+                "The game is already full (6/6 players).", 
+                ephemeral=True
+            )
+            return
+
+        await interaction.response.defer()  # Acknowledge the interaction
+        lobby.request_update(ctx)
+
+    button.callback = callback
+    return button
+
+def cancel_bt(lobby, ctx):
+    """Create the Cancel Lobby button"""
+    button = Button(label="Cancel", style=discord.ButtonStyle.secondary)
+
+    async def callback(interaction: discord.Interaction):
+        user = interaction.user
+
+        if user.id != lobby.host_id:
+            await interaction.response.send_message(
+                "Only the host can cancel the lobby.", 
+                ephemeral=True
+            )
+            return
+
+        if lobby.is_closed():
+            await interaction.response.send_message(
+                "This lobby is already closed.", 
+                ephemeral=True
+            )
+            return
+
+        await interaction.response.defer()  # Acknowledge the interaction
+        lobby.close(CANCEL)
+
+    button.callback = callback
+    return button
+
 
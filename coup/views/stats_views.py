@@ -0,0 +1,51 @@
+# stats_views.py
+import discord
+
+
+def create_stats_embed(name: str, stats: dict | None, scope: str):
+    """
+    Create the embed showing a player's aggregate stats.
+
+    Args:
+        name: Display name of the player
+        stats: Row from StatsStore.user_stats, or None if they have not played
+        scope: Where the stats were counted, e.g. the server name
+    """
+    embed = discord.Embed(title=f"Coup Stats: {name}", description=scope)
+    if not stats:
+        embed.add_field(name="Games", value="No finished games yet.", inline=False)
+        return embed
+
+    games = stats["games"]
+    embed.add_field(name="Rating", value=f"{stats['rating']:.0f}")
+    embed.add_field(name="Games", value=str(games))
+    embed.add_field(name="Win Rate", value=f"{stats['wins'] / games:.0%} ({stats['wins']} wins)")
+    embed.add_field(name="Successful Bluffs", value=str(stats["bluffs"]))
+    embed.add_field(name="Bluffs Caught", value=str(stats["bluffs_caught"]))
+    challenges = stats["challenges_won"] + stats["challenges_lost"]
+    embed.add_field(name="Challenges Won", value=f"{stats['challenges_won']}/{challenges}")
+    if stats["actions"]:
+        favourites = "\n".join(f"{action} ({count})" for action, count in stats["actions"])
+        embed.add_field(name="Favourite Actions", value=favourites, inline=False)
+    return embed
+
+
+def create_leaderboard_embed(rows: list[dict], scope: str):
+    """
+    Create the embed listing the top rated players.
+
+    Args:
+        rows: Rows from StatsStore.leaderboard, best first
+        scope: Where the ratings were counted, e.g. the server name
+    """
+    embed = discord.Embed(title="Coup Leaderboard", description=scope)
+    if not rows:
+        embed.add_field(name="Players", value="No finished games yet.", inline=False)
+        return embed
+
+    lines = [
+        f"**{rank}.** {row['name']}: {row['rating']:.0f} ({row['wins']}/{row['games']} wins)"
+        for rank, row in enumerate(rows, start=1)
+    ]
+    embed.add_field(name="Players", value="\n".join(lines), inline=False)
+    return embed
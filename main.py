@@ -31,4 +31,6 @@ async def main():
     await setup_coup(bot)
     await bot.start(os.getenv("DISCORD_BOT_TOKEN"))
 
-asyncio.run(main())
\ No newline at end of file
+# Bot search workers are started with forkserver/spawn and re-import this module: only run the bot in the parent
+if __name__ == "__main__":
+    asyncio.run(main())